@@ -30,6 +30,7 @@ Version: 1.0.0
 """
 
 import hmac
+from contextlib import asynccontextmanager
 
 from fastapi import FastAPI, Request, Response
 from fastapi.exceptions import RequestValidationError
@@ -75,6 +76,15 @@ from utils.rate_limiter import limiter, rate_limit_exceeded_handler
 # This ensures all tables are created before the application starts
 Base.metadata.create_all(bind=engine)
 
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Release shared outbound HTTP and Redis clients when the application shuts down."""
+    yield
+    await support.close_slack_client()
+    await tasks.close_task_status_redis()
+
+
 app = FastAPI(
     title="ArcanaAI API",
     description="An AI-powered tarot reading service with subscription management, "
@@ -83,6 +93,7 @@ app = FastAPI(
     docs_url="/docs",
     redoc_url="/redoc",
     openapi_url="/openapi.json",
+    lifespan=lifespan,
 )
 
 
@@ -177,7 +188,7 @@ app.add_middleware(
         "sec-ch-ua-mobile",
         "sec-ch-ua-platform",
     ],
-    expose_headers=["X-Access-Token", "Access-Control-Expose-Headers"],
+    expose_headers=["X-Access-Token", "X-Total-Count", "X-Next-Cursor", "Access-Control-Expose-Headers"],
 )
 
 # Register exception handlers
@@ -39,7 +39,7 @@ celery_app = Celery(
     broker=os.getenv("CELERY_BROKER_URL", "redis://localhost:6379/0"),
     backend=os.getenv("CELERY_RESULT_BACKEND", "redis://localhost:6379/0"),
     include=["tasks.email_tasks", "tasks.notification_tasks", "tasks.journal_tasks", "tasks.web_push_tasks",
-             "tasks.dead_letter"],
+             "tasks.payment_tasks", "tasks.dead_letter"],
 )
 
 # Celery configuration
@@ -56,25 +56,42 @@ celery_app.conf.update(
     task_reject_on_worker_lost=True,
     worker_prefetch_multiplier=1,
     worker_max_tasks_per_child=1000,
-    # Task routing
+    # Task routing. Tasks are registered under explicit names, so routes match those names
+    # rather than module paths; each workload gets its own queue so a burst of emails cannot
+    # hold up reminders or maintenance.
     task_routes={
-        "tasks.email_tasks.*": {"queue": "email"},
-        "tasks.notification_tasks.*": {"queue": "notifications"},
-        "tasks.web_push_tasks.*": {"queue": "notifications"},
-        "tasks.dead_letter.*": {"queue": "dead_letter"},
+        "send_password_reset_email": {"queue": "email"},
+        "send_password_changed_email": {"queue": "email"},
+        "send_welcome_email": {"queue": "email"},
+        "send_reminder_email": {"queue": "email"},
+        "send_system_notification_email": {"queue": "email"},
+        "send_bulk_notification_email": {"queue": "email"},
+        "send_reading_reminder": {"queue": "notifications"},
+        "process_daily_reminders": {"queue": "notifications"},
+        "send_system_notification": {"queue": "notifications"},
+        "process_due_reading_reminders": {"queue": "notifications"},
+        "cleanup_old_tasks": {"queue": "maintenance"},
+        "reset_monthly_free_turns": {"queue": "maintenance"},
+        "replay_pending_webhooks": {"queue": "maintenance"},
+        "log_failed_task": {"queue": "dead_letter"},
     },
     # Task retry configuration
     task_default_retry_delay=60,  # 1 minute
     task_max_retries=3,
     # Task discovery
     imports=("tasks.email_tasks", "tasks.notification_tasks", "tasks.journal_tasks", "tasks.web_push_tasks",
-             "tasks.dead_letter"),
+             "tasks.payment_tasks", "tasks.dead_letter"),
     # Periodic task schedule
     beat_schedule={
         "reset-monthly-free-turns": {
             "task": "reset_monthly_free_turns",
             "schedule": crontab(hour=0, minute=1, day_of_month=1),  # 1st of every month at 00:01 UTC
-            "options": {"queue": "notifications"},
+            "options": {"queue": "maintenance"},
+        },
+        "replay-pending-webhooks": {
+            "task": "replay_pending_webhooks",
+            "schedule": crontab(minute="*/10"),  # Every 10 minutes
+            "options": {"queue": "maintenance"},
         },
         "process-due-reading-reminders": {
             "task": "process_due_reading_reminders",
@@ -177,9 +177,17 @@ class Settings(BaseSettings):
     # Frontend URL for password reset links
     FRONTEND_URL: str = os.getenv("FRONTEND_URL", "http://localhost:3000")
 
+    # Public base URL for shared reading links; empty falls back to the request's base URL
+    SHARING_BASE_URL: str = os.getenv("SHARING_BASE_URL", "").rstrip("/")
+
     # Debug Settings
     DEBUG_SQL: bool = os.getenv("DEBUG_SQL", "False").lower() == "true"
 
+    # Database pool, per worker process: each uvicorn/Celery worker opens up to
+    # DB_POOL_SIZE + DB_MAX_OVERFLOW PostgreSQL connections
+    DB_POOL_SIZE: int = int(os.getenv("DB_POOL_SIZE", "20"))
+    DB_MAX_OVERFLOW: int = int(os.getenv("DB_MAX_OVERFLOW", "30"))
+
     # Lemon Squeezy Settings
     LEMON_SQUEEZY_API_KEY: str = os.getenv("LEMON_SQUEEZY_API_KEY", "")
     LEMON_SQUEEZY_STORE_ID: str = os.getenv("LEMON_SQUEEZY_STORE_ID", "")
@@ -62,8 +62,9 @@ if is_postgres:
     # Production PostgreSQL settings
     pool_settings = {
         "pool_pre_ping": True,  # Enable connection health checks
-        "pool_size": 20,  # Increased pool size for production
-        "max_overflow": 30,  # Allow more overflow connections
+        # Sized per worker process; workers x (pool_size + max_overflow) must fit max_connections
+        "pool_size": settings.DB_POOL_SIZE,
+        "max_overflow": settings.DB_MAX_OVERFLOW,
         "pool_timeout": 30,  # Connection timeout in seconds
         "pool_recycle": 1800,  # Recycle connections after 30 minutes
         "pool_use_lifo": True,  # Use LIFO for better connection reuse
@@ -0,0 +1,33 @@
+"""add trigram index on chat_sessions.title
+
+Revision ID: 20261016_chat_title_trgm
+Revises: 20260723_reset_token_hash
+Create Date: 2026-10-16 00:00:00.000000
+
+GET /chat/search filters with ``title ILIKE '%q%'``. A leading-wildcard
+pattern cannot use a B-tree index, so every search was a sequential scan over
+all chat sessions. A ``pg_trgm`` GIN index serves ILIKE substring matches
+directly. PostgreSQL only; SQLite keeps the plain scan.
+"""
+
+from alembic import op
+
+revision = "20261016_chat_title_trgm"
+down_revision = "20260723_reset_token_hash"
+branch_labels = None
+depends_on = None
+
+INDEX_NAME = "ix_chat_sessions_title_trgm"
+
+
+def upgrade() -> None:
+    if op.get_bind().dialect.name != "postgresql":
+        return
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    op.execute(f"CREATE INDEX IF NOT EXISTS {INDEX_NAME} ON chat_sessions USING gin (title gin_trgm_ops)")
+
+
+def downgrade() -> None:
+    if op.get_bind().dialect.name != "postgresql":
+        return
+    op.execute(f"DROP INDEX IF EXISTS {INDEX_NAME}")
@@ -0,0 +1,61 @@
+"""add composite journal indexes and jsonb tags
+
+Revision ID: 20261016_journal_indexes
+Revises: 20261016_chat_title_trgm
+Create Date: 2026-10-16 01:00:00.000000
+
+Journal list and analytics queries always filter by ``user_id`` and then by
+``created_at``, ``is_favorite`` or ``follow_up_date``; card meanings are looked
+up by ``(user_id, card_id)``. Only single-column indexes existed, so each
+query picked one and filtered the rest row by row. These composite indexes
+serve both predicates from one index.
+
+On PostgreSQL ``tags`` also moves from ``json`` to ``jsonb`` with a GIN index,
+so tag filters become ``tags @> '["tag"]'`` index probes instead of a text
+scan of every entry. SQLite keeps its JSON text column.
+"""
+
+from alembic import op
+from sqlalchemy import inspect as sa_inspect
+
+revision = "20261016_journal_indexes"
+down_revision = "20261016_chat_title_trgm"
+branch_labels = None
+depends_on = None
+
+COMPOSITE_INDEXES = (
+    ("ix_user_reading_journal_user_id_created_at", "user_reading_journal", ["user_id", "created_at"]),
+    ("ix_user_reading_journal_user_id_is_favorite", "user_reading_journal", ["user_id", "is_favorite"]),
+    ("ix_user_reading_journal_user_id_follow_up_date", "user_reading_journal", ["user_id", "follow_up_date"]),
+    ("ix_user_card_meanings_user_id_card_id", "user_card_meanings", ["user_id", "card_id"]),
+)
+TAGS_INDEX_NAME = "ix_user_reading_journal_tags_gin"
+
+
+def _existing_indexes(inspector, table_name: str) -> set[str]:
+    return {idx["name"] for idx in inspector.get_indexes(table_name)}
+
+
+def upgrade() -> None:
+    bind = op.get_bind()
+    inspector = sa_inspect(bind)
+    for index_name, table_name, columns in COMPOSITE_INDEXES:
+        if index_name not in _existing_indexes(inspector, table_name):
+            op.create_index(index_name, table_name, columns, unique=False)
+
+    if bind.dialect.name != "postgresql":
+        return
+    op.execute("ALTER TABLE user_reading_journal ALTER COLUMN tags TYPE jsonb USING tags::jsonb")
+    op.execute(f"CREATE INDEX IF NOT EXISTS {TAGS_INDEX_NAME} ON user_reading_journal USING gin (tags)")
+
+
+def downgrade() -> None:
+    bind = op.get_bind()
+    if bind.dialect.name == "postgresql":
+        op.execute(f"DROP INDEX IF EXISTS {TAGS_INDEX_NAME}")
+        op.execute("ALTER TABLE user_reading_journal ALTER COLUMN tags TYPE json USING tags::json")
+
+    inspector = sa_inspect(bind)
+    for index_name, table_name, _columns in COMPOSITE_INDEXES:
+        if index_name in _existing_indexes(inspector, table_name):
+            op.drop_index(index_name, table_name=table_name)
@@ -0,0 +1,36 @@
+"""add full-text index on journal personal notes
+
+Revision ID: 20261016_journal_notes_fts
+Revises: 20261016_journal_indexes
+Create Date: 2026-10-16 02:00:00.000000
+
+GET /journal/entries?search_notes= filtered with ``personal_notes ILIKE
+'%q%'``, which scans every entry. On PostgreSQL the endpoint now matches
+``to_tsvector('simple', personal_notes)`` against a prefix ``tsquery``; this
+GIN expression index serves that predicate. The expression must stay in sync
+with ``_NOTES_TSVECTOR`` in ``routers/journal.py``. SQLite keeps the ILIKE scan.
+"""
+
+from alembic import op
+
+revision = "20261016_journal_notes_fts"
+down_revision = "20261016_journal_indexes"
+branch_labels = None
+depends_on = None
+
+INDEX_NAME = "ix_user_reading_journal_notes_fts"
+
+
+def upgrade() -> None:
+    if op.get_bind().dialect.name != "postgresql":
+        return
+    op.execute(
+        f"CREATE INDEX IF NOT EXISTS {INDEX_NAME} ON user_reading_journal "
+        "USING gin (to_tsvector('simple'::regconfig, coalesce(personal_notes, ''::text)))"
+    )
+
+
+def downgrade() -> None:
+    if op.get_bind().dialect.name != "postgresql":
+        return
+    op.execute(f"DROP INDEX IF EXISTS {INDEX_NAME}")
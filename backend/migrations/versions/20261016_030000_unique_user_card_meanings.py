@@ -0,0 +1,46 @@
+"""make (user_id, card_id) unique on user_card_meanings
+
+Revision ID: 20261016_card_meaning_unique
+Revises: 20261016_journal_notes_fts
+Create Date: 2026-10-16 03:00:00.000000
+
+POST /journal/card-meanings used to SELECT the user's meaning for a card and
+then INSERT or UPDATE, leaving a window in which two requests could both
+insert. It now issues a single ``INSERT ... ON CONFLICT (user_id, card_id) DO
+UPDATE``, which needs a unique index as its conflict target. Duplicate rows
+that may already exist are collapsed to the most recent one first.
+"""
+
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy import inspect as sa_inspect
+
+revision = "20261016_card_meaning_unique"
+down_revision = "20261016_journal_notes_fts"
+branch_labels = None
+depends_on = None
+
+INDEX_NAME = "ix_user_card_meanings_user_id_card_id"
+TABLE_NAME = "user_card_meanings"
+
+
+def _drop_index_if_exists() -> None:
+    existing = {idx["name"] for idx in sa_inspect(op.get_bind()).get_indexes(TABLE_NAME)}
+    if INDEX_NAME in existing:
+        op.drop_index(INDEX_NAME, table_name=TABLE_NAME)
+
+
+def upgrade() -> None:
+    op.execute(
+        sa.text(
+            f"DELETE FROM {TABLE_NAME} WHERE id NOT IN "
+            f"(SELECT MAX(id) FROM {TABLE_NAME} GROUP BY user_id, card_id)"
+        )
+    )
+    _drop_index_if_exists()
+    op.create_index(INDEX_NAME, TABLE_NAME, ["user_id", "card_id"], unique=True)
+
+
+def downgrade() -> None:
+    _drop_index_if_exists()
+    op.create_index(INDEX_NAME, TABLE_NAME, ["user_id", "card_id"], unique=False)
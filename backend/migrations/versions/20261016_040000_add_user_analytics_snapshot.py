@@ -0,0 +1,42 @@
+"""add user_analytics_snapshot table
+
+Revision ID: 20261016_analytics_snapshot
+Revises: 20261016_card_meaning_unique
+Create Date: 2026-10-16 04:00:00.000000
+
+Holds one precomputed journal analytics summary per user. Journal writes
+refresh it in a background task, so GET /journal/analytics/summary is a
+primary-key lookup instead of an aggregation over the user's journal.
+"""
+
+import sqlalchemy as sa
+from alembic import op
+
+revision = "20261016_analytics_snapshot"
+down_revision = "20261016_card_meaning_unique"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "user_analytics_snapshot",
+        sa.Column("user_id", sa.Integer(), nullable=False),
+        sa.Column("payload", sa.Text(), nullable=False),
+        sa.Column("updated_at", sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=False),
+        sa.ForeignKeyConstraint(["user_id"], ["users.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("user_id"),
+    )
+    # Newly created public tables must have RLS enabled by default.
+    if op.get_bind().dialect.name != "sqlite":
+        op.execute("ALTER TABLE user_analytics_snapshot ENABLE ROW LEVEL SECURITY")
+        op.execute(
+            "CREATE POLICY user_analytics_snapshot_service_access ON user_analytics_snapshot "
+            "USING (true) WITH CHECK (true)"
+        )
+
+
+def downgrade() -> None:
+    if op.get_bind().dialect.name != "sqlite":
+        op.execute("DROP POLICY IF EXISTS user_analytics_snapshot_service_access ON user_analytics_snapshot")
+    op.drop_table("user_analytics_snapshot")
@@ -0,0 +1,33 @@
+"""add partial index for active card meanings ordered by usage
+
+Revision ID: 20261016_card_meaning_usage
+Revises: 20261016_analytics_snapshot
+Create Date: 2026-10-16 05:00:00.000000
+
+GET /journal/card-meanings lists a user's active meanings ordered by
+``usage_count DESC`` with OFFSET/LIMIT. A partial index on
+``(user_id, usage_count DESC) WHERE is_active`` turns that into an index
+range scan instead of sorting every meaning. The predicate matches the
+query's ``is_active IS true`` so both PostgreSQL and SQLite can use it.
+"""
+
+from alembic import op
+
+revision = "20261016_card_meaning_usage"
+down_revision = "20261016_analytics_snapshot"
+branch_labels = None
+depends_on = None
+
+INDEX_NAME = "ix_user_card_meanings_active_usage"
+
+
+def upgrade() -> None:
+    true_literal = "1" if op.get_bind().dialect.name == "sqlite" else "true"
+    op.execute(
+        f"CREATE INDEX IF NOT EXISTS {INDEX_NAME} ON user_card_meanings "
+        f"(user_id, usage_count DESC) WHERE is_active IS {true_literal}"
+    )
+
+
+def downgrade() -> None:
+    op.execute(f"DROP INDEX IF EXISTS {INDEX_NAME}")
@@ -0,0 +1,28 @@
+"""add (user_id, view_count DESC) index on shared_readings
+
+Revision ID: 20261016_shared_view_count
+Revises: 20261016_card_meaning_usage
+Create Date: 2026-10-16 06:00:00.000000
+
+GET /sharing/user/stats now fetches the user's most viewed reading with the
+share count and view total as window aggregates in a single query. Ordering
+by ``view_count DESC`` within one user is served by this index instead of a
+sort over all of the user's shared readings.
+"""
+
+from alembic import op
+
+revision = "20261016_shared_view_count"
+down_revision = "20261016_card_meaning_usage"
+branch_labels = None
+depends_on = None
+
+INDEX_NAME = "ix_shared_readings_user_id_view_count"
+
+
+def upgrade() -> None:
+    op.execute(f"CREATE INDEX IF NOT EXISTS {INDEX_NAME} ON shared_readings (user_id, view_count DESC)")
+
+
+def downgrade() -> None:
+    op.execute(f"DROP INDEX IF EXISTS {INDEX_NAME}")
@@ -0,0 +1,47 @@
+"""add covering index for shared reading lists and (user_id, reminder_date)
+
+Revision ID: 20261016_list_indexes
+Revises: 20261016_shared_view_count
+Create Date: 2026-10-16 07:00:00.000000
+
+GET /sharing/user/readings filters on ``user_id``, orders by
+``created_at DESC`` and returns only uuid, title, view_count and is_public.
+On PostgreSQL those columns ride along in the index via ``INCLUDE``, so the
+list is an index-only scan that never touches the heap. GET
+/journal/reminders filters on ``user_id`` and orders by ``reminder_date``;
+its rows join journal entries, so it only gets a composite index.
+
+PostgreSQL builds both indexes ``CONCURRENTLY`` outside the migration
+transaction so writes to either table are not blocked while they build.
+"""
+
+from alembic import op
+
+revision = "20261016_list_indexes"
+down_revision = "20261016_shared_view_count"
+branch_labels = None
+depends_on = None
+
+SHARED_INDEX = "ix_shared_readings_user_id_created_at"
+REMINDER_INDEX = "ix_reading_reminders_user_id_reminder_date"
+
+
+def upgrade() -> None:
+    if op.get_bind().dialect.name == "sqlite":
+        op.execute(f"CREATE INDEX IF NOT EXISTS {SHARED_INDEX} ON shared_readings (user_id, created_at DESC)")
+        op.execute(f"CREATE INDEX IF NOT EXISTS {REMINDER_INDEX} ON reading_reminders (user_id, reminder_date)")
+        return
+
+    with op.get_context().autocommit_block():
+        op.execute(
+            f"CREATE INDEX CONCURRENTLY IF NOT EXISTS {SHARED_INDEX} ON shared_readings "
+            "(user_id, created_at DESC) INCLUDE (uuid, title, view_count, is_public)"
+        )
+        op.execute(
+            f"CREATE INDEX CONCURRENTLY IF NOT EXISTS {REMINDER_INDEX} ON reading_reminders (user_id, reminder_date)"
+        )
+
+
+def downgrade() -> None:
+    op.execute(f"DROP INDEX IF EXISTS {REMINDER_INDEX}")
+    op.execute(f"DROP INDEX IF EXISTS {SHARED_INDEX}")
@@ -0,0 +1,34 @@
+"""add creator_username to shared_readings
+
+Revision ID: 20261016_shared_creator
+Revises: 20261016_list_indexes
+Create Date: 2026-10-16 08:00:00.000000
+
+Public shared reading views only need the creator's username from ``users``.
+Copying it onto the reading at creation turns the view into a single-row
+lookup by uuid with no join. Existing rows are backfilled from ``users``;
+the admin user update keeps the copy in sync when a username changes.
+"""
+
+import sqlalchemy as sa
+from alembic import op
+
+revision = "20261016_shared_creator"
+down_revision = "20261016_list_indexes"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        "shared_readings",
+        sa.Column("creator_username", sa.String(), nullable=False, server_default=""),
+    )
+    op.execute(
+        "UPDATE shared_readings SET creator_username = COALESCE("
+        "(SELECT users.username FROM users WHERE users.id = shared_readings.user_id), '')"
+    )
+
+
+def downgrade() -> None:
+    op.drop_column("shared_readings", "creator_username")
@@ -0,0 +1,44 @@
+"""add (user_id, created_at DESC) indexes for the subscription history lists
+
+Revision ID: 20261016_history_indexes
+Revises: 20261016_shared_creator
+Create Date: 2026-10-16 09:00:00.000000
+
+The subscription events, payment transactions and turn usage history
+endpoints all filter on ``user_id`` and page through the rows newest first.
+With only single-column indexes the database collects every row for the
+user and sorts them before applying LIMIT/OFFSET; a composite index ordered
+the same way turns each page into a bounded index range scan.
+
+PostgreSQL builds the indexes ``CONCURRENTLY`` outside the migration
+transaction so payment and usage writes are not blocked while they build.
+"""
+
+from alembic import op
+
+revision = "20261016_history_indexes"
+down_revision = "20261016_shared_creator"
+branch_labels = None
+depends_on = None
+
+INDEXES = (
+    ("ix_subscription_events_user_id_created_at", "subscription_events", "user_id, created_at DESC"),
+    ("ix_payment_transactions_user_id_created_at", "payment_transactions", "user_id, created_at DESC"),
+    ("ix_turn_usage_history_user_id_consumed_at", "turn_usage_history", "user_id, consumed_at DESC"),
+)
+
+
+def upgrade() -> None:
+    if op.get_bind().dialect.name == "sqlite":
+        for name, table, columns in INDEXES:
+            op.execute(f"CREATE INDEX IF NOT EXISTS {name} ON {table} ({columns})")
+        return
+
+    with op.get_context().autocommit_block():
+        for name, table, columns in INDEXES:
+            op.execute(f"CREATE INDEX CONCURRENTLY IF NOT EXISTS {name} ON {table} ({columns})")
+
+
+def downgrade() -> None:
+    for name, _, _ in reversed(INDEXES):
+        op.execute(f"DROP INDEX IF EXISTS {name}")
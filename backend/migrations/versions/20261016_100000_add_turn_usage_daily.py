@@ -0,0 +1,50 @@
+"""add turn_usage_daily rollup table
+
+Revision ID: 20261016_turn_usage_daily
+Revises: 20261016_history_indexes
+Create Date: 2026-10-16 10:00:00.000000
+
+Holds one row per user, UTC day and usage context with the number of turns
+consumed. Logging a turn upserts into it, so the subscription history
+summary sums a few rows per day instead of counting every consumed turn in
+the period. Existing usage history is rolled up on upgrade.
+"""
+
+import sqlalchemy as sa
+from alembic import op
+
+revision = "20261016_turn_usage_daily"
+down_revision = "20261016_history_indexes"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "turn_usage_daily",
+        sa.Column("user_id", sa.Integer(), nullable=False),
+        sa.Column("day", sa.Date(), nullable=False),
+        sa.Column("usage_context", sa.String(), nullable=False),
+        sa.Column("uses", sa.Integer(), nullable=False),
+        sa.ForeignKeyConstraint(["user_id"], ["users.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("user_id", "day", "usage_context"),
+    )
+
+    is_sqlite = op.get_bind().dialect.name == "sqlite"
+    day = "date(consumed_at)" if is_sqlite else "(consumed_at AT TIME ZONE 'UTC')::date"
+    op.execute(
+        "INSERT INTO turn_usage_daily (user_id, day, usage_context, uses) "
+        f"SELECT user_id, {day}, usage_context, COUNT(*) FROM turn_usage_history "
+        f"GROUP BY user_id, {day}, usage_context"
+    )
+
+    # Newly created public tables must have RLS enabled by default.
+    if not is_sqlite:
+        op.execute("ALTER TABLE turn_usage_daily ENABLE ROW LEVEL SECURITY")
+        op.execute("CREATE POLICY turn_usage_daily_service_access ON turn_usage_daily USING (true) WITH CHECK (true)")
+
+
+def downgrade() -> None:
+    if op.get_bind().dialect.name != "sqlite":
+        op.execute("DROP POLICY IF EXISTS turn_usage_daily_service_access ON turn_usage_daily")
+    op.drop_table("turn_usage_daily")
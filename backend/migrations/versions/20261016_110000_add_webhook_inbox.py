@@ -0,0 +1,45 @@
+"""add webhook_inbox table
+
+Revision ID: 20261016_webhook_inbox
+Revises: 20261016_turn_usage_daily
+Create Date: 2026-10-16 11:00:00.000000
+
+Verified Lemon Squeezy webhooks are stored here and acknowledged with 202
+before they are applied in a background task. The provider does not retry a
+delivery it got a 2xx for, so the stored row is what lets an event that was
+interrupted by a crash be replayed; pending rows have no ``processed_at``.
+"""
+
+import sqlalchemy as sa
+from alembic import op
+
+revision = "20261016_webhook_inbox"
+down_revision = "20261016_turn_usage_daily"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "webhook_inbox",
+        sa.Column("id", sa.Integer(), nullable=False),
+        sa.Column("provider", sa.String(), nullable=False),
+        sa.Column("event_name", sa.String(), nullable=False),
+        sa.Column("payload", sa.JSON(), nullable=False),
+        sa.Column("received_at", sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=False),
+        sa.Column("processed_at", sa.DateTime(timezone=True), nullable=True),
+        sa.Column("error", sa.Text(), nullable=True),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index(op.f("ix_webhook_inbox_id"), "webhook_inbox", ["id"], unique=False)
+    # Newly created public tables must have RLS enabled by default.
+    if op.get_bind().dialect.name != "sqlite":
+        op.execute("ALTER TABLE webhook_inbox ENABLE ROW LEVEL SECURITY")
+        op.execute("CREATE POLICY webhook_inbox_service_access ON webhook_inbox USING (true) WITH CHECK (true)")
+
+
+def downgrade() -> None:
+    if op.get_bind().dialect.name != "sqlite":
+        op.execute("DROP POLICY IF EXISTS webhook_inbox_service_access ON webhook_inbox")
+    op.drop_index(op.f("ix_webhook_inbox_id"), table_name="webhook_inbox")
+    op.drop_table("webhook_inbox")
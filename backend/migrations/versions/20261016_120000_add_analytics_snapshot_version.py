@@ -0,0 +1,33 @@
+"""add version to user_analytics_snapshot
+
+Revision ID: 20261016_snapshot_version
+Revises: 20261016_webhook_inbox
+Create Date: 2026-10-16 12:00:00.000000
+
+Journal writes bump ``version`` and clear ``payload`` in their own transaction;
+the background refresh that follows only stores its payload if the version it
+read is still current. A refresh that raced a later write therefore can no
+longer overwrite the snapshot with stale aggregates.
+"""
+
+import sqlalchemy as sa
+from alembic import op
+
+revision = "20261016_snapshot_version"
+down_revision = "20261016_webhook_inbox"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Batch mode so SQLite can relax the NOT NULL on payload
+    with op.batch_alter_table("user_analytics_snapshot") as batch_op:
+        batch_op.add_column(sa.Column("version", sa.Integer(), nullable=False, server_default="0"))
+        batch_op.alter_column("payload", existing_type=sa.Text(), nullable=True)
+
+
+def downgrade() -> None:
+    op.execute("DELETE FROM user_analytics_snapshot WHERE payload IS NULL")
+    with op.batch_alter_table("user_analytics_snapshot") as batch_op:
+        batch_op.alter_column("payload", existing_type=sa.Text(), nullable=False)
+        batch_op.drop_column("version")
@@ -17,6 +17,7 @@ from sqlalchemy import (
     Text,
     UniqueConstraint,
 )
+from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.ext.hybrid import hybrid_property
 from sqlalchemy.orm import relationship
@@ -225,7 +226,8 @@ class ChatSession(Base):
 
     __tablename__ = "chat_sessions"
     # Composite index backing the session-list query, which filters by user_id
-    # and orders by created_at DESC.
+    # and orders by created_at DESC. On PostgreSQL, /chat/search's title ILIKE is
+    # served by the pg_trgm GIN index ix_chat_sessions_title_trgm (migration only).
     __table_args__ = (Index("ix_chat_sessions_user_id_created_at", "user_id", "created_at"),)
 
     id = Column(Integer, primary_key=True, index=True)
@@ -272,6 +274,9 @@ class Message(Base):
     """
 
     __tablename__ = "messages"
+    # Fetch server-generated columns (id, created_at) with RETURNING on INSERT so
+    # the chat stream can build its response without a follow-up refresh SELECT.
+    __mapper_args__ = {"eager_defaults": True}
 
     id = Column(Integer, primary_key=True, index=True)
     content = Column(String)
@@ -584,6 +589,9 @@ class SubscriptionEvent(Base):
     # Relationships
     user = relationship("User")
 
+    # Serves the subscription history event list (user_id filter, newest first)
+    __table_args__ = (Index("ix_subscription_events_user_id_created_at", "user_id", created_at.desc()),)
+
     def get_event_data(self):
         """Get event data as a dictionary."""
         if isinstance(self.event_data, str):
@@ -646,6 +654,9 @@ class PaymentTransaction(Base):
     # Relationships
     user = relationship("User")
 
+    # Serves the payment history list (user_id filter, newest first)
+    __table_args__ = (Index("ix_payment_transactions_user_id_created_at", "user_id", created_at.desc()),)
+
     def get_metadata(self):
         """Get transaction metadata as a dictionary."""
         if isinstance(self.transaction_metadata, str):
@@ -698,6 +709,9 @@ class TurnUsageHistory(Base):
     # Relationships
     user = relationship("User")
 
+    # Serves the turn usage history list (user_id filter, newest first)
+    __table_args__ = (Index("ix_turn_usage_history_user_id_consumed_at", "user_id", consumed_at.desc()),)
+
     def get_metadata(self):
         """Get usage metadata as a dictionary."""
         if isinstance(self.usage_metadata, str):
@@ -714,6 +728,56 @@ class TurnUsageHistory(Base):
             self.usage_metadata = json.loads(data) if data else {}
 
 
+class TurnUsageDaily(Base):
+    """Daily per-context count of a user's turn usage.
+
+    Kept alongside ``TurnUsageHistory`` by `SubscriptionService.log_turn_usage`,
+    so usage summaries read a handful of rows per day instead of every
+    consumed turn.
+
+    Attributes:
+        user_id (int): Foreign key to the user.
+        day (date): UTC day the turns were consumed on.
+        usage_context (str): Context where the turns were used (reading, chat).
+        uses (int): Number of turns consumed that day in that context.
+    """
+
+    __tablename__ = "turn_usage_daily"
+
+    user_id = Column(Integer, ForeignKey("users.id", ondelete="CASCADE"), primary_key=True)
+    day = Column(Date, primary_key=True)
+    usage_context = Column(String, primary_key=True)
+    uses = Column(Integer, nullable=False, default=0)
+
+
+class WebhookInbox(Base):
+    """A verified payment webhook, stored before it is processed.
+
+    Webhooks are acknowledged as soon as they are stored and applied in a
+    background task, so a delivery the provider will not retry survives a
+    crash before processing; rows with no ``processed_at`` can be replayed.
+
+    Attributes:
+        id (int): Primary key.
+        provider (str): Payment provider that sent the webhook (lemon_squeezy).
+        event_name (str): Event name from the payload.
+        payload (JSON): The parsed webhook payload.
+        received_at (datetime): When the webhook was received.
+        processed_at (datetime): When it was applied, or None while pending.
+        error (str): Error from the last failed processing attempt.
+    """
+
+    __tablename__ = "webhook_inbox"
+
+    id = Column(Integer, primary_key=True, index=True)
+    provider = Column(String, nullable=False)
+    event_name = Column(String, nullable=False)
+    payload = Column(JSON, nullable=False)
+    received_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
+    processed_at = Column(DateTime(timezone=True), nullable=True)
+    error = Column(Text, nullable=True)
+
+
 class SubscriptionPlan(Base):
     """Represents available subscription plans and their configurations.
 
@@ -783,6 +847,7 @@ class SharedReading(Base):
         is_public (bool): Whether the reading is public.
         view_count (int): Number of times viewed.
         user_id (int): Foreign key to the user.
+        creator_username (str): Creator's username, copied at creation so public views need no join.
         user (User): The user who created the shared reading.
     """
 
@@ -800,10 +865,23 @@ class SharedReading(Base):
     is_public = Column(Boolean, default=True, index=True)
     view_count = Column(Integer, default=0)
     user_id = Column(Integer, ForeignKey("users.id"), index=True)
+    creator_username = Column(String, nullable=False, server_default="")
 
     # Relationships
     user = relationship("User", back_populates="shared_readings")
 
+    __table_args__ = (
+        # Sharing stats read a user's most viewed reading straight off this index
+        Index("ix_shared_readings_user_id_view_count", "user_id", view_count.desc()),
+        # Covers the user's reading list, so PostgreSQL answers it with an index-only scan
+        Index(
+            "ix_shared_readings_user_id_created_at",
+            "user_id",
+            created_at.desc(),
+            postgresql_include=["uuid", "title", "view_count", "is_public"],
+        ),
+    )
+
     def get_cards_data(self):
         """Parse the JSON cards data string into a list of card data.
 
@@ -856,6 +934,15 @@ class UserReadingJournal(Base):
     """
 
     __tablename__ = "user_reading_journal"
+    # Journal queries always scope by user first; PostgreSQL also has a GIN
+    # index on the jsonb tags column (ix_user_reading_journal_tags_gin, migration only).
+    __table_args__ = (
+        Index("ix_user_reading_journal_user_id_created_at", "user_id", "created_at"),
+        Index("ix_user_reading_journal_user_id_is_favorite", "user_id", "is_favorite"),
+        Index("ix_user_reading_journal_user_id_follow_up_date", "user_id", "follow_up_date"),
+    )
+    # Fetch the server-side created_at/updated_at with RETURNING at flush time
+    __mapper_args__ = {"eager_defaults": True}
 
     id = Column(Integer, primary_key=True, index=True)
     user_id = Column(Integer, ForeignKey("users.id", ondelete="CASCADE"), nullable=False, index=True)
@@ -867,7 +954,7 @@ class UserReadingJournal(Base):
     outcome_rating = Column(Integer, CheckConstraint("outcome_rating >= 1 AND outcome_rating <= 5"), nullable=True)
     follow_up_date = Column(DateTime(timezone=True), nullable=True, index=True)
     follow_up_completed = Column(Boolean, default=False)
-    tags = Column(JSON, nullable=True, default=list)
+    tags = Column(JSON().with_variant(JSONB(), "postgresql"), nullable=True, default=list)
     is_favorite = Column(Boolean, default=False, index=True)
     created_at = Column(DateTime(timezone=True), server_default=func.now(), index=True)
     updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
@@ -943,6 +1030,17 @@ class UserCardMeaning(Base):
     __table_args__ = (
         # Removed char_length constraint as it's not supported in SQLite
         # We'll handle minimum length validation in the Pydantic schema instead
+        # One meaning per user and card; also the conflict target for the upsert
+        # in POST /api/journal/card-meanings.
+        Index("ix_user_card_meanings_user_id_card_id", "user_id", "card_id", unique=True),
+        # Serves GET /api/journal/card-meanings (active meanings by usage) as an index range scan.
+        Index(
+            "ix_user_card_meanings_active_usage",
+            "user_id",
+            usage_count.desc(),
+            postgresql_where=is_active.is_(True),
+            sqlite_where=is_active.is_(True),
+        ),
     )
 
     def get_emotional_keywords(self):
@@ -995,6 +1093,29 @@ class UserReadingAnalytics(Base):
         return self.analysis_data
 
 
+class UserAnalyticsSnapshot(Base):
+    """Precomputed journal analytics summary for a user.
+
+    Refreshed after every journal write so the analytics summary endpoint can
+    serve it with a primary-key lookup instead of aggregating the journal.
+
+    Attributes:
+        user_id (int): Primary key and foreign key to the user.
+        payload (str): Serialized ``JournalAnalytics`` JSON, or None until the
+            refresh after the latest journal write has stored it.
+        version (int): Bumped by every journal write; a refresh only stores its
+            payload if the version it read is still current.
+        updated_at (datetime): When the snapshot was last computed.
+    """
+
+    __tablename__ = "user_analytics_snapshot"
+
+    user_id = Column(Integer, ForeignKey("users.id", ondelete="CASCADE"), primary_key=True)
+    payload = Column(Text, nullable=True)
+    version = Column(Integer, nullable=False, default=0, server_default="0")
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
+
+
 class ReadingReminder(Base):
     """Represents a reminder for a journal entry follow-up.
 
@@ -1013,6 +1134,8 @@ class ReadingReminder(Base):
     """
 
     __tablename__ = "reading_reminders"
+    # Fetch the server-side created_at with RETURNING at flush time
+    __mapper_args__ = {"eager_defaults": True}
 
     id = Column(Integer, primary_key=True, index=True)
     user_id = Column(Integer, ForeignKey("users.id", ondelete="CASCADE"), nullable=False, index=True)
@@ -1033,6 +1156,7 @@ class ReadingReminder(Base):
     # Check constraint for reminder type
     __table_args__ = (
         CheckConstraint("reminder_type IN ('anniversary', 'follow_up', 'milestone')", name="valid_reminder_type"),
+        Index("ix_reading_reminders_user_id_reminder_date", "user_id", "reminder_date"),
     )
 
 
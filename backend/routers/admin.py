@@ -27,6 +27,9 @@ from schemas import (
     AdminUserResponse,
     AdminUserUpdate,
 )
+from services.card_catalog import invalidate_card_ids
+from services.spread_catalog import invalidate_spreads
+from tarot_reader import invalidate_deck_cards
 from utils.avatar_utils import avatar_manager
 
 router = APIRouter(prefix="/api/admin", tags=["Admin"])
@@ -366,6 +369,12 @@ async def update_user(
     for field, value in update_data.items():
         setattr(user, field, value)
 
+    # Shared readings carry a copy of the creator's username for join-free public views
+    if "username" in update_data:
+        db.query(SharedReading).filter(SharedReading.user_id == user.id).update(
+            {SharedReading.creator_username: user.username}, synchronize_session=False
+        )
+
     db.commit()
     db.refresh(user)
 
@@ -602,6 +611,8 @@ async def create_card(
     card = Card(**card_create.model_dump())
     db.add(card)
     db.commit()
+    invalidate_card_ids()
+    invalidate_deck_cards()
     db.refresh(card)
 
     return AdminCardResponse(
@@ -639,6 +650,7 @@ async def update_card(
         setattr(card, field, value)
 
     db.commit()
+    invalidate_deck_cards()
     db.refresh(card)
 
     return AdminCardResponse(
@@ -668,6 +680,8 @@ async def delete_card(card_id: int, db: Session = Depends(get_db), admin_user: U
 
     db.delete(card)
     db.commit()
+    invalidate_card_ids()
+    invalidate_deck_cards()
 
     return {"message": "Card deleted successfully"}
 
@@ -743,6 +757,7 @@ async def update_deck(
         setattr(deck, field, value)
 
     db.commit()
+    invalidate_deck_cards()
     db.refresh(deck)
 
     return AdminDeckResponse(
@@ -763,6 +778,7 @@ async def delete_deck(deck_id: int, db: Session = Depends(get_db), admin_user: U
 
     db.delete(deck)
     db.commit()
+    invalidate_deck_cards()
 
     return {"message": "Deck deleted successfully"}
 
@@ -794,7 +810,7 @@ async def list_spreads(
 @router.get("/spreads/{spread_id}", response_model=AdminSpreadResponse)
 async def get_spread(spread_id: int, db: Session = Depends(get_db), admin_user: User = Depends(get_admin_user)):
     """Get a specific spread by ID"""
-    spread = db.query(Spread).filter(Spread.id == spread_id).first()
+    spread = db.get(Spread, spread_id)
     if not spread:
         raise HTTPException(status_code=404, detail="Spread not found")
 
@@ -818,6 +834,7 @@ async def create_spread(
     db.add(spread)
     db.commit()
     db.refresh(spread)
+    invalidate_spreads()
 
     return AdminSpreadResponse(
         id=spread.id,
@@ -837,7 +854,7 @@ async def update_spread(
     admin_user: User = Depends(get_admin_user),
 ):
     """Update a spread"""
-    spread = db.query(Spread).filter(Spread.id == spread_id).first()
+    spread = db.get(Spread, spread_id)
     if not spread:
         raise HTTPException(status_code=404, detail="Spread not found")
 
@@ -850,6 +867,7 @@ async def update_spread(
 
     db.commit()
     db.refresh(spread)
+    invalidate_spreads()
 
     return AdminSpreadResponse(
         id=spread.id,
@@ -864,12 +882,13 @@ async def update_spread(
 @router.delete("/spreads/{spread_id}")
 async def delete_spread(spread_id: int, db: Session = Depends(get_db), admin_user: User = Depends(get_admin_user)):
     """Delete a spread"""
-    spread = db.query(Spread).filter(Spread.id == spread_id).first()
+    spread = db.get(Spread, spread_id)
     if not spread:
         raise HTTPException(status_code=404, detail="Spread not found")
 
     db.delete(spread)
     db.commit()
+    invalidate_spreads()
 
     return {"message": "Spread deleted successfully"}
 
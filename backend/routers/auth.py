@@ -176,6 +176,7 @@ async def get_auth_token(request: Request, bearer_token: str | None = Depends(op
 
 
 async def get_current_user(
+    request: Request,
     token: str | None = Depends(get_auth_token),
     db: Session = Depends(get_db),
 ) -> User:
@@ -183,8 +184,11 @@ async def get_current_user(
     Get Current Authenticated User
 
     Validate a JWT from the browser cookie or bearer header and return the current user.
+    The user is kept on ``request.state.user`` so later lookups in the same request
+    skip the token decode and the database round-trips.
 
     Args:
+        request (Request): Incoming request, used to share the loaded user
         token (str): JWT token from the access cookie or Authorization header
         db (Session): Database session
 
@@ -195,6 +199,10 @@ async def get_current_user(
         AuthenticationError: If token is invalid or malformed
         UserNotFoundError (401): If user doesn't exist
     """
+    cached_user = getattr(request.state, "user", None)
+    if cached_user is not None:
+        return cached_user
+
     try:
         if not token:
             raise AuthenticationError(message="Authentication required")
@@ -225,18 +233,25 @@ async def get_current_user(
     if user is None:
         raise UserNotFoundError(message="User not found", details={"username": token_data.username})
 
+    request.state.user = user
     return user
 
 
 async def get_optional_current_user(
+    request: Request,
     token: str | None = Depends(get_auth_token),
     db: Session = Depends(get_db),
 ) -> User | None:
     """Return the authenticated user when a valid token is present, otherwise None.
 
     Used by endpoints that personalize behavior for logged-in users but remain
-    accessible to anonymous visitors.
+    accessible to anonymous visitors. Shares ``request.state.user`` with
+    `get_current_user`.
     """
+    cached_user = getattr(request.state, "user", None)
+    if cached_user is not None:
+        return cached_user
+
     if not token:
         return None
     try:
@@ -253,7 +268,10 @@ async def get_optional_current_user(
         if not session or session.revoked_at or session.expires_at <= datetime.utcnow():
             return None
 
-    return db.query(User).filter(User.username == username, User.is_deleted == False).first()  # noqa: E712
+    user = db.query(User).filter(User.username == username, User.is_deleted == False).first()  # noqa: E712
+    if user is not None:
+        request.state.user = user
+    return user
 
 
 async def get_admin_user(current_user: User = Depends(get_current_user)) -> User:
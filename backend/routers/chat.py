@@ -1,11 +1,14 @@
 import asyncio
 import json
 import time
+from functools import lru_cache
 from pathlib import Path
 
+import orjson
 from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response
 from fastapi.responses import StreamingResponse
 from langchain_openai import ChatOpenAI
+from sqlalchemy import select
 from sqlalchemy.orm import Session, selectinload
 
 from config import settings
@@ -20,7 +23,7 @@ from schemas import (
     MessageResponse,
 )
 from services.streak_service import record_activity as record_streak_activity
-from services.subscription_service import SubscriptionService
+from services.subscription_service import get_subscription_service
 from tarot_reader import TarotReader
 from utils.error_handlers import (
     ChatSessionError,
@@ -52,6 +55,14 @@ router = APIRouter(prefix="/api/chat", tags=["chat"])
 CARD_DRAW_ANIMATION_SECONDS = 5
 CHAT_PROMPT_VERSION = "1.0"
 
+# Response headers for the message SSE stream; built once rather than per request.
+_SSE_HEADERS = {
+    "Cache-Control": "no-cache",
+    "Connection": "keep-alive",
+    "Access-Control-Allow-Origin": "*",
+    "Access-Control-Allow-Headers": "*",
+}
+
 # Initialize TarotReader
 reader = TarotReader()
 
@@ -216,6 +227,29 @@ RENAME_CHAT_TOOL = {
 }
 
 
+@lru_cache(maxsize=1)
+def _get_chat_llm() -> ChatOpenAI:
+    """Return the process-wide chat model, building its HTTP client once."""
+    return ChatOpenAI(
+        temperature=0.7,
+        model=settings.OPENAI_MODEL,
+        streaming=True,
+        max_tokens=800,
+    )
+
+
+@lru_cache(maxsize=2)
+def _get_tool_llm(include_rename: bool):
+    """
+    Return the chat model bound to the reading tools.
+
+    ``bind_tools`` converts each tool into the OpenAI schema; the binding is
+    cached so that conversion happens once per tool set, not once per message.
+    """
+    tools = [DRAW_CARDS_TOOL, RENAME_CHAT_TOOL] if include_rename else [DRAW_CARDS_TOOL]
+    return _get_chat_llm().bind_tools(tools)
+
+
 def validate_chat_session_exists(db: Session, session_id: int, user_id: int) -> bool:
     """
     Validate that a chat session exists and belongs to the specified user.
@@ -301,8 +335,7 @@ def execute_draw_cards_tool(
     try:
         # Check and consume turns before drawing cards
         if current_user and db:
-            subscription_service = SubscriptionService()
-            turn_result = subscription_service.consume_user_turn(db, current_user, usage_context="chat")
+            turn_result = get_subscription_service().consume_user_turn(db, current_user, usage_context="chat")
 
             if not turn_result.success:
                 return {
@@ -875,6 +908,57 @@ def handle_llm_tool_calls(
     return draw_tool_call, renamed_title
 
 
+def _save_and_emit(
+    db: Session,
+    session_id: int,
+    current_user: User,
+    content: str,
+    *,
+    card_orientation_tuples: list[tuple[Card, str]] | None = None,
+    status: str = "success",
+    validate_session: bool = True,
+) -> str:
+    """
+    Persist an assistant message and build its ``assistant_message`` SSE frame.
+
+    Shared by every save path of the streaming chat flow. The message is flushed
+    so ``id``/``created_at`` come back with the INSERT (``eager_defaults``), the
+    frame is serialized from that in-memory state, and the transaction is
+    committed before the frame is returned, so the client never sees the id of
+    a message that was not saved.
+
+    Raises:
+        HTTPException (404): If ``validate_session`` is set and the chat session
+            was deleted while the response was streaming.
+    """
+    if validate_session and not validate_chat_session_exists(db, session_id, current_user.id):
+        logger.logger.error(
+            "Chat session no longer exists while saving assistant message",
+            extra={"user_id": current_user.id, "session_id": session_id},
+        )
+        raise HTTPException(status_code=404, detail="Chat session not found. Please refresh and try again.")
+
+    # Attach card associations through the relationship so the response can be
+    # built without lazy-loading them back from the database.
+    ai_message = Message(
+        chat_session_id=session_id,
+        content=content,
+        role="assistant",
+        card_associations=[
+            MessageCardAssociation(card=card_instance, orientation=orientation)
+            for card_instance, orientation in card_orientation_tuples or ()
+        ],
+    )
+    db.add(ai_message)
+    db.flush()
+
+    message_dict = MessageResponse.model_validate(ai_message).model_dump()
+    db.commit()
+    record_chat_message(settings.FASTAPI_ENV, role="assistant", status=status)
+
+    return f"data: {orjson.dumps({'type': 'assistant_message', 'message': message_dict}).decode()}\n\n"
+
+
 @router.post("/sessions/{session_id}/messages/")
 @limiter.limit(RATE_LIMITS["chat"])
 async def create_message(
@@ -1016,13 +1100,7 @@ async def create_message(
                 }
                 yield f"data: {json.dumps(event_payload_user)}\n\n"
 
-                # Initialize LLM with tool calling
-                llm = ChatOpenAI(
-                    temperature=0.7,
-                    model=settings.OPENAI_MODEL,
-                    streaming=True,
-                    max_tokens=800,
-                )
+                llm = _get_chat_llm()
 
                 # Create the system message
                 system_message_content = load_system_prompt()
@@ -1052,17 +1130,15 @@ async def create_message(
                 # generator.
 
                 # Get model response with tool calling
-                available_tools = [DRAW_CARDS_TOOL]
-                if session.title == "New Chat":
-                    available_tools.append(RENAME_CHAT_TOOL)
+                offer_rename = session.title == "New Chat"
 
                 logger.logger.info(
-                    f"Invoking LLM with {len(messages_for_llm)} messages and {len(available_tools)} tools available"
+                    f"Invoking LLM with {len(messages_for_llm)} messages and {2 if offer_rename else 1} tools available"
                 )
 
                 openai_start_time = time.perf_counter()
                 try:
-                    llm_response = llm.bind_tools(available_tools).invoke(messages_for_llm)
+                    llm_response = _get_tool_llm(offer_rename).invoke(messages_for_llm)
                 except Exception as exc:
                     _record_openai_error(exc, openai_start_time)
                     raise
@@ -1086,7 +1162,7 @@ async def create_message(
                     if not tool_call:
                         openai_start_time = time.perf_counter()
                         try:
-                            llm_response = llm.bind_tools([DRAW_CARDS_TOOL]).invoke(messages_for_llm)
+                            llm_response = _get_tool_llm(False).invoke(messages_for_llm)
                         except Exception as exc:
                             _record_openai_error(exc, openai_start_time)
                             raise
@@ -1166,49 +1242,13 @@ async def create_message(
                             # Append wellbeing disclaimer to readings
                             complete_ai_content += WELLBEING_DISCLAIMER
                             yield f"data: {json.dumps({'type': 'content_chunk', 'content': WELLBEING_DISCLAIMER})}\n\n"
-                            if not validate_chat_session_exists(db, session_id, current_user.id):
-                                logger.logger.error(
-                                    "Chat session no longer exists while saving assistant message",
-                                    extra={
-                                        "user_id": current_user.id,
-                                        "session_id": session_id,
-                                    },
-                                )
-                                raise HTTPException(
-                                    status_code=404, detail="Chat session not found. Please refresh and try again."
-                                )
-
-                            ai_message = Message(
-                                chat_session_id=session_id,
-                                content=complete_ai_content,
-                                role="assistant",
+                            yield _save_and_emit(
+                                db,
+                                session_id,
+                                current_user,
+                                complete_ai_content,
+                                card_orientation_tuples=tool_result.get("card_orientation_tuples"),
                             )
-                            db.add(ai_message)
-                            db.flush()
-
-                            card_associations_to_add = []
-                            if tool_result.get("card_orientation_tuples"):
-                                for card_instance, orientation_str in tool_result["card_orientation_tuples"]:
-                                    association = MessageCardAssociation(
-                                        message_id=ai_message.id,
-                                        card_id=card_instance.id,
-                                        orientation=orientation_str,
-                                    )
-                                    card_associations_to_add.append(association)
-                                db.add_all(card_associations_to_add)
-
-                            db.commit()
-                            db.refresh(ai_message)
-                            record_chat_message(settings.FASTAPI_ENV, role="assistant", status="success")
-
-                            ai_message_response_pydantic = MessageResponse.from_orm(ai_message)
-                            # Pydantic V2 style for a dict ready for json.dumps
-                            message_dict_assistant = ai_message_response_pydantic.model_dump(mode="json")
-                            event_payload_assistant = {
-                                "type": "assistant_message",
-                                "message": message_dict_assistant,
-                            }
-                            yield f"data: {json.dumps(event_payload_assistant)}\n\n"
 
                         else:
                             # Handle case where turn consumption failed
@@ -1232,23 +1272,14 @@ async def create_message(
                                 yield f"data: {json.dumps({'type': 'content_chunk', 'content': error_content})}\n\n"
 
                                 # Save error message to chat
-                                error_message = Message(
-                                    chat_session_id=session_id,
-                                    content=error_content,
-                                    role="assistant",
+                                yield _save_and_emit(
+                                    db,
+                                    session_id,
+                                    current_user,
+                                    error_content,
+                                    status="error",
+                                    validate_session=False,
                                 )
-                                db.add(error_message)
-                                db.commit()
-                                db.refresh(error_message)
-                                record_chat_message(settings.FASTAPI_ENV, role="assistant", status="error")
-
-                                error_message_response = MessageResponse.from_orm(error_message)
-                                message_dict_error = error_message_response.model_dump(mode="json")
-                                event_payload_error = {
-                                    "type": "assistant_message",
-                                    "message": message_dict_error,
-                                }
-                                yield f"data: {json.dumps(event_payload_error)}\n\n"
                             else:
                                 error_content = (
                                     "I apologize, but I'm having trouble drawing cards right now. "
@@ -1277,65 +1308,15 @@ async def create_message(
                             prompt_version=CHAT_PROMPT_VERSION,
                         )
 
-                    # Save the complete AI response if no tools were called
-                    if response_content:  # Ensure there's content to save
-                        # Validate that the chat session still exists before saving
-                        if not validate_chat_session_exists(db, session_id, current_user.id):
-                            logger.logger.error(
-                                "Chat session no longer exists while saving assistant message (no tools)",
-                                extra={
-                                    "user_id": current_user.id,
-                                    "session_id": session_id,
-                                },
-                            )
-                            raise HTTPException(
-                                status_code=404, detail="Chat session not found. Please refresh and try again."
-                            )
-
-                        ai_message = Message(
-                            chat_session_id=session_id,
-                            content=response_content,
-                            role="assistant",
-                        )
-                        db.add(ai_message)
-                        db.commit()
-                        db.refresh(ai_message)
-                        record_chat_message(settings.FASTAPI_ENV, role="assistant", status="success")
-
-                        no_tool_ai_message_response = MessageResponse.from_orm(ai_message)
-                        # Pydantic V2 style for a dict ready for json.dumps
-                        message_dict_no_tool = no_tool_ai_message_response.model_dump(mode="json")
-                        event_payload_no_tool = {
-                            "type": "assistant_message",
-                            "message": message_dict_no_tool,
-                        }
-                        yield f"data: {json.dumps(event_payload_no_tool)}\n\n"
-                    else:  # Handle case where LLM stream yields no content (should be rare)
-                        # Validate that the chat session still exists before saving
-                        if not validate_chat_session_exists(db, session_id, current_user.id):
-                            logger.logger.error(
-                                "Chat session no longer exists while saving empty assistant message",
-                                extra={
-                                    "user_id": current_user.id,
-                                    "session_id": session_id,
-                                },
-                            )
-                            raise HTTPException(
-                                status_code=404, detail="Chat session not found. Please refresh and try again."
-                            )
-
-                        empty_ai_message = Message(chat_session_id=session_id, content="", role="assistant")
-                        db.add(empty_ai_message)
-                        db.commit()
-                        db.refresh(empty_ai_message)
-                        record_chat_message(settings.FASTAPI_ENV, role="assistant", status="error")
-                        empty_message_response = MessageResponse.from_orm(empty_ai_message)
-                        message_dict_empty = empty_message_response.model_dump(mode="json")
-                        event_payload_empty = {
-                            "type": "assistant_message",
-                            "message": message_dict_empty,
-                        }
-                        yield f"data: {json.dumps(event_payload_empty)}\n\n"
+                    # Save the complete AI response if no tools were called. An empty
+                    # stream (should be rare) is still recorded, flagged as an error.
+                    yield _save_and_emit(
+                        db,
+                        session_id,
+                        current_user,
+                        response_content,
+                        status="success" if response_content else "error",
+                    )
 
                 logger.logger.info(
                     "Streaming response completed",
@@ -1356,12 +1337,7 @@ async def create_message(
         return StreamingResponse(
             generate_streaming_response(),
             media_type="text/event-stream",
-            headers={
-                "Cache-Control": "no-cache",
-                "Connection": "keep-alive",
-                "Access-Control-Allow-Origin": "*",
-                "Access-Control-Allow-Headers": "*",
-            },
+            headers=_SSE_HEADERS,
         )
 
     except RateLimitExceededError:
@@ -1429,14 +1405,14 @@ def search_chat_sessions(
     try:
         check_rate_limit(current_user.id)
 
-        # Search sessions by title
-        sessions = (
-            db.query(ChatSession)
-            .filter(ChatSession.user_id == current_user.id, ChatSession.title.ilike(f"%{q}%"))
+        # Search sessions by title, selecting only the columns the response needs
+        rows = db.execute(
+            select(ChatSession.id, ChatSession.title, ChatSession.created_at)
+            .where(ChatSession.user_id == current_user.id, ChatSession.title.ilike(f"%{q}%"))
             .order_by(ChatSession.created_at.desc())
             .limit(20)
-            .all()
-        )
+        ).all()
+        sessions = [ChatSessionResponse(id=row.id, title=row.title, created_at=row.created_at) for row in rows]
 
         logger.logger.info(
             "Chat sessions searched",
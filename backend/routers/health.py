@@ -38,9 +38,11 @@ Author: ArcanaAI Development Team
 Version: 1.0.0
 """
 
+import time
 import traceback
 
-from fastapi import APIRouter, Depends, HTTPException
+import orjson
+from fastapi import APIRouter, Depends, HTTPException, Response
 from sqlalchemy import text
 from sqlalchemy.orm import Session
 
@@ -51,6 +53,22 @@ from utils.error_handlers import logger
 # Initialize health router with prefix and tags for OpenAPI documentation
 router = APIRouter(prefix="/api/health", tags=["health"])
 
+# Liveness probes hit /db at 1-5 Hz; a successful SELECT 1 is reused for this
+# many seconds so the probe doesn't check out (and pre-ping) a pooled
+# connection on every call. Failures are never cached.
+DB_HEALTH_CACHE_SECONDS = 1.0
+_last_db_ok_ts = 0.0
+
+# Healthy responses never change, so their JSON bodies are encoded once at
+# import time. Only the unhealthy path is serialized per request.
+_HEALTH_OK_BODY = orjson.dumps({"status": "ok", "message": "Application is healthy"})
+_DB_HEALTHY_BODY = orjson.dumps({"status": "healthy", "database": "connected"})
+
+# During an outage every probe fails with the same error; a full traceback is
+# only captured once per window, later failures log just the message.
+DB_HEALTH_TRACEBACK_INTERVAL_SECONDS = 60.0
+_last_db_traceback_ts: float | None = None
+
 
 @router.get("/")
 async def health_check():
@@ -62,7 +80,7 @@ async def health_check():
     should respond quickly for monitoring systems.
 
     Returns:
-        dict: Health status information
+        Response: Precomputed JSON health status
             - status (str): Always "ok" if the service is running
             - message (str): Human-readable health message
 
@@ -82,7 +100,7 @@ async def health_check():
         This endpoint does not check external dependencies like databases
         or third-party services. Use /health/db for database-specific checks.
     """
-    return {"status": "ok", "message": "Application is healthy"}
+    return Response(_HEALTH_OK_BODY, media_type="application/json")
 
 
 @router.get("/db")
@@ -98,7 +116,7 @@ async def check_db_health(db: Session = Depends(get_db)):
         db (Session): Database session dependency injection
 
     Returns:
-        dict: Database health status
+        Response | dict: Database health status (precomputed JSON when healthy)
             - status (str): "healthy" or "unhealthy"
             - database (str): "connected" or "disconnected"
             - error (str, optional): Error message if database is unhealthy
@@ -129,22 +147,26 @@ async def check_db_health(db: Session = Depends(get_db)):
         This endpoint always returns HTTP 200, even for database failures.
         Check the "status" field in the response to determine actual health.
         Database errors are logged for monitoring and debugging.
+        A healthy result is cached for ``DB_HEALTH_CACHE_SECONDS``.
     """
+    global _last_db_ok_ts, _last_db_traceback_ts
+
+    if time.monotonic() - _last_db_ok_ts < DB_HEALTH_CACHE_SECONDS:
+        return Response(_DB_HEALTHY_BODY, media_type="application/json")
+
     try:
         # Execute a simple SQL query to test database connectivity
         # This query should work with any SQL database (SQLite, PostgreSQL, etc.)
         db.execute(text("SELECT 1"))
-        return {"status": "healthy", "database": "connected"}
+        _last_db_ok_ts = time.monotonic()
+        return Response(_DB_HEALTHY_BODY, media_type="application/json")
     except Exception as e:
-        # Log the error with full context for debugging
-        logger.logger.error(
-            "Database health check failed",
-            extra={
-                "error": str(e),
-                "error_type": type(e).__name__,
-                "traceback": traceback.format_exc(),
-            },
-        )
+        extra = {"error": str(e), "error_type": type(e).__name__}
+        now = time.monotonic()
+        if _last_db_traceback_ts is None or now - _last_db_traceback_ts > DB_HEALTH_TRACEBACK_INTERVAL_SECONDS:
+            extra["traceback"] = traceback.format_exc()
+            _last_db_traceback_ts = now
+        logger.logger.error("Database health check failed", extra=extra)
         # Return unhealthy status but still HTTP 200 for monitoring systems
         return {"status": "unhealthy", "database": "disconnected", "error": str(e)}
 
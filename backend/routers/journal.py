@@ -24,16 +24,49 @@ Version: 1.0.0
 
 import html
 import re
-from datetime import date, datetime, timedelta
+from collections import Counter
+from datetime import UTC, date, datetime, timedelta
+from itertools import chain
 
-from fastapi import APIRouter, Depends, HTTPException, Query, Request, status
+import orjson
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, Query, Request, status
+from fastapi.concurrency import run_in_threadpool
 from fastapi.responses import Response
-from sqlalchemy import String, and_, asc, cast, desc, or_
+from sqlalchemy import (
+    String,
+    Text,
+    and_,
+    asc,
+    case,
+    cast,
+    delete,
+    desc,
+    distinct,
+    func,
+    literal_column,
+    or_,
+    select,
+    type_coerce,
+    update,
+)
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.dialects.postgresql import array as pg_array
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
 from sqlalchemy.orm import Session, joinedload
 
-from database import get_db
-from models import Card, ReadingReminder, SharedReading, User, UserCardMeaning, UserReadingJournal
+from database import SessionLocal, get_db
+from models import (
+    Card,
+    ReadingReminder,
+    SharedReading,
+    User,
+    UserAnalyticsSnapshot,
+    UserCardMeaning,
+    UserReadingJournal,
+)
 from routers.auth import get_current_user
+from schemas import Card as CardSchema
 from schemas import (
     JournalAnalytics,
     JournalEntryCreate,
@@ -45,11 +78,37 @@ from schemas import (
     ReminderCreate,
     ReminderResponse,
 )
+from services.analytics_cache import bump_journal_version, get_cached_analytics, set_cached_analytics
+from services.card_catalog import card_exists
 from services.streak_service import record_activity as record_streak_activity
+from utils.error_handlers import logger
 from utils.rate_limiter import limiter
 
 router = APIRouter(prefix="/api/journal", tags=["journal"])
 
+# Rate limit decorators shared by the endpoints below, one per access pattern
+_READ_LIMIT = limiter.limit("60/minute")
+_LIST_LIMIT = limiter.limit("30/minute")
+_WRITE_LIMIT = limiter.limit("10/minute")
+_STRICT_WRITE_LIMIT = limiter.limit("5/minute")
+_ANALYTICS_LIMIT = limiter.limit("10/minute")
+
+# Batch size for analytics passes that stream JSON columns instead of loading every entry
+_ANALYTICS_YIELD_PER = 1000
+
+# Columns GET /entries may sort by; anything else falls back to created_at. A fixed
+# set keeps arbitrary attribute names out of ORDER BY and the compiled-SQL cache small.
+_JOURNAL_SORT_COLUMNS = {
+    "created_at": UserReadingJournal.created_at,
+    "updated_at": UserReadingJournal.updated_at,
+    "mood_before": UserReadingJournal.mood_before,
+    "mood_after": UserReadingJournal.mood_after,
+    "outcome_rating": UserReadingJournal.outcome_rating,
+}
+
+# Matches an HTML tag, including tags whose attributes span several lines
+_HTML_TAG_RE = re.compile(r"<[^>]*>")
+
 
 # Utility function for HTML sanitization
 def sanitize_html(text: str) -> str:
@@ -57,21 +116,92 @@ def sanitize_html(text: str) -> str:
     if not text:
         return text
 
-    # Remove HTML tags
-    clean = re.compile("<.*?>")
-    stripped = re.sub(clean, "", text)
+    # Remove HTML tags (plain notes contain no "<", so skip the regex pass)
+    if "<" in text:
+        text = _HTML_TAG_RE.sub("", text)
     # Escape remaining special HTML characters to prevent XSS
-    return html.escape(stripped)
+    return html.escape(text)
+
+
+def _is_postgres(db: Session) -> bool:
+    return db.get_bind().dialect.name == "postgresql"
+
+
+# Full-text vector over personal notes. The expression must stay identical to
+# the PostgreSQL GIN index ix_user_reading_journal_notes_fts to be served by it.
+_SIMPLE_TS_CONFIG = literal_column("'simple'::regconfig")
+_NOTES_TSVECTOR = func.to_tsvector(
+    _SIMPLE_TS_CONFIG, func.coalesce(UserReadingJournal.personal_notes, literal_column("''::text"))
+)
+_TSQUERY_TERM = re.compile(r"\w+")
+
+
+def _prefix_tsquery(text: str) -> str | None:
+    """Turn free text into a ``to_tsquery`` string matching every word as a prefix."""
+    terms = _TSQUERY_TERM.findall(text)
+    return " & ".join(f"{term}:*" for term in terms) or None
+
+
+def _tags_filter(db: Session, tag_list: list[str], match_any: bool):
+    """Return one predicate matching entries tagged with all (or any) of ``tag_list``."""
+    if _is_postgres(db):
+        # jsonb @> and ?| are both served by the GIN index on tags.
+        tags_jsonb = type_coerce(UserReadingJournal.tags, JSONB)
+        return tags_jsonb.has_any(pg_array(tag_list, type_=Text)) if match_any else tags_jsonb.contains(tag_list)
+    # SQLite: walk the JSON array once with json_each instead of one LIKE per tag.
+    tag_values = func.json_each(UserReadingJournal.tags).table_valued("value")
+    matched = tag_values.c.value.in_(tag_list)
+    if match_any:
+        return select(tag_values.c.value).where(matched).exists()
+    matched_count = select(func.count(distinct(tag_values.c.value))).where(matched).scalar_subquery()
+    return matched_count == len(set(tag_list))
+
+
+def _month_key(db: Session, column):
+    """Return a SQL expression bucketing a timestamp column into ``YYYY-MM`` strings."""
+    if _is_postgres(db):
+        return func.to_char(column, "YYYY-MM")
+    return func.strftime("%Y-%m", column)
+
+
+def _day_key(db: Session, column):
+    """Return a SQL expression bucketing a timestamp column into ``YYYY-MM-DD`` strings."""
+    if _is_postgres(db):
+        return func.to_char(column, "YYYY-MM-DD")
+    return func.strftime("%Y-%m-%d", column)
+
+
+def _schema_columns(model, schema, prefix: str = "") -> list:
+    """Return the table columns of ``model`` backing the scalar fields of ``schema``, labelled with ``prefix``."""
+    table_columns = model.__table__.c
+    return [table_columns[name].label(prefix + name) for name in schema.model_fields if name in table_columns]
+
+
+def _schema_values(row, schema, prefix: str = "") -> dict:
+    """Pick the values selected by :func:`_schema_columns` back out of a result row."""
+    mapping = row._mapping
+    return {name: mapping[prefix + name] for name in schema.model_fields if prefix + name in mapping}
+
+
+def _load_card_meaning(db: Session, meaning_id: int) -> UserCardMeaning:
+    """Reload a card meaning together with the card its response embeds, in one query."""
+    return (
+        db.query(UserCardMeaning)
+        .options(joinedload(UserCardMeaning.card))
+        .filter(UserCardMeaning.id == meaning_id)
+        .one()
+    )
 
 
 # --- Journal Entry Endpoints ---
 
 
 @router.post("/entries", response_model=JournalEntryResponse, status_code=status.HTTP_201_CREATED)
-@limiter.limit("10/minute")
+@_WRITE_LIMIT
 async def create_journal_entry(
     request: Request,
     entry: JournalEntryCreate,
+    background_tasks: BackgroundTasks,
     current_user: User = Depends(get_current_user),
     db: Session = Depends(get_db),
 ):
@@ -110,12 +240,12 @@ async def create_journal_entry(
             is_favorite=entry.is_favorite,
         )
 
+        # Entry, streak update and follow-up reminder share one transaction;
+        # the flush assigns db_entry.id for the reminder's foreign key.
         db.add(db_entry)
-        db.commit()
-        db.refresh(db_entry)
+        db.flush()
 
         record_streak_activity(db, current_user.id)
-        db.commit()
 
         # Create follow-up reminder if specified
         if entry.follow_up_date:
@@ -124,12 +254,19 @@ async def create_journal_entry(
                 journal_entry_id=db_entry.id,
                 reminder_type="follow_up",
                 reminder_date=entry.follow_up_date,
-                message=f"Follow up on your reading from {db_entry.created_at.strftime('%B %d, %Y')}",
+                message=f"Follow up on your reading from {datetime.utcnow().strftime('%B %d, %Y')}",
             )
             db.add(reminder)
-            db.commit()
 
-        return db_entry
+        # The flush already fetched the server-side timestamps (eager_defaults), so the
+        # response is built now instead of refreshing the entry after the commit expires it.
+        created = JournalEntryResponse.model_validate(db_entry)
+        _expire_analytics_snapshot(db, current_user.id)
+        db.commit()
+        await run_in_threadpool(bump_journal_version, current_user.id)
+        background_tasks.add_task(_refresh_analytics_snapshot, current_user.id)
+
+        return created
 
     except Exception as e:
         db.rollback()
@@ -139,9 +276,10 @@ async def create_journal_entry(
 
 
 @router.get("/entries", response_model=list[JournalEntryResponse])
-@limiter.limit("30/minute")
+@_LIST_LIMIT
 async def get_journal_entries(
     request: Request,
+    response: Response,
     skip: int = Query(0, ge=0, description="Number of entries to skip"),
     limit: int = Query(20, le=100, description="Maximum number of entries to return"),
     tags: str | None = Query(None, description="Comma-separated tags to filter by"),
@@ -154,7 +292,9 @@ async def get_journal_entries(
     card_name: str | None = Query(None, description="Filter by card name appearing in the reading"),
     spread_name: str | None = Query(None, description="Filter by spread name used in the reading"),
     tags_match: str | None = Query("all", description="Tag match mode: 'all' (default) or 'any'"),
-    sort_by: str | None = Query("created_at", description="Sort field"),
+    sort_by: str | None = Query(
+        "created_at", description="Sort field: created_at, updated_at, mood_before, mood_after or outcome_rating"
+    ),
     sort_order: str | None = Query("desc", description="Sort order (asc/desc)"),
     current_user: User = Depends(get_current_user),
     db: Session = Depends(get_db),
@@ -163,7 +303,8 @@ async def get_journal_entries(
     Get user's journal entries with filtering and pagination.
 
     Retrieves journal entries belonging to the current user with support for
-    comprehensive filtering, searching, and sorting options.
+    comprehensive filtering, searching, and sorting options. The total number of
+    matching entries (before pagination) is returned in the ``X-Total-Count`` header.
 
     Args:
         skip: Number of entries to skip (pagination)
@@ -184,46 +325,43 @@ async def get_journal_entries(
         List[JournalEntryResponse]: List of journal entries
     """
     try:
-        # Build base query
-        query = (
-            db.query(UserReadingJournal)
-            .options(joinedload(UserReadingJournal.shared_reading))
-            .filter(UserReadingJournal.user_id == current_user.id)
-        )
+        # Build base query over just the response columns; list reads skip ORM hydration
+        # COUNT(*) OVER () carries the unpaginated total on every row, saving a separate count query
+        query = select(
+            *_schema_columns(UserReadingJournal, JournalEntryResponse), func.count().over().label("total_count")
+        ).where(UserReadingJournal.user_id == current_user.id)
 
         # Apply filters
         if favorite_only:
-            query = query.filter(UserReadingJournal.is_favorite.is_(True))
+            query = query.where(UserReadingJournal.is_favorite.is_(True))
 
         if start_date:
-            query = query.filter(UserReadingJournal.created_at >= start_date)
+            query = query.where(UserReadingJournal.created_at >= start_date)
 
         if end_date:
-            query = query.filter(UserReadingJournal.created_at <= end_date)
+            query = query.where(UserReadingJournal.created_at <= end_date)
 
         if mood_min is not None:
-            query = query.filter(
+            query = query.where(
                 or_(UserReadingJournal.mood_before >= mood_min, UserReadingJournal.mood_after >= mood_min)
             )
 
         if mood_max is not None:
-            query = query.filter(
+            query = query.where(
                 or_(UserReadingJournal.mood_before <= mood_max, UserReadingJournal.mood_after <= mood_max)
             )
 
         if tags:
             tag_list = [tag.strip() for tag in tags.split(",") if tag.strip()]
             if tag_list:
-                # Match against the JSON text representation so the same query
-                # works on SQLite (local) and PostgreSQL/Supabase (prod), where
-                # json_extract() is unavailable. tags is stored like ["a","b"].
-                tags_text = cast(UserReadingJournal.tags, String)
-                tag_conditions = [tags_text.like(f'%"{tag}"%') for tag in tag_list]
-                combiner = or_ if (tags_match or "all").lower() == "any" else and_
-                query = query.filter(combiner(*tag_conditions))
+                query = query.where(_tags_filter(db, tag_list, match_any=(tags_match or "all").lower() == "any"))
 
         if search_notes:
-            query = query.filter(UserReadingJournal.personal_notes.ilike(f"%{search_notes}%"))
+            notes_tsquery = _prefix_tsquery(search_notes) if _is_postgres(db) else None
+            if notes_tsquery:
+                query = query.where(_NOTES_TSVECTOR.op("@@")(func.to_tsquery(_SIMPLE_TS_CONFIG, notes_tsquery)))
+            else:
+                query = query.where(UserReadingJournal.personal_notes.ilike(f"%{search_notes}%"))
 
         if card_name or spread_name:
             query = query.outerjoin(SharedReading, UserReadingJournal.reading_id == SharedReading.id)
@@ -232,7 +370,7 @@ async def get_journal_entries(
             if card_name:
                 needle_spaced = f'%"name": "{card_name}"%'
                 needle_tight = f'%"name":"{card_name}"%'
-                query = query.filter(
+                query = query.where(
                     or_(
                         snapshot_text.ilike(needle_spaced),
                         snapshot_text.ilike(needle_tight),
@@ -242,7 +380,7 @@ async def get_journal_entries(
                 )
 
             if spread_name:
-                query = query.filter(
+                query = query.where(
                     or_(
                         snapshot_text.ilike(f'%"spread": "{spread_name}"%'),
                         snapshot_text.ilike(f'%"spread":"{spread_name}"%'),
@@ -253,13 +391,21 @@ async def get_journal_entries(
                 )
 
         # Apply sorting
-        sort_field = getattr(UserReadingJournal, sort_by, UserReadingJournal.created_at)
+        sort_field = _JOURNAL_SORT_COLUMNS.get(sort_by, UserReadingJournal.created_at)
         query = query.order_by(asc(sort_field)) if sort_order.lower() == "asc" else query.order_by(desc(sort_field))
 
         # Apply pagination
-        entries = query.offset(skip).limit(limit).all()
+        rows = db.execute(query.offset(skip).limit(limit)).all()
+        if rows:
+            total_count = rows[0].total_count
+        elif skip:
+            # Paged past the end: no row carries the window total, so count directly
+            total_count = db.execute(select(func.count()).select_from(query.order_by(None).subquery())).scalar_one()
+        else:
+            total_count = 0
+        response.headers["X-Total-Count"] = str(total_count)
 
-        return entries
+        return [JournalEntryResponse(**_schema_values(row, JournalEntryResponse)) for row in rows]
 
     except Exception as e:
         raise HTTPException(
@@ -268,7 +414,7 @@ async def get_journal_entries(
 
 
 @router.get("/tags")
-@limiter.limit("60/minute")
+@_READ_LIMIT
 async def get_user_tags(
     request: Request,
     current_user: User = Depends(get_current_user),
@@ -280,7 +426,7 @@ async def get_user_tags(
         .filter(UserReadingJournal.user_id == current_user.id, UserReadingJournal.tags.isnot(None))
         .all()
     )
-    counts: dict[str, int] = {}
+    counts: Counter[str] = Counter()
     for (tags_value,) in rows:
         if not tags_value:
             continue
@@ -292,9 +438,7 @@ async def get_user_tags(
                 continue
         if not isinstance(tags_value, list):
             continue
-        for tag in tags_value:
-            if isinstance(tag, str) and tag.strip():
-                counts[tag] = counts.get(tag, 0) + 1
+        counts.update(tag for tag in tags_value if isinstance(tag, str) and tag.strip())
     return [
         {"tag": tag, "count": count}
         for tag, count in sorted(counts.items(), key=lambda item: (-item[1], item[0]))
@@ -302,7 +446,7 @@ async def get_user_tags(
 
 
 @router.get("/spreads-used")
-@limiter.limit("60/minute")
+@_READ_LIMIT
 async def get_spreads_used(
     request: Request,
     current_user: User = Depends(get_current_user),
@@ -335,7 +479,7 @@ async def get_spreads_used(
 
 
 @router.get("/entries/{entry_id}", response_model=JournalEntryResponse)
-@limiter.limit("60/minute")
+@_READ_LIMIT
 async def get_journal_entry(
     request: Request, entry_id: int, current_user: User = Depends(get_current_user), db: Session = Depends(get_db)
 ):
@@ -355,7 +499,6 @@ async def get_journal_entry(
     """
     entry = (
         db.query(UserReadingJournal)
-        .options(joinedload(UserReadingJournal.shared_reading))
         .filter(UserReadingJournal.id == entry_id, UserReadingJournal.user_id == current_user.id)
         .first()
     )
@@ -367,11 +510,12 @@ async def get_journal_entry(
 
 
 @router.put("/entries/{entry_id}", response_model=JournalEntryResponse)
-@limiter.limit("10/minute")
+@_WRITE_LIMIT
 async def update_journal_entry(
     request: Request,
     entry_id: int,
     entry_update: JournalEntryUpdate,
+    background_tasks: BackgroundTasks,
     current_user: User = Depends(get_current_user),
     db: Session = Depends(get_db),
 ):
@@ -408,10 +552,14 @@ async def update_journal_entry(
         # Update timestamp
         entry.updated_at = datetime.utcnow()
 
+        # Every field is known in Python, so no refresh round trip is needed after the commit
+        updated = JournalEntryResponse.model_validate(entry)
+        _expire_analytics_snapshot(db, current_user.id)
         db.commit()
-        db.refresh(entry)
+        await run_in_threadpool(bump_journal_version, current_user.id)
+        background_tasks.add_task(_refresh_analytics_snapshot, current_user.id)
 
-        return entry
+        return updated
 
     except Exception as e:
         db.rollback()
@@ -421,9 +569,13 @@ async def update_journal_entry(
 
 
 @router.delete("/entries/{entry_id}", status_code=status.HTTP_204_NO_CONTENT)
-@limiter.limit("5/minute")
+@_STRICT_WRITE_LIMIT
 async def delete_journal_entry(
-    request: Request, entry_id: int, current_user: User = Depends(get_current_user), db: Session = Depends(get_db)
+    request: Request,
+    entry_id: int,
+    background_tasks: BackgroundTasks,
+    current_user: User = Depends(get_current_user),
+    db: Session = Depends(get_db),
 ):
     """
     Delete a journal entry.
@@ -450,7 +602,10 @@ async def delete_journal_entry(
             raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Journal entry not found")
 
         db.delete(entry)
+        _expire_analytics_snapshot(db, current_user.id)
         db.commit()
+        await run_in_threadpool(bump_journal_version, current_user.id)
+        background_tasks.add_task(_refresh_analytics_snapshot, current_user.id)
 
         return {"message": "Journal entry deleted successfully"}
 
@@ -468,7 +623,7 @@ async def delete_journal_entry(
 
 
 @router.post("/card-meanings", response_model=PersonalCardMeaningResponse)
-@limiter.limit("5/minute")
+@_STRICT_WRITE_LIMIT
 async def create_or_update_card_meaning(
     request: Request,
     response: Response,
@@ -489,39 +644,34 @@ async def create_or_update_card_meaning(
     """
     try:
         # Check if card exists
-        card = db.query(Card).filter(Card.id == meaning.card_id).first()
-        if not card:
+        if not card_exists(db, meaning.card_id):
             raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Card not found")
 
-        # Check if meaning already exists
-        existing_meaning = (
-            db.query(UserCardMeaning)
-            .filter(UserCardMeaning.user_id == current_user.id, UserCardMeaning.card_id == meaning.card_id)
-            .first()
+        # Insert or update in one statement on the unique (user_id, card_id) index.
+        # A fresh insert sets created_at == updated_at; an update only moves updated_at.
+        now = datetime.utcnow()
+        insert = pg_insert if _is_postgres(db) else sqlite_insert
+        stmt = insert(UserCardMeaning).values(
+            user_id=current_user.id,
+            card_id=meaning.card_id,
+            personal_meaning=meaning.personal_meaning,
+            emotional_keywords=meaning.emotional_keywords or [],
+            created_at=now,
+            updated_at=now,
         )
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[UserCardMeaning.user_id, UserCardMeaning.card_id],
+            set_={
+                "personal_meaning": stmt.excluded.personal_meaning,
+                "emotional_keywords": stmt.excluded.emotional_keywords,
+                "updated_at": now,
+            },
+        ).returning(UserCardMeaning.id, UserCardMeaning.created_at, UserCardMeaning.updated_at)
+        meaning_id, created_at, updated_at = db.execute(stmt).one()
+        db.commit()
 
-        if existing_meaning:
-            # Update existing meaning
-            existing_meaning.personal_meaning = meaning.personal_meaning
-            existing_meaning.emotional_keywords = meaning.emotional_keywords or []
-            existing_meaning.updated_at = datetime.utcnow()
-            db.commit()
-            db.refresh(existing_meaning)
-            response.status_code = status.HTTP_200_OK
-            return existing_meaning
-        else:
-            # Create new meaning
-            db_meaning = UserCardMeaning(
-                user_id=current_user.id,
-                card_id=meaning.card_id,
-                personal_meaning=meaning.personal_meaning,
-                emotional_keywords=meaning.emotional_keywords or [],
-            )
-            db.add(db_meaning)
-            db.commit()
-            db.refresh(db_meaning)
-            response.status_code = status.HTTP_201_CREATED
-            return db_meaning
+        response.status_code = status.HTTP_201_CREATED if created_at == updated_at else status.HTTP_200_OK
+        return _load_card_meaning(db, meaning_id)
 
     except Exception as e:
         db.rollback()
@@ -531,7 +681,7 @@ async def create_or_update_card_meaning(
 
 
 @router.get("/card-meanings", response_model=list[PersonalCardMeaningResponse])
-@limiter.limit("30/minute")
+@_LIST_LIMIT
 async def get_card_meanings(
     request: Request,
     skip: int = Query(0, ge=0),
@@ -551,21 +701,29 @@ async def get_card_meanings(
     Returns:
         List[PersonalCardMeaningResponse]: List of card meanings
     """
-    meanings = (
-        db.query(UserCardMeaning)
-        .options(joinedload(UserCardMeaning.card))
-        .filter(UserCardMeaning.user_id == current_user.id, UserCardMeaning.is_active.is_(True))
+    rows = db.execute(
+        select(
+            *_schema_columns(UserCardMeaning, PersonalCardMeaningResponse),
+            *_schema_columns(Card, CardSchema, prefix="card__"),
+        )
+        .outerjoin(Card, UserCardMeaning.card_id == Card.id)
+        .where(UserCardMeaning.user_id == current_user.id, UserCardMeaning.is_active.is_(True))
         .order_by(desc(UserCardMeaning.usage_count))
         .offset(skip)
         .limit(limit)
-        .all()
-    )
+    ).all()
 
-    return meanings
+    return [
+        PersonalCardMeaningResponse(
+            **_schema_values(row, PersonalCardMeaningResponse),
+            card=CardSchema(**_schema_values(row, CardSchema, prefix="card__")) if row.card__id is not None else None,
+        )
+        for row in rows
+    ]
 
 
 @router.get("/card-meanings/{card_id}", response_model=PersonalCardMeaningResponse)
-@limiter.limit("60/minute")
+@_READ_LIMIT
 async def get_card_meaning(
     request: Request, card_id: int, current_user: User = Depends(get_current_user), db: Session = Depends(get_db)
 ):
@@ -601,7 +759,7 @@ async def get_card_meaning(
 
 
 @router.put("/card-meanings/{card_id}", response_model=PersonalCardMeaningResponse)
-@limiter.limit("5/minute")
+@_STRICT_WRITE_LIMIT
 async def update_card_meaning(
     request: Request,
     card_id: int,
@@ -623,6 +781,7 @@ async def update_card_meaning(
     """
     meaning = (
         db.query(UserCardMeaning)
+        .options(joinedload(UserCardMeaning.card))
         .filter(UserCardMeaning.user_id == current_user.id, UserCardMeaning.card_id == card_id)
         .first()
     )
@@ -637,14 +796,14 @@ async def update_card_meaning(
         meaning.emotional_keywords = meaning_update.emotional_keywords
 
     meaning.updated_at = datetime.utcnow()
+    updated = PersonalCardMeaningResponse.model_validate(meaning)
     db.commit()
-    db.refresh(meaning)
 
-    return meaning
+    return updated
 
 
 @router.delete("/card-meanings/{card_id}", status_code=status.HTTP_204_NO_CONTENT)
-@limiter.limit("5/minute")
+@_STRICT_WRITE_LIMIT
 async def delete_card_meaning(
     request: Request, card_id: int, current_user: User = Depends(get_current_user), db: Session = Depends(get_db)
 ):
@@ -677,14 +836,214 @@ async def delete_card_meaning(
 # --- Analytics Endpoints ---
 
 
+def _card_names(snapshots):
+    """Yield every card name in an iterable of reading snapshots, decoding legacy JSON strings."""
+    for snapshot in snapshots:
+        if isinstance(snapshot, str):
+            snapshot = orjson.loads(snapshot)
+        if isinstance(snapshot, dict) and "cards" in snapshot:
+            for card in snapshot["cards"]:
+                yield card.get("name", "Unknown")
+
+
+def _dump_json(data) -> bytes:
+    """Encode an analytics payload with orjson, which also accepts the int keys of ``mood_distribution``."""
+    return orjson.dumps(data, option=orjson.OPT_NON_STR_KEYS)
+
+
+def _compute_journal_analytics(db: Session, user_id: int) -> JournalAnalytics:
+    """Aggregate the analytics summary for ``user_id`` from their journal."""
+    # Get current date info
+    now = datetime.utcnow()
+    current_month_start = now.replace(day=1, hour=0, minute=0, second=0, microsecond=0)
+
+    user_filter = UserReadingJournal.user_id == user_id
+    has_mood = and_(UserReadingJournal.mood_before.isnot(None), UserReadingJournal.mood_after.isnot(None))
+    month = _month_key(db, UserReadingJournal.created_at)
+
+    # Scalar aggregates in a single pass over the user's entries
+    (
+        total_entries,
+        entries_this_month,
+        mood_entry_count,
+        average_mood_improvement,
+        follow_up_total,
+        follow_up_completed,
+        introspection_depth,
+    ) = (
+        db.query(
+            func.count(UserReadingJournal.id),
+            func.count(case((UserReadingJournal.created_at >= current_month_start, 1))),
+            func.count(case((has_mood, 1))),
+            func.avg(case((has_mood, UserReadingJournal.mood_after - UserReadingJournal.mood_before))),
+            func.count(UserReadingJournal.follow_up_date),
+            func.count(
+                case(
+                    (
+                        and_(
+                            UserReadingJournal.follow_up_date.isnot(None),
+                            UserReadingJournal.follow_up_completed.is_(True),
+                        ),
+                        1,
+                    )
+                )
+            ),
+            func.count(UserReadingJournal.personal_notes),
+        )
+        .filter(user_filter)
+        .one()
+    )
+
+    # Reading counts and mood averages per month share one GROUP BY; months
+    # without mood data have NULL averages and are left out of mood_trends.
+    monthly = (
+        db.query(
+            month,
+            func.count(UserReadingJournal.id),
+            func.avg(case((has_mood, UserReadingJournal.mood_before))),
+            func.avg(case((has_mood, UserReadingJournal.mood_after))),
+        )
+        .filter(user_filter)
+        .group_by(month)
+        .order_by(month)
+        .all()
+    )
+    reading_frequency = {month_key: count for month_key, count, _, _ in monthly}
+
+    # Mood trends calculation
+    mood_trends = {}
+    if average_mood_improvement is not None:
+        average_mood_improvement = float(average_mood_improvement)
+        mood_trends = {
+            "monthly_averages": {
+                month_key: {
+                    "before": float(before),
+                    "after": float(after),
+                    "improvement": float(after) - float(before),
+                }
+                for month_key, _, before, after in monthly
+                if before is not None
+            },
+            "overall_improvement": average_mood_improvement,
+        }
+
+    # Card and tag usage live inside JSON columns, so count them in Python,
+    # streaming just those two columns in batches rather than hydrating whole entries.
+    # Counter.update runs once per batch rather than once per row.
+    card_usage = Counter()
+    tag_usage = Counter()
+    json_columns = (
+        select(UserReadingJournal.tags, UserReadingJournal.reading_snapshot)
+        .where(user_filter)
+        .execution_options(yield_per=_ANALYTICS_YIELD_PER)
+    )
+    for batch in db.execute(json_columns).partitions():
+        card_usage.update(_card_names(reading_data for _, reading_data in batch))
+        tag_usage.update(chain.from_iterable(tags for tags, _ in batch if tags))
+
+    favorite_cards = [{"name": name, "count": count} for name, count in card_usage.most_common(10)]
+
+    most_used_tags = [{"tag": tag, "count": count} for tag, count in tag_usage.most_common(10)]
+
+    # Follow-up completion rate
+    follow_up_completion_rate = None
+    if follow_up_total:
+        follow_up_completion_rate = follow_up_completed / follow_up_total
+
+    # Growth metrics
+    growth_metrics = {
+        "total_readings": total_entries,
+        "monthly_consistency": entries_this_month,
+        "introspection_depth": introspection_depth,
+        "mindfulness_practice": mood_entry_count,
+        "commitment_level": follow_up_completion_rate or 0.0,
+    }
+
+    return JournalAnalytics(
+        total_entries=total_entries,
+        entries_this_month=entries_this_month,
+        favorite_cards=favorite_cards,
+        mood_trends=mood_trends,
+        reading_frequency=reading_frequency,
+        growth_metrics=growth_metrics,
+        average_mood_improvement=average_mood_improvement,
+        most_used_tags=most_used_tags,
+        follow_up_completion_rate=follow_up_completion_rate,
+    )
+
+
+def _refresh_analytics_snapshot(user_id: int) -> None:
+    """
+    Recompute the user's analytics snapshot after a journal write.
+
+    Runs as a response background task in its own session. The snapshot
+    version is read before aggregating, and the payload is only stored if no
+    journal write has bumped that version since; a newer write schedules its
+    own refresh, so a slow refresh never overwrites fresher data. On failure
+    the snapshot stays empty and the summary endpoint computes it inline.
+    """
+    with SessionLocal() as db:
+        try:
+            version = db.scalar(select(UserAnalyticsSnapshot.version).where(UserAnalyticsSnapshot.user_id == user_id))
+            payload = _dump_json(_compute_journal_analytics(db, user_id).model_dump(mode="json")).decode()
+            now = datetime.now(UTC)
+            if version is None:
+                insert = pg_insert if _is_postgres(db) else sqlite_insert
+                stmt = (
+                    insert(UserAnalyticsSnapshot)
+                    .values(user_id=user_id, payload=payload, version=0, updated_at=now)
+                    .on_conflict_do_nothing(index_elements=[UserAnalyticsSnapshot.user_id])
+                )
+            else:
+                stmt = (
+                    update(UserAnalyticsSnapshot)
+                    .where(UserAnalyticsSnapshot.user_id == user_id, UserAnalyticsSnapshot.version == version)
+                    .values(payload=payload, updated_at=now)
+                )
+            db.execute(stmt)
+            db.commit()
+        except Exception as exc:
+            db.rollback()
+            logger.logger.error(
+                "Error refreshing journal analytics snapshot", extra={"error": str(exc), "user_id": user_id}
+            )
+
+
+def _expire_analytics_snapshot(db: Session, user_id: int) -> None:
+    """Clear the user's analytics snapshot and bump its version in a journal write's transaction."""
+    insert = pg_insert if _is_postgres(db) else sqlite_insert
+    stmt = insert(UserAnalyticsSnapshot).values(user_id=user_id, payload=None, version=1)
+    stmt = stmt.on_conflict_do_update(
+        index_elements=[UserAnalyticsSnapshot.user_id],
+        set_={"payload": None, "version": UserAnalyticsSnapshot.version + 1},
+    )
+    db.execute(stmt)
+
+
+def _same_month(moment: datetime, now: datetime) -> bool:
+    """Compare the UTC months of ``moment`` and the aware ``now``."""
+    if moment.tzinfo is None:  # SQLite hands back naive UTC values
+        moment = moment.replace(tzinfo=UTC)
+    moment = moment.astimezone(UTC)
+    return (moment.year, moment.month) == (now.year, now.month)
+
+
 @router.get("/analytics/summary", response_model=JournalAnalytics)
-@limiter.limit("10/minute")
+@_ANALYTICS_LIMIT
 async def get_journal_analytics(
-    request: Request, current_user: User = Depends(get_current_user), db: Session = Depends(get_db)
+    request: Request,
+    background_tasks: BackgroundTasks,
+    current_user: User = Depends(get_current_user),
+    db: Session = Depends(get_db),
 ):
     """
     Get comprehensive journal analytics for the user.
 
+    Served from the user's analytics snapshot, which journal writes recompute
+    in the background. While that refresh is pending, or when the snapshot was
+    computed in an earlier month (whose ``entries_this_month`` is stale), the
+    summary is computed inline without writing, and a refresh is scheduled.
+
     Args:
         current_user: Authenticated user
         db: Database session
@@ -693,172 +1052,64 @@ async def get_journal_analytics(
         JournalAnalytics: Analytics data including trends, patterns, and insights
     """
     try:
-        # Get current date info
-        now = datetime.utcnow()
-        current_month_start = now.replace(day=1, hour=0, minute=0, second=0, microsecond=0)
-
-        # Basic counts
-        total_entries = db.query(UserReadingJournal).filter(UserReadingJournal.user_id == current_user.id).count()
-
-        entries_this_month = (
-            db.query(UserReadingJournal)
-            .filter(UserReadingJournal.user_id == current_user.id, UserReadingJournal.created_at >= current_month_start)
-            .count()
-        )
-
-        # Mood trends calculation
-        mood_entries = (
-            db.query(UserReadingJournal)
-            .filter(
-                UserReadingJournal.user_id == current_user.id,
-                UserReadingJournal.mood_before.isnot(None),
-                UserReadingJournal.mood_after.isnot(None),
+        snapshot = db.execute(
+            select(UserAnalyticsSnapshot.payload, UserAnalyticsSnapshot.updated_at).where(
+                UserAnalyticsSnapshot.user_id == current_user.id
             )
-            .all()
-        )
-
-        mood_trends = {}
-        average_mood_improvement = None
-
-        if mood_entries:
-            improvements = []
-            monthly_moods = {}
-
-            for entry in mood_entries:
-                improvement = entry.mood_after - entry.mood_before
-                improvements.append(improvement)
-
-                month_key = entry.created_at.strftime("%Y-%m")
-                if month_key not in monthly_moods:
-                    monthly_moods[month_key] = {"before": [], "after": []}
-
-                monthly_moods[month_key]["before"].append(entry.mood_before)
-                monthly_moods[month_key]["after"].append(entry.mood_after)
-
-            average_mood_improvement = sum(improvements) / len(improvements)
-
-            # Calculate monthly averages
-            mood_trends = {
-                "monthly_averages": {
-                    month: {
-                        "before": sum(data["before"]) / len(data["before"]),
-                        "after": sum(data["after"]) / len(data["after"]),
-                        "improvement": (sum(data["after"]) - sum(data["before"])) / len(data["before"]),
-                    }
-                    for month, data in monthly_moods.items()
-                },
-                "overall_improvement": average_mood_improvement,
-            }
-
-        # Card frequency analysis
-        card_usage = {}
-        for entry in db.query(UserReadingJournal).filter(UserReadingJournal.user_id == current_user.id).all():
-            reading_data = entry.get_reading_data()
-            if isinstance(reading_data, dict) and "cards" in reading_data:
-                for card_data in reading_data["cards"]:
-                    card_name = card_data.get("name", "Unknown")
-                    card_usage[card_name] = card_usage.get(card_name, 0) + 1
-
-        favorite_cards = [
-            {"name": name, "count": count}
-            for name, count in sorted(card_usage.items(), key=lambda x: x[1], reverse=True)[:10]
-        ]
-
-        # Reading frequency by month
-        reading_frequency = {}
-        for entry in db.query(UserReadingJournal).filter(UserReadingJournal.user_id == current_user.id).all():
-            month_key = entry.created_at.strftime("%Y-%m")
-            reading_frequency[month_key] = reading_frequency.get(month_key, 0) + 1
-
-        # Tag usage analysis
-        tag_usage = {}
-        for entry in (
-            db.query(UserReadingJournal)
-            .filter(UserReadingJournal.user_id == current_user.id, UserReadingJournal.tags.isnot(None))
-            .all()
+        ).first()
+        if (
+            snapshot is not None
+            and snapshot.payload is not None
+            and _same_month(snapshot.updated_at, datetime.now(UTC))
         ):
-            for tag in entry.tags or []:
-                tag_usage[tag] = tag_usage.get(tag, 0) + 1
-
-        most_used_tags = [
-            {"tag": tag, "count": count}
-            for tag, count in sorted(tag_usage.items(), key=lambda x: x[1], reverse=True)[:10]
-        ]
-
-        # Follow-up completion rate
-        follow_up_entries = (
-            db.query(UserReadingJournal)
-            .filter(UserReadingJournal.user_id == current_user.id, UserReadingJournal.follow_up_date.isnot(None))
-            .all()
-        )
-
-        follow_up_completion_rate = None
-        if follow_up_entries:
-            completed = sum(1 for entry in follow_up_entries if entry.follow_up_completed)
-            follow_up_completion_rate = completed / len(follow_up_entries)
-
-        # Growth metrics
-        growth_metrics = {
-            "total_readings": total_entries,
-            "monthly_consistency": entries_this_month,
-            "introspection_depth": sum(
-                1
-                for entry in db.query(UserReadingJournal)
-                .filter(UserReadingJournal.user_id == current_user.id, UserReadingJournal.personal_notes.isnot(None))
-                .all()
-            ),
-            "mindfulness_practice": len(mood_entries),
-            "commitment_level": follow_up_completion_rate or 0.0,
-        }
+            payload = snapshot.payload
+        else:
+            payload = _dump_json(_compute_journal_analytics(db, current_user.id).model_dump(mode="json"))
+            background_tasks.add_task(_refresh_analytics_snapshot, current_user.id)
 
-        return JournalAnalytics(
-            total_entries=total_entries,
-            entries_this_month=entries_this_month,
-            favorite_cards=favorite_cards,
-            mood_trends=mood_trends,
-            reading_frequency=reading_frequency,
-            growth_metrics=growth_metrics,
-            average_mood_improvement=average_mood_improvement,
-            most_used_tags=most_used_tags,
-            follow_up_completion_rate=follow_up_completion_rate,
-        )
+        return Response(content=payload, media_type="application/json")
 
     except Exception as e:
+        db.rollback()
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=f"Failed to generate analytics: {str(e)}"
         )
 
 
 @router.get("/analytics/mood-trends")
-@limiter.limit("10/minute")
+@_ANALYTICS_LIMIT
 async def get_mood_trends(
     request: Request, current_user: User = Depends(get_current_user), db: Session = Depends(get_db)
 ):
     """Get mood trends analytics."""
     try:
-        entries = (
-            db.query(UserReadingJournal)
-            .filter(
+        cached, cache_key = await run_in_threadpool(get_cached_analytics, current_user.id, "mood-trends")
+        if cached is not None:
+            return Response(content=cached, media_type="application/json")
+
+        # The day key is formatted by the database; only the three mood columns are fetched
+        moods = db.execute(
+            select(
+                _day_key(db, UserReadingJournal.created_at),
+                UserReadingJournal.mood_before,
+                UserReadingJournal.mood_after,
+            )
+            .where(
                 UserReadingJournal.user_id == current_user.id,
                 or_(UserReadingJournal.mood_before.isnot(None), UserReadingJournal.mood_after.isnot(None)),
             )
             .order_by(UserReadingJournal.created_at)
-            .all()
         )
 
-        mood_data = []
-        for entry in entries:
-            if entry.mood_before is not None or entry.mood_after is not None:
-                mood_data.append(
-                    {
-                        "date": entry.created_at.date().isoformat(),
-                        "mood_before": entry.mood_before,
-                        "mood_after": entry.mood_after,
-                        "improvement": (entry.mood_after - entry.mood_before)
-                        if (entry.mood_before and entry.mood_after)
-                        else None,
-                    }
-                )
+        mood_data = [
+            {
+                "date": day,
+                "mood_before": mood_before,
+                "mood_after": mood_after,
+                "improvement": (mood_after - mood_before) if (mood_before and mood_after) else None,
+            }
+            for day, mood_before, mood_after in moods
+        ]
 
         # Calculate average improvement
         improvements = [entry["improvement"] for entry in mood_data if entry["improvement"] is not None]
@@ -871,12 +1122,15 @@ async def get_mood_trends(
                 mood = entry["mood_before"]
                 mood_distribution[mood] = mood_distribution.get(mood, 0) + 1
 
-        return {
+        mood_trends = {
             "daily_moods": mood_data,
             "mood_trends": mood_data,
             "average_improvement": avg_improvement,
             "mood_distribution": mood_distribution,
         }
+        payload = _dump_json(mood_trends)
+        await run_in_threadpool(set_cached_analytics, cache_key, payload)
+        return Response(content=payload, media_type="application/json")
 
     except Exception as e:
         raise HTTPException(
@@ -885,27 +1139,34 @@ async def get_mood_trends(
 
 
 @router.get("/analytics/card-frequency")
-@limiter.limit("10/minute")
+@_ANALYTICS_LIMIT
 async def get_card_frequency(
     request: Request, current_user: User = Depends(get_current_user), db: Session = Depends(get_db)
 ):
     """Get card frequency analytics."""
     try:
-        entries = db.query(UserReadingJournal).filter(UserReadingJournal.user_id == current_user.id).all()
+        cached, cache_key = await run_in_threadpool(get_cached_analytics, current_user.id, "card-frequency")
+        if cached is not None:
+            return Response(content=cached, media_type="application/json")
+
+        snapshots = (
+            select(UserReadingJournal.reading_snapshot)
+            .where(UserReadingJournal.user_id == current_user.id)
+            .execution_options(yield_per=_ANALYTICS_YIELD_PER)
+        )
 
-        card_counts = {}
-        for entry in entries:
-            if entry.reading_snapshot and "cards" in entry.reading_snapshot:
-                for card in entry.reading_snapshot["cards"]:
-                    card_name = card.get("name", "Unknown")
-                    card_counts[card_name] = card_counts.get(card_name, 0) + 1
+        card_counts = Counter()
+        for batch in db.execute(snapshots).scalars().partitions():
+            card_counts.update(_card_names(batch))
 
         frequency_data = [
-            {"card_name": name, "count": count, "frequency": count}
-            for name, count in sorted(card_counts.items(), key=lambda x: x[1], reverse=True)
+            {"card_name": name, "count": count, "frequency": count} for name, count in card_counts.most_common()
         ]
 
-        return {"most_common_cards": frequency_data, "card_frequency": frequency_data}
+        card_frequency = {"most_common_cards": frequency_data, "card_frequency": frequency_data}
+        payload = _dump_json(card_frequency)
+        await run_in_threadpool(set_cached_analytics, cache_key, payload)
+        return Response(content=payload, media_type="application/json")
 
     except Exception as e:
         raise HTTPException(
@@ -914,7 +1175,7 @@ async def get_card_frequency(
 
 
 @router.get("/analytics/growth-metrics")
-@limiter.limit("10/minute")
+@_ANALYTICS_LIMIT
 async def get_growth_metrics(
     request: Request, current_user: User = Depends(get_current_user), db: Session = Depends(get_db)
 ):
@@ -932,6 +1193,10 @@ async def get_growth_metrics(
         dict: Growth metrics data
     """
     try:
+        cached, cache_key = await run_in_threadpool(get_cached_analytics, current_user.id, "growth-metrics")
+        if cached is not None:
+            return Response(content=cached, media_type="application/json")
+
         # Get entries from the last month
         one_month_ago = datetime.utcnow() - timedelta(days=30)
         entries = (
@@ -956,7 +1221,7 @@ async def get_growth_metrics(
             "introspection_rate": sum(1 for entry in entries if entry.personal_notes) / len(entries) if entries else 0,
         }
 
-        return {
+        growth_metrics = {
             "mood_improvement_trend": growth_data,
             "growth_metrics": growth_data,
             "outcome_satisfaction_trend": growth_data,
@@ -965,6 +1230,9 @@ async def get_growth_metrics(
                 1.0, growth_data["consistency_score"] + growth_data["introspection_rate"]
             ),
         }
+        payload = _dump_json(growth_metrics)
+        await run_in_threadpool(set_cached_analytics, cache_key, payload)
+        return Response(content=payload, media_type="application/json")
 
     except Exception as e:
         raise HTTPException(
@@ -976,7 +1244,7 @@ async def get_growth_metrics(
 
 
 @router.get("/reminders", response_model=list[ReminderResponse])
-@limiter.limit("30/minute")
+@_LIST_LIMIT
 async def get_reminders(
     request: Request,
     pending_only: bool = Query(True, description="Show only pending reminders"),
@@ -995,23 +1263,36 @@ async def get_reminders(
         List[ReminderResponse]: List of reminders
     """
     query = (
-        db.query(ReadingReminder)
-        .options(joinedload(ReadingReminder.journal_entry))
-        .filter(ReadingReminder.user_id == current_user.id)
+        select(
+            *_schema_columns(ReadingReminder, ReminderResponse),
+            *_schema_columns(UserReadingJournal, JournalEntryResponse, prefix="entry__"),
+        )
+        .outerjoin(UserReadingJournal, ReadingReminder.journal_entry_id == UserReadingJournal.id)
+        .where(ReadingReminder.user_id == current_user.id)
     )
 
     if pending_only:
-        query = query.filter(
+        query = query.where(
             ReadingReminder.is_completed.is_(False)
             # Note: Removed date filter to show all pending reminders
         )
 
-    reminders = query.order_by(ReadingReminder.reminder_date).all()
-    return reminders
+    rows = db.execute(query.order_by(ReadingReminder.reminder_date)).all()
+    return [
+        ReminderResponse(
+            **_schema_values(row, ReminderResponse),
+            journal_entry=(
+                JournalEntryResponse(**_schema_values(row, JournalEntryResponse, prefix="entry__"))
+                if row.entry__id is not None
+                else None
+            ),
+        )
+        for row in rows
+    ]
 
 
 @router.post("/reminders", response_model=ReminderResponse, status_code=status.HTTP_201_CREATED)
-@limiter.limit("5/minute")
+@_STRICT_WRITE_LIMIT
 async def create_reminder(
     request: Request,
     reminder: ReminderCreate,
@@ -1041,21 +1322,25 @@ async def create_reminder(
 
     db_reminder = ReadingReminder(
         user_id=current_user.id,
-        journal_entry_id=reminder.journal_entry_id,
+        journal_entry=journal_entry,
         reminder_type=reminder.reminder_type,
         reminder_date=reminder.reminder_date,
         message=reminder.message,
     )
 
     db.add(db_reminder)
+    db.flush()
+
+    # The embedded journal entry is the one loaded above, and the flush fetched
+    # created_at, so the response needs no reload after the commit.
+    created = ReminderResponse.model_validate(db_reminder)
     db.commit()
-    db.refresh(db_reminder)
 
-    return db_reminder
+    return created
 
 
 @router.put("/reminders/{reminder_id}")
-@limiter.limit("10/minute")
+@_WRITE_LIMIT
 async def update_reminder(
     request: Request,
     reminder_id: int,
@@ -1075,27 +1360,29 @@ async def update_reminder(
     Returns:
         dict: Success message
     """
-    reminder = (
-        db.query(ReadingReminder)
-        .filter(ReadingReminder.id == reminder_id, ReadingReminder.user_id == current_user.id)
-        .first()
-    )
-
-    if not reminder:
-        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Reminder not found")
-
-        # Update fields from reminder_data
+    # Ownership check and update in one statement; RETURNING reports the row it touched
+    owned = and_(ReadingReminder.id == reminder_id, ReadingReminder.user_id == current_user.id)
     if "is_completed" in reminder_data:
-        reminder.is_completed = reminder_data["is_completed"]
+        stmt = (
+            update(ReadingReminder)
+            .where(owned)
+            .values(is_completed=reminder_data["is_completed"])
+            .returning(ReadingReminder.is_completed)
+        )
+    else:
+        stmt = select(ReadingReminder.is_completed).where(owned)
+    row = db.execute(stmt).first()
+    if row is None:
+        db.rollback()
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Reminder not found")
 
     db.commit()
-    db.refresh(reminder)
 
-    return {"message": "Reminder updated successfully", "is_completed": reminder.is_completed, "id": reminder.id}
+    return {"message": "Reminder updated successfully", "is_completed": row.is_completed, "id": reminder_id}
 
 
 @router.delete("/reminders/{reminder_id}", status_code=status.HTTP_204_NO_CONTENT)
-@limiter.limit("5/minute")
+@_STRICT_WRITE_LIMIT
 async def delete_reminder(
     request: Request, reminder_id: int, current_user: User = Depends(get_current_user), db: Session = Depends(get_db)
 ):
@@ -1110,16 +1397,12 @@ async def delete_reminder(
     Returns:
         dict: Success message
     """
-    reminder = (
-        db.query(ReadingReminder)
-        .filter(ReadingReminder.id == reminder_id, ReadingReminder.user_id == current_user.id)
-        .first()
-    )
-
-    if not reminder:
+    deleted = db.execute(
+        delete(ReadingReminder).where(ReadingReminder.id == reminder_id, ReadingReminder.user_id == current_user.id)
+    ).rowcount
+    if not deleted:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Reminder not found")
 
-    db.delete(reminder)
     db.commit()
 
     return {"message": "Reminder deleted successfully"}
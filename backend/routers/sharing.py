@@ -1,9 +1,13 @@
-from datetime import datetime, timedelta
+from datetime import UTC, datetime, timedelta
 
-from fastapi import APIRouter, Depends, Request
-from sqlalchemy import desc, func
+from fastapi import APIRouter, BackgroundTasks, Depends, Request, Response
+from fastapi.concurrency import run_in_threadpool
+from pydantic import TypeAdapter
+from pydantic import ValidationError as PydanticValidationError
+from sqlalchemy import desc, func, or_, update
 from sqlalchemy.orm import Session
 
+from config import settings
 from database import get_db
 from models import SharedReading, User
 from routers.auth import get_current_user
@@ -14,11 +18,39 @@ from schemas import (
     SharedReadingResponse,
     SharedReadingStatsResponse,
 )
+from services.shared_reading_cache import (
+    SHARED_READING_CACHE_TTL,
+    get_cached_shared_reading,
+    invalidate_shared_reading,
+    set_cached_shared_reading,
+)
 from utils.error_handlers import ResourceNotFoundError, TarotAPIException, ValidationError, logger
+from utils.etag import etag_matches
 from utils.rate_limiter import RATE_LIMITS, limiter
 
 router = APIRouter(prefix="/api/sharing", tags=["sharing"])
 
+_CARDS_ADAPTER = TypeAdapter(list[CardResponse])
+_LIST_ADAPTER = TypeAdapter(list[SharedReadingListResponse])
+
+
+def _load_cards(shared_reading: SharedReading) -> list[CardResponse]:
+    """Parse the stored cards, or return an empty list if the stored JSON is malformed."""
+    if not shared_reading.cards_data:
+        return []
+    try:
+        return _CARDS_ADAPTER.validate_json(shared_reading.cards_data)
+    except PydanticValidationError as e:
+        logger.logger.warning(
+            "Stored cards of shared reading are invalid", extra={"uuid": shared_reading.uuid, "error": str(e)}
+        )
+        return []
+
+
+def _encode_shared_reading_list(rows) -> bytes:
+    """Encode listed rows in one pydantic-core call, exactly as the response model serializes them."""
+    return _LIST_ADAPTER.dump_json(_LIST_ADAPTER.validate_python(rows, from_attributes=True))
+
 
 @router.post("/create", response_model=dict)
 @limiter.limit(RATE_LIMITS["auth"])
@@ -46,78 +78,97 @@ async def create_shared_reading(
         ValidationError: If the data is invalid
         TarotAPIException: If creation fails
     """
+    # Validate the cards data
+    if not sharing_data.cards:
+        raise ValidationError(message="At least one card is required", details={"cards": "Cannot create empty reading"})
+
+    # Calculate expiration if specified
+    expires_at = None
+    if sharing_data.expires_in_days:
+        expires_at = datetime.now(UTC) + timedelta(days=sharing_data.expires_in_days)
+
+    # Create shared reading
+    shared_reading = SharedReading(
+        title=sharing_data.title,
+        concern=sharing_data.concern,
+        spread_name=sharing_data.spread_name,
+        deck_name=sharing_data.deck_name,
+        expires_at=expires_at,
+        user_id=current_user.id,
+        creator_username=current_user.username,
+    )
+    # Serialized by pydantic straight to JSON text, skipping per-field dict building
+    shared_reading.cards_data = _CARDS_ADAPTER.dump_json(sharing_data.cards).decode()
+
+    # Only the database write can fail past validation
     try:
-        # Validate the cards data
-        if not sharing_data.cards or len(sharing_data.cards) == 0:
-            raise ValidationError(
-                message="At least one card is required", details={"cards": "Cannot create empty reading"}
-            )
-
-        # Convert cards to JSON-serializable format
-        cards_data = []
-        for card in sharing_data.cards:
-            card_dict = {
-                "name": card.name,
-                "orientation": card.orientation,
-                "meaning": card.meaning,
-                "image_url": card.image_url,
-                "position": card.position,
-                "position_index": card.position_index,
-            }
-            cards_data.append(card_dict)
-
-        # Calculate expiration if specified
-        expires_at = None
-        if sharing_data.expires_in_days:
-            expires_at = datetime.utcnow() + timedelta(days=sharing_data.expires_in_days)
-
-        # Create shared reading
-        shared_reading = SharedReading(
-            title=sharing_data.title,
-            concern=sharing_data.concern,
-            spread_name=sharing_data.spread_name,
-            deck_name=sharing_data.deck_name,
-            expires_at=expires_at,
-            user_id=current_user.id,
-        )
-        shared_reading.set_cards_data(cards_data)
-
         db.add(shared_reading)
+        # The uuid is generated client-side at flush, so the response needs no refresh SELECT after commit
+        db.flush()
+        shared_uuid = shared_reading.uuid
         db.commit()
-        db.refresh(shared_reading)
+    except Exception as e:
+        db.rollback()
+        logger.logger.error("Error creating shared reading", extra={"user_id": current_user.id, "error": str(e)})
+        raise TarotAPIException(message="Error creating shared reading", details={"error": str(e)})
 
-        # Get base URL from request
-        base_url = str(request.base_url).rstrip("/")
-        sharing_url = f"{base_url}/shared/{shared_reading.uuid}"
+    # Configured once at startup; only derived from the request when unset
+    base_url = settings.SHARING_BASE_URL or str(request.base_url).rstrip("/")
+    sharing_url = f"{base_url}/shared/{shared_uuid}"
 
-        logger.logger.info(
-            "Shared reading created",
-            extra={"user_id": current_user.id, "shared_reading_uuid": shared_reading.uuid, "title": sharing_data.title},
-        )
+    logger.logger.info(
+        "Shared reading created",
+        extra={"user_id": current_user.id, "shared_reading_uuid": shared_uuid, "title": sharing_data.title},
+    )
 
-        return {
-            "uuid": shared_reading.uuid,
-            "sharing_url": sharing_url,
-            "expires_at": shared_reading.expires_at.isoformat() if shared_reading.expires_at else None,
-            "message": "Reading shared successfully",
-        }
+    return {
+        "uuid": shared_uuid,
+        "sharing_url": sharing_url,
+        "expires_at": expires_at.isoformat() if expires_at else None,
+        "message": "Reading shared successfully",
+    }
 
-    except ValidationError:
-        raise
+
+def _shared_reading_etag(uuid: str, created_at: datetime) -> str:
+    """Weak validator for a shared reading; the view count is deliberately not part of it."""
+    return f'W/"{uuid}:{int(created_at.timestamp())}"'
+
+
+def _record_shared_reading_view(db: Session, uuid: str) -> None:
+    """Increment a shared reading's view count after the response is sent."""
+    try:
+        # Incremented in the database so concurrent views can't overwrite each other
+        view_count = db.execute(
+            update(SharedReading)
+            .where(SharedReading.uuid == uuid)
+            .values(view_count=func.coalesce(SharedReading.view_count, 0) + 1)
+            .returning(SharedReading.view_count)
+            .execution_options(synchronize_session=False)
+        ).scalar_one_or_none()
+        db.commit()
+        logger.logger.info("Shared reading viewed", extra={"shared_reading_uuid": uuid, "view_count": view_count})
     except Exception as e:
-        logger.logger.error("Error creating shared reading", extra={"user_id": current_user.id, "error": str(e)})
-        raise TarotAPIException(message="Error creating shared reading", details={"error": str(e)})
+        db.rollback()
+        logger.logger.error("Error recording shared reading view", extra={"uuid": uuid, "error": str(e)})
 
 
 @router.get("/{uuid}", response_model=SharedReadingResponse)
-async def get_shared_reading(uuid: str, db: Session = Depends(get_db)):
+async def get_shared_reading(
+    uuid: str, request: Request, background_tasks: BackgroundTasks, db: Session = Depends(get_db)
+):
     """
     Get Shared Reading
 
     Retrieve a shared reading by its UUID. Increments view count.
 
+    Responses carry a weak ``ETag`` and are cached briefly, both in Redis and by
+    clients; a matching ``If-None-Match`` gets ``304 Not Modified``. The view
+    count is incremented in a background task after the response is sent.
+
     Args:
         uuid (str): UUID of the shared reading
+        request (Request): FastAPI request object
+        background_tasks (BackgroundTasks): Runs the view count increment
         db (Session): Database session
 
     Returns:
@@ -127,46 +178,60 @@ async def get_shared_reading(uuid: str, db: Session = Depends(get_db)):
         ResourceNotFoundError: If reading not found or expired
     """
     try:
-        # Get shared reading
-        shared_reading = (
-            db.query(SharedReading).filter(SharedReading.uuid == uuid, SharedReading.is_public.is_(True)).first()
-        )
-
-        if not shared_reading:
-            raise ResourceNotFoundError(message="Shared reading not found", details={"uuid": uuid})
-
-        # Check if expired
-        if shared_reading.expires_at and shared_reading.expires_at < datetime.utcnow():
-            raise ResourceNotFoundError(
-                message="Shared reading has expired",
-                details={"uuid": uuid, "expired_at": shared_reading.expires_at.isoformat()},
+        cached = await run_in_threadpool(get_cached_shared_reading, uuid)
+        if cached:
+            etag, body = cached
+        else:
+            # A single-row lookup: the creator's username is stored on the reading, and
+            # expired readings are filtered out by the database clock and never leave it
+            shared_reading = (
+                db.query(SharedReading)
+                .filter(
+                    SharedReading.uuid == uuid,
+                    SharedReading.is_public.is_(True),
+                    or_(SharedReading.expires_at.is_(None), SharedReading.expires_at > func.now()),
+                )
+                .first()
             )
 
-        # Increment view count
-        shared_reading.increment_view_count()
-        db.commit()
+            if not shared_reading:
+                raise ResourceNotFoundError(message="Shared reading not found", details={"uuid": uuid})
+
+            # Parse and validate the stored JSON in one pass
+            cards = _load_cards(shared_reading)
+
+            shared_reading_response = SharedReadingResponse(
+                uuid=shared_reading.uuid,
+                title=shared_reading.title,
+                concern=shared_reading.concern,
+                cards=cards,
+                spread_name=shared_reading.spread_name,
+                deck_name=shared_reading.deck_name,
+                created_at=shared_reading.created_at,
+                expires_at=shared_reading.expires_at,
+                is_public=shared_reading.is_public,
+                # Counts the view being served; the increment itself runs in the background
+                view_count=(shared_reading.view_count or 0) + 1,
+                creator_username=shared_reading.creator_username,
+            )
+            body = shared_reading_response.model_dump_json().encode()
+            etag = _shared_reading_etag(shared_reading.uuid, shared_reading.created_at)
 
-        # Parse cards data
-        cards_data = shared_reading.get_cards_data()
-        cards = [CardResponse(**card) for card in cards_data]
+            # Never cache a reading past its expiry
+            ttl = SHARED_READING_CACHE_TTL
+            if shared_reading.expires_at:
+                expires_at = shared_reading.expires_at
+                if expires_at.tzinfo is None:  # SQLite hands back naive UTC values
+                    expires_at = expires_at.replace(tzinfo=UTC)
+                ttl = min(ttl, int((expires_at - datetime.now(UTC)).total_seconds()))
+            await run_in_threadpool(set_cached_shared_reading, uuid, etag, body, ttl)
 
-        logger.logger.info(
-            "Shared reading viewed", extra={"shared_reading_uuid": uuid, "view_count": shared_reading.view_count}
-        )
+        background_tasks.add_task(_record_shared_reading_view, db, uuid)
 
-        return SharedReadingResponse(
-            uuid=shared_reading.uuid,
-            title=shared_reading.title,
-            concern=shared_reading.concern,
-            cards=cards,
-            spread_name=shared_reading.spread_name,
-            deck_name=shared_reading.deck_name,
-            created_at=shared_reading.created_at,
-            expires_at=shared_reading.expires_at,
-            is_public=shared_reading.is_public,
-            view_count=shared_reading.view_count,
-            creator_username=shared_reading.user.username,
-        )
+        headers = {"ETag": etag, "Cache-Control": f"public, max-age={SHARED_READING_CACHE_TTL}"}
+        if etag_matches(request.headers.get("if-none-match"), etag):
+            return Response(status_code=304, headers=headers)
+        return Response(content=body, media_type="application/json", headers=headers)
 
     except ResourceNotFoundError:
         raise
@@ -194,8 +259,15 @@ async def get_user_shared_readings(
         List[SharedReadingListResponse]: List of user's shared readings
     """
     try:
+        # Only the listed columns; skips loading cards_data and ORM identity-map bookkeeping
         shared_readings = (
-            db.query(SharedReading)
+            db.query(
+                SharedReading.uuid,
+                SharedReading.title,
+                SharedReading.created_at,
+                SharedReading.view_count,
+                SharedReading.is_public,
+            )
             .filter(SharedReading.user_id == current_user.id)
             .order_by(desc(SharedReading.created_at))
             .offset(offset)
@@ -203,16 +275,7 @@ async def get_user_shared_readings(
             .all()
         )
 
-        return [
-            SharedReadingListResponse(
-                uuid=reading.uuid,
-                title=reading.title,
-                created_at=reading.created_at,
-                view_count=reading.view_count,
-                is_public=reading.is_public,
-            )
-            for reading in shared_readings
-        ]
+        return Response(content=_encode_shared_reading_list(shared_readings), media_type="application/json")
 
     except Exception as e:
         logger.logger.error(
@@ -253,6 +316,7 @@ async def delete_shared_reading(
 
         db.delete(shared_reading)
         db.commit()
+        await run_in_threadpool(invalidate_shared_reading, uuid)
 
         logger.logger.info("Shared reading deleted", extra={"user_id": current_user.id, "shared_reading_uuid": uuid})
 
@@ -282,38 +346,37 @@ async def get_user_sharing_stats(current_user: User = Depends(get_current_user),
         SharedReadingStatsResponse: Statistics about shared readings
     """
     try:
-        # Get total count and total views
-        stats = (
+        # Totals ride along as window aggregates on the most viewed row: one query, one index scan
+        most_viewed_reading = (
             db.query(
-                func.count(SharedReading.id).label("total_shared"),
-                func.sum(SharedReading.view_count).label("total_views"),
+                func.count().over().label("total_shared"),
+                func.sum(SharedReading.view_count).over().label("total_views"),
+                SharedReading.uuid,
+                SharedReading.title,
+                SharedReading.created_at,
+                SharedReading.view_count,
+                SharedReading.is_public,
             )
             .filter(SharedReading.user_id == current_user.id)
+            .order_by(desc(SharedReading.view_count))
+            .limit(1)
             .first()
         )
 
-        total_shared = stats.total_shared or 0
-        total_views = stats.total_views or 0
-
-        # Get most viewed reading
+        total_shared = 0
+        total_views = 0
         most_viewed = None
-        if total_shared > 0:
-            most_viewed_reading = (
-                db.query(SharedReading)
-                .filter(SharedReading.user_id == current_user.id)
-                .order_by(desc(SharedReading.view_count))
-                .first()
+        if most_viewed_reading:
+            total_shared = most_viewed_reading.total_shared
+            total_views = most_viewed_reading.total_views or 0
+            most_viewed = SharedReadingListResponse(
+                uuid=most_viewed_reading.uuid,
+                title=most_viewed_reading.title,
+                created_at=most_viewed_reading.created_at,
+                view_count=most_viewed_reading.view_count,
+                is_public=most_viewed_reading.is_public,
             )
 
-            if most_viewed_reading:
-                most_viewed = SharedReadingListResponse(
-                    uuid=most_viewed_reading.uuid,
-                    title=most_viewed_reading.title,
-                    created_at=most_viewed_reading.created_at,
-                    view_count=most_viewed_reading.view_count,
-                    is_public=most_viewed_reading.is_public,
-                )
-
         return SharedReadingStatsResponse(total_shared=total_shared, total_views=total_views, most_viewed=most_viewed)
 
     except Exception as e:
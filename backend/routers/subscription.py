@@ -1,13 +1,16 @@
-import json
 from datetime import datetime, timedelta
+from functools import lru_cache
 
-from fastapi import APIRouter, Depends, HTTPException, Request, status
-from sqlalchemy import desc
+import orjson
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, Request, Response, status
+from fastapi.concurrency import run_in_threadpool
+from pydantic import TypeAdapter
+from sqlalchemy import Numeric, and_, case, cast, desc, func, or_, select
 from sqlalchemy.orm import Session
 
 from config import settings
 from database import get_db
-from models import PaymentTransaction, SubscriptionEvent, SubscriptionPlan, TurnUsageHistory, User
+from models import PaymentTransaction, SubscriptionEvent, TurnUsageDaily, TurnUsageHistory, User, WebhookInbox
 from routers.auth import get_current_user
 from schemas import (
     CheckoutRequest,
@@ -23,24 +26,32 @@ from schemas import (
     TurnUsageHistoryResponse,
 )
 from services.ethereum_service import EthereumService
-from services.subscription_service import SubscriptionService
+from services.plan_catalog import get_active_plans
+from services.subscription_service import apply_stored_webhook, get_subscription_service
+from utils.idempotency import check_and_set_idempotency_key, release_idempotency_key
 from utils.logging import logger
 from utils.metrics import record_payment_event
+from utils.middleware import get_request_now
 
 router = APIRouter(prefix="/api", tags=["subscription"])
-subscription_service = SubscriptionService()
+subscription_service = get_subscription_service()
 ethereum_service = EthereumService()
 
+# Validate and encode whole result lists in one pydantic-core call instead of row by row
+_EVENTS_ADAPTER = TypeAdapter(list[SubscriptionEventResponse])
+_TRANSACTIONS_ADAPTER = TypeAdapter(list[PaymentTransactionResponse])
+_USAGE_ADAPTER = TypeAdapter(list[TurnUsageHistoryResponse])
+_PLANS_ADAPTER = TypeAdapter(list[SubscriptionPlanResponse])
 
-def _extract_lemon_squeezy_amount_usd(event_data: dict) -> float:
-    attributes = event_data.get("data", {}).get("attributes", {})
-    total_cents = attributes.get("total") or 0
-    try:
-        return float(total_cents) / 100
-    except (TypeError, ValueError):
-        return 0.0
+# Product details are static, so the products response is built once
+_AVAILABLE_PRODUCTS = {
+    "products": [
+        {"variant": variant, **subscription_service.get_product_info(variant)} for variant in ("10_turns", "20_turns")
+    ]
+}
 
 
+@lru_cache(maxsize=32)
 def _product_amount_usd(product_variant: str) -> float:
     try:
         price = subscription_service.get_product_info(product_variant).get("price", "")
@@ -52,13 +63,11 @@ def _product_amount_usd(product_variant: str) -> float:
 @router.get("/user/turns", response_model=TurnsResponse)
 async def get_user_turns(current_user: User = Depends(get_current_user), db: Session = Depends(get_db)):
     """Get the user's current turn counts and subscription status."""
-    # Check and reset free turns if needed
-    subscription_service.check_and_reset_free_turns(db, current_user)
+    # Check and reset free turns if needed (a blocking DB write, so off the event loop). A reset
+    # commits, which expires current_user so the values below are reloaded; otherwise they are current.
+    await run_in_threadpool(subscription_service.check_and_reset_free_turns, db, current_user)
 
-    # Refresh user from database to get updated values
-    db.refresh(current_user)
-
-    return TurnsResponse(
+    turns = TurnsResponse(
         number_of_free_turns=current_user.number_of_free_turns or 0,
         number_of_paid_turns=current_user.number_of_paid_turns or 0,
         total_turns=current_user.get_total_turns(),
@@ -66,6 +75,8 @@ async def get_user_turns(current_user: User = Depends(get_current_user), db: Ses
         is_specialized_premium=current_user.is_specialized_premium or False,
         last_free_turns_reset=current_user.last_free_turns_reset,
     )
+    # Already validated; encode it directly rather than through response_model again
+    return Response(content=turns.model_dump_json(), media_type="application/json")
 
 
 @router.get("/user/subscription", response_model=SubscriptionResponse)
@@ -118,48 +129,74 @@ async def create_checkout_session(
         )
 
 
-@router.post("/webhooks/lemon-squeezy")
-async def handle_lemon_squeezy_webhook(request: Request, db: Session = Depends(get_db)):
-    """Handle webhook events from Lemon Squeezy."""
+@router.post("/webhooks/lemon-squeezy", status_code=status.HTTP_202_ACCEPTED)
+async def handle_lemon_squeezy_webhook(
+    request: Request, background_tasks: BackgroundTasks, db: Session = Depends(get_db)
+):
+    """Handle webhook events from Lemon Squeezy.
+
+    A verified event is stored in the webhook inbox and acknowledged with 202;
+    it is applied in a background task after the response is sent, and the
+    ``replay_pending_webhooks`` maintenance task retries any the background task
+    did not finish. Redeliveries of an already accepted payload are acknowledged
+    without touching the database.
+    """
     event_name = "webhook_received"
+    replay_key = None
+    stored = False
     try:
-        # Get the raw payload
-        payload = await request.body()
-
         # Get the signature from headers
         signature = request.headers.get("x-signature")
         if not signature:
             record_payment_event(settings.FASTAPI_ENV, "lemon_squeezy", event_name, "signature_error")
             raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Missing signature")
 
+        # Read the raw payload, hashing each chunk as it arrives rather than in a second pass
+        mac = subscription_service.new_webhook_mac()
+        chunks = []
+        async for chunk in request.stream():
+            chunks.append(chunk)
+            if mac is not None:
+                mac.update(chunk)
+        payload = b"".join(chunks)
+
         # Verify the webhook signature
-        if not subscription_service.verify_webhook_signature(payload, signature):
+        if not subscription_service.verify_webhook_mac(mac, signature):
             record_payment_event(settings.FASTAPI_ENV, "lemon_squeezy", event_name, "signature_error")
             raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid signature")
 
         # Parse the JSON payload
-        event_data = json.loads(payload)
+        event_data = orjson.loads(payload)
         event_name = event_data.get("meta", {}).get("event_name", "unknown")
         record_payment_event(settings.FASTAPI_ENV, "lemon_squeezy", event_name, "received")
 
-        # Process the webhook event
-        subscription_service.process_webhook_event(db, event_data)
-        record_payment_event(
-            settings.FASTAPI_ENV,
-            provider="lemon_squeezy",
-            event_type=event_name,
-            status="paid" if event_name == "order_created" else "success",
-            amount_usd=_extract_lemon_squeezy_amount_usd(event_data),
-        )
+        # Lemon Squeezy sends no event id, but a retry carries the same body and therefore the same signature
+        replay_key = f"ls:evt:{signature.lower()}"
+        if not await run_in_threadpool(check_and_set_idempotency_key, replay_key):
+            record_payment_event(settings.FASTAPI_ENV, "lemon_squeezy", event_name, "duplicate")
+            return {"status": "duplicate"}
 
-        return {"status": "success"}
+        # Store the event before acknowledging it: Lemon Squeezy won't redeliver after a 2xx
+        inbox = WebhookInbox(provider="lemon_squeezy", event_name=event_name, payload=event_data)
+        db.add(inbox)
+        await run_in_threadpool(db.flush)
+        inbox_id = inbox.id  # read before the commit expires it, so no refresh runs on the event loop
+        await run_in_threadpool(db.commit)
+        stored = True
+        background_tasks.add_task(apply_stored_webhook, inbox_id)
 
-    except json.JSONDecodeError:
+        return {"status": "accepted"}
+
+    except orjson.JSONDecodeError:
         record_payment_event(settings.FASTAPI_ENV, "lemon_squeezy", event_name, "invalid_json")
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid JSON payload")
     except HTTPException:
         raise
     except Exception:
+        db.rollback()
+        if replay_key is not None and not stored:
+            # Let Lemon Squeezy's retry through since this delivery was never stored
+            await run_in_threadpool(release_idempotency_key, replay_key)
         record_payment_event(settings.FASTAPI_ENV, "lemon_squeezy", event_name, "error")
         raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="Failed to process webhook")
 
@@ -167,18 +204,13 @@ async def handle_lemon_squeezy_webhook(request: Request, db: Session = Depends(g
 @router.get("/subscription/products")
 async def get_available_products():
     """Get the list of available subscription products."""
-    return {
-        "products": [
-            {"variant": "10_turns", **subscription_service.get_product_info("10_turns")},
-            {"variant": "20_turns", **subscription_service.get_product_info("20_turns")},
-        ]
-    }
+    return _AVAILABLE_PRODUCTS
 
 
 @router.post("/user/consume-turn")
 async def consume_turn(current_user: User = Depends(get_current_user), db: Session = Depends(get_db)):
     """Consume a turn for the current user."""
-    result = subscription_service.consume_user_turn(db, current_user, usage_context='subscription')
+    result = await run_in_threadpool(subscription_service.consume_user_turn, db, current_user, "subscription")
 
     if not result.success:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="No turns available")
@@ -193,7 +225,7 @@ async def process_ethereum_payment(
     """Process an Ethereum payment for subscription turns with blockchain verification."""
     try:
         # Check if Ethereum service is available
-        if not ethereum_service.is_connected():
+        if not await run_in_threadpool(ethereum_service.is_connected):
             record_payment_event(settings.FASTAPI_ENV, "ethereum", "ethereum_payment", "service_unavailable")
             raise HTTPException(
                 status_code=status.HTTP_503_SERVICE_UNAVAILABLE, detail="Ethereum verification service is unavailable"
@@ -201,8 +233,9 @@ async def process_ethereum_payment(
 
         logger.info(f"Processing Ethereum payment: {request.transaction_hash} for user {current_user.id}")
 
-        # Process the payment using the Ethereum service
-        result = ethereum_service.process_ethereum_payment(
+        # Process the payment using the Ethereum service; its blockchain RPCs block, so run it in the threadpool
+        result = await run_in_threadpool(
+            ethereum_service.process_ethereum_payment,
             db=db,
             user=current_user,
             transaction_hash=request.transaction_hash,
@@ -243,27 +276,66 @@ async def process_ethereum_payment(
 
 
 # --- Subscription History Endpoints ---
+# These only run blocking ORM queries, so they are plain ``def`` endpoints: FastAPI
+# runs them in its threadpool and a slow query no longer stalls the event loop. The
+# combined history endpoint dispatches its queries to the threadpool itself.
+#
+# The list endpoints page newest first. Besides ``offset`` they accept the opaque
+# ``cursor`` returned in the ``X-Next-Cursor`` header of a full page; it resumes
+# after the last row seen via the (user_id, timestamp DESC) index instead of
+# scanning and discarding ``offset`` rows.
+
+
+def _parse_history_cursor(cursor: str) -> tuple[datetime, int]:
+    """Split an ``X-Next-Cursor`` value into the ``(timestamp, id)`` of the last row seen."""
+    timestamp, _, row_id = cursor.rpartition("|")
+    try:
+        return datetime.fromisoformat(timestamp), int(row_id)
+    except ValueError:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid pagination cursor")
+
+
+def _history_page(query, timestamp_column, id_column, cursor, offset: int, limit: int) -> list:
+    """Return one newest-first page of ``query``, seeking past ``cursor`` when given."""
+    if cursor is not None:
+        timestamp, row_id = cursor
+        query = query.filter(or_(timestamp_column < timestamp, and_(timestamp_column == timestamp, id_column < row_id)))
+    query = query.order_by(desc(timestamp_column), desc(id_column))
+    if cursor is None:
+        query = query.offset(offset)
+    return query.limit(limit).all()
+
+
+def _history_response(adapter: TypeAdapter, rows: list, timestamp_attr: str, limit: int) -> Response:
+    """Encode a page of rows, advertising the next cursor when the page came back full."""
+    headers = {}
+    if rows and len(rows) == limit:
+        last = rows[-1]
+        headers["X-Next-Cursor"] = f"{getattr(last, timestamp_attr).isoformat()}|{last.id}"
+    content = adapter.dump_json(adapter.validate_python(rows, from_attributes=True))
+    return Response(content=content, media_type="application/json", headers=headers)
 
 
 @router.get("/user/subscription/events", response_model=list[SubscriptionEventResponse])
-async def get_user_subscription_events(
+def get_user_subscription_events(
     current_user: User = Depends(get_current_user),
     db: Session = Depends(get_db),
     limit: int = 50,
     offset: int = 0,
+    cursor: str | None = None,
 ):
     """Get the user's subscription events history."""
+    position = _parse_history_cursor(cursor) if cursor else None
     try:
-        events = (
-            db.query(SubscriptionEvent)
-            .filter(SubscriptionEvent.user_id == current_user.id)
-            .order_by(desc(SubscriptionEvent.created_at))
-            .offset(offset)
-            .limit(limit)
-            .all()
+        events = _history_page(
+            db.query(SubscriptionEvent).filter(SubscriptionEvent.user_id == current_user.id),
+            SubscriptionEvent.created_at,
+            SubscriptionEvent.id,
+            position,
+            offset,
+            limit,
         )
-
-        return [SubscriptionEventResponse.model_validate(event) for event in events]
+        return _history_response(_EVENTS_ADAPTER, events, "created_at", limit)
 
     except Exception as e:
         logger.error(f"Error retrieving subscription events for user {current_user.id}: {e}")
@@ -273,24 +345,25 @@ async def get_user_subscription_events(
 
 
 @router.get("/user/subscription/transactions", response_model=list[PaymentTransactionResponse])
-async def get_user_payment_transactions(
+def get_user_payment_transactions(
     current_user: User = Depends(get_current_user),
     db: Session = Depends(get_db),
     limit: int = 50,
     offset: int = 0,
+    cursor: str | None = None,
 ):
     """Get the user's payment transaction history."""
+    position = _parse_history_cursor(cursor) if cursor else None
     try:
-        transactions = (
-            db.query(PaymentTransaction)
-            .filter(PaymentTransaction.user_id == current_user.id)
-            .order_by(desc(PaymentTransaction.created_at))
-            .offset(offset)
-            .limit(limit)
-            .all()
+        transactions = _history_page(
+            db.query(PaymentTransaction).filter(PaymentTransaction.user_id == current_user.id),
+            PaymentTransaction.created_at,
+            PaymentTransaction.id,
+            position,
+            offset,
+            limit,
         )
-
-        return [PaymentTransactionResponse.model_validate(transaction) for transaction in transactions]
+        return _history_response(_TRANSACTIONS_ADAPTER, transactions, "created_at", limit)
 
     except Exception as e:
         logger.error(f"Error retrieving payment transactions for user {current_user.id}: {e}")
@@ -300,31 +373,33 @@ async def get_user_payment_transactions(
 
 
 @router.get("/user/subscription/turn-usage", response_model=list[TurnUsageHistoryResponse])
-async def get_user_turn_usage_history(
+def get_user_turn_usage_history(
     current_user: User = Depends(get_current_user),
     db: Session = Depends(get_db),
     limit: int = 100,
     offset: int = 0,
     days: int = 30,
+    cursor: str | None = None,
+    now: datetime = Depends(get_request_now),
 ):
     """Get the user's turn usage history for the specified number of days."""
+    position = _parse_history_cursor(cursor) if cursor else None
     try:
         # Calculate date threshold
-        date_threshold = datetime.utcnow() - timedelta(days=days)
+        date_threshold = now - timedelta(days=days)
 
-        usage_history = (
-            db.query(TurnUsageHistory)
-            .filter(
+        usage_history = _history_page(
+            db.query(TurnUsageHistory).filter(
                 TurnUsageHistory.user_id == current_user.id,
                 TurnUsageHistory.consumed_at >= date_threshold,
-            )
-            .order_by(desc(TurnUsageHistory.consumed_at))
-            .offset(offset)
-            .limit(limit)
-            .all()
+            ),
+            TurnUsageHistory.consumed_at,
+            TurnUsageHistory.id,
+            position,
+            offset,
+            limit,
         )
-
-        return [TurnUsageHistoryResponse.model_validate(usage) for usage in usage_history]
+        return _history_response(_USAGE_ADAPTER, usage_history, "consumed_at", limit)
 
     except Exception as e:
         logger.error(f"Error retrieving turn usage history for user {current_user.id}: {e}")
@@ -334,17 +409,10 @@ async def get_user_turn_usage_history(
 
 
 @router.get("/subscription/plans", response_model=list[SubscriptionPlanResponse])
-async def get_subscription_plans(db: Session = Depends(get_db)):
+def get_subscription_plans(db: Session = Depends(get_db)):
     """Get all available subscription plans."""
     try:
-        plans = (
-            db.query(SubscriptionPlan)
-            .filter(SubscriptionPlan.is_active.is_(True))
-            .order_by(SubscriptionPlan.sort_order, SubscriptionPlan.turns_included)
-            .all()
-        )
-
-        return [SubscriptionPlanResponse.model_validate(plan) for plan in plans]
+        return Response(content=_PLANS_ADAPTER.dump_json(get_active_plans(db)), media_type="application/json")
 
     except Exception as e:
         logger.error(f"Error retrieving subscription plans: {e}")
@@ -353,6 +421,78 @@ async def get_subscription_plans(db: Session = Depends(get_db)):
         )
 
 
+def _events_query(user_id: int, limit: int):
+    return (
+        select(SubscriptionEvent)
+        .where(SubscriptionEvent.user_id == user_id)
+        .order_by(desc(SubscriptionEvent.created_at))
+        .limit(limit)
+    )
+
+
+def _transactions_query(user_id: int, limit: int):
+    return (
+        select(PaymentTransaction)
+        .where(PaymentTransaction.user_id == user_id)
+        .order_by(desc(PaymentTransaction.created_at))
+        .limit(limit)
+    )
+
+
+def _turn_usage_query(user_id: int, since: datetime, limit: int):
+    return (
+        select(TurnUsageHistory)
+        .where(TurnUsageHistory.user_id == user_id, TurnUsageHistory.consumed_at >= since)
+        .order_by(desc(TurnUsageHistory.consumed_at))
+        .limit(limit)
+    )
+
+
+def _transaction_totals_query(user_id: int):
+    """Sum completed USD spend and purchased turns across all of the user's transactions.
+
+    ``amount`` is stored as text, so it is cast to ``NUMERIC`` and summed in SQL; the
+    spend comes back as an exact ``Decimal`` on both PostgreSQL and SQLite.
+    """
+    completed = PaymentTransaction.status == "completed"
+    return select(
+        func.coalesce(
+            func.sum(
+                case(
+                    (completed & (PaymentTransaction.currency == "USD"), cast(PaymentTransaction.amount, Numeric)),
+                    else_=0,
+                )
+            ),
+            0,
+        ).label("total_spent"),
+        func.coalesce(func.sum(case((completed, PaymentTransaction.turns_purchased), else_=0)), 0).label("total_turns"),
+    ).where(PaymentTransaction.user_id == user_id)
+
+
+def _usage_by_context_query(user_id: int, since: datetime):
+    """Count the user's turn usage per context over the whole UTC days since ``since``, from the daily rollup."""
+    return (
+        select(TurnUsageDaily.usage_context, func.sum(TurnUsageDaily.uses).label("uses"))
+        .where(TurnUsageDaily.user_id == user_id, TurnUsageDaily.day >= since.date())
+        .group_by(TurnUsageDaily.usage_context)
+    )
+
+
+def _fetch_history(
+    db: Session, user_id: int, since: datetime, events_limit: int, transactions_limit: int, usage_limit: int
+) -> tuple:
+    """Run the history queries one after another on ``db``."""
+    total_spent, total_turns = db.execute(_transaction_totals_query(user_id)).one()
+    return (
+        db.execute(_events_query(user_id, events_limit)).scalars().all(),
+        db.execute(_transactions_query(user_id, transactions_limit)).scalars().all(),
+        db.execute(_turn_usage_query(user_id, since, usage_limit)).scalars().all(),
+        total_spent,
+        int(total_turns),
+        dict(db.execute(_usage_by_context_query(user_id, since)).all()),
+    )
+
+
 @router.get("/user/subscription/history", response_model=SubscriptionHistoryResponse)
 async def get_user_subscription_history(
     current_user: User = Depends(get_current_user),
@@ -361,73 +501,23 @@ async def get_user_subscription_history(
     transactions_limit: int = 20,
     usage_limit: int = 50,
     usage_days: int = 30,
+    now: datetime = Depends(get_request_now),
 ):
     """Get comprehensive subscription history for the user."""
     try:
-        # Get subscription events
-        events = (
-            db.query(SubscriptionEvent)
-            .filter(SubscriptionEvent.user_id == current_user.id)
-            .order_by(desc(SubscriptionEvent.created_at))
-            .limit(events_limit)
-            .all()
-        )
-
-        # Get payment transactions
-        transactions = (
-            db.query(PaymentTransaction)
-            .filter(PaymentTransaction.user_id == current_user.id)
-            .order_by(desc(PaymentTransaction.created_at))
-            .limit(transactions_limit)
-            .all()
+        date_threshold = now - timedelta(days=usage_days)
+        results = await run_in_threadpool(
+            _fetch_history, db, current_user.id, date_threshold, events_limit, transactions_limit, usage_limit
         )
-
-        # Get turn usage history
-        date_threshold = datetime.utcnow() - timedelta(days=usage_days)
-        usage_history = (
-            db.query(TurnUsageHistory)
-            .filter(
-                TurnUsageHistory.user_id == current_user.id,
-                TurnUsageHistory.consumed_at >= date_threshold,
-            )
-            .order_by(desc(TurnUsageHistory.consumed_at))
-            .limit(usage_limit)
-            .all()
-        )
-
-        # Get subscription plans
-        plans = (
-            db.query(SubscriptionPlan)
-            .filter(SubscriptionPlan.is_active.is_(True))
-            .order_by(SubscriptionPlan.sort_order, SubscriptionPlan.turns_included)
-            .all()
-        )
-
-        # Calculate summary statistics
-        total_spent = sum(
-            float(transaction.amount) for transaction in transactions
-            if transaction.status == "completed" and transaction.currency == "USD"
-        )
-
-        total_turns_purchased = sum(
-            transaction.turns_purchased for transaction in transactions
-            if transaction.status == "completed"
-        )
-
-        total_turns_used = len(usage_history)
-
-        # Calculate usage by context
-        usage_by_context = {}
-        for usage in usage_history:
-            context = usage.usage_context
-            usage_by_context[context] = usage_by_context.get(context, 0) + 1
+        events, transactions, usage_history, total_spent, total_turns_purchased, usage_by_context = results
+        plans = await run_in_threadpool(get_active_plans, db)
 
         summary = {
             "total_events": len(events),
             "total_transactions": len(transactions),
             "total_spent_usd": f"{total_spent:.2f}",
             "total_turns_purchased": total_turns_purchased,
-            "total_turns_used_period": total_turns_used,
+            "total_turns_used_period": sum(usage_by_context.values()),
             "current_subscription_status": current_user.subscription_status or "none",
             "current_free_turns": current_user.number_of_free_turns or 0,
             "current_paid_turns": current_user.number_of_paid_turns or 0,
@@ -435,13 +525,14 @@ async def get_user_subscription_history(
             "is_specialized_premium": current_user.is_specialized_premium or False,
         }
 
-        return SubscriptionHistoryResponse(
-            subscription_events=[SubscriptionEventResponse.model_validate(event) for event in events],
-            payment_transactions=[PaymentTransactionResponse.model_validate(transaction) for transaction in transactions],
-            turn_usage_history=[TurnUsageHistoryResponse.model_validate(usage) for usage in usage_history],
-            subscription_plans=[SubscriptionPlanResponse.model_validate(plan) for plan in plans],
+        history = SubscriptionHistoryResponse(
+            subscription_events=_EVENTS_ADAPTER.validate_python(events, from_attributes=True),
+            payment_transactions=_TRANSACTIONS_ADAPTER.validate_python(transactions, from_attributes=True),
+            turn_usage_history=_USAGE_ADAPTER.validate_python(usage_history, from_attributes=True),
+            subscription_plans=plans,
             summary=summary,
         )
+        return Response(content=history.model_dump_json(), media_type="application/json")
 
     except Exception as e:
         logger.error(f"Error retrieving subscription history for user {current_user.id}: {e}")
@@ -1,9 +1,14 @@
-import traceback
+import asyncio
+import os
 import uuid
+from collections.abc import Awaitable, Callable
 from pathlib import Path
 
 import httpx
-from fastapi import APIRouter, Depends, File, Form, HTTPException, Request, UploadFile
+import orjson
+from fastapi import APIRouter, BackgroundTasks, Depends, File, Form, HTTPException, Request, Response, UploadFile
+from fastapi.concurrency import run_in_threadpool
+from fastapi.routing import APIRoute
 from sqlalchemy.orm import Session
 
 from config import settings
@@ -12,35 +17,73 @@ from models import User
 from routers.auth import RATE_LIMITS, get_current_user, limiter
 from schemas import SupportTicketResponse
 from utils.error_handlers import logger
-
-# Initialize support router with prefix and tags
-router = APIRouter(prefix="/api/support", tags=["support"])
+from utils.retry import compute_backoff
 
 # Configuration for file uploads
 MAX_FILE_SIZE = 25 * 1024 * 1024  # 25MB per file (Slack limit is 1GB, but we'll be conservative)
 MAX_FILES = 5  # Maximum number of files per ticket
-ALLOWED_EXTENSIONS = {
-    ".jpg",
-    ".jpeg",
-    ".png",
-    ".gif",
-    ".webp",
-    ".bmp",  # Images
-    ".mp4",
-    ".mov",
-    ".avi",
-    ".mkv",
-    ".webm",
-    ".flv",  # Videos
-    ".pdf",
-    ".doc",
-    ".docx",
-    ".txt",
-    ".rtf",  # Documents
-    ".zip",
-    ".rar",
-    ".7z",  # Archives
-}
+# Largest acceptable request body: every attachment at its limit plus room for the form fields
+MAX_REQUEST_SIZE = MAX_FILES * MAX_FILE_SIZE + 1024 * 1024
+UPLOAD_CHUNK_SIZE = 1024 * 1024  # Attachments are streamed to Slack in 1MB chunks
+MAX_CONCURRENT_SLACK_UPLOADS = 5  # Uploads in flight across all tickets, to stay clear of Slack rate limits
+
+# Slack answers bursts with 429 and has the odd 5xx; these are retried with jittered backoff
+_RETRIABLE_SLACK_STATUSES = frozenset({429, 500, 502, 503, 504})
+_MAX_SLACK_RETRIES = 3
+_SLACK_RETRY_BASE_SECONDS = 1.0
+_SLACK_RETRY_MAX_SECONDS = 30.0
+
+# Slack JSON bodies are encoded with orjson and sent as raw content
+_JSON_HEADERS = {"Content-Type": "application/json; charset=utf-8"}
+
+
+class SizeLimitedRoute(APIRoute):
+    """Route that rejects a declared oversized body with 413 before the form is read."""
+
+    def get_route_handler(self):
+        handler = super().get_route_handler()
+
+        async def size_limited_handler(request: Request) -> Response:
+            content_length = request.headers.get("content-length", "")
+            if content_length.isdigit() and int(content_length) > MAX_REQUEST_SIZE:
+                raise HTTPException(
+                    status_code=413,
+                    detail=f"Request is too large. Maximum size: {MAX_FILES} files of {MAX_FILE_SIZE // (1024 * 1024)}MB",
+                )
+            return await handler(request)
+
+        return size_limited_handler
+
+
+# Initialize support router with prefix and tags
+router = APIRouter(prefix="/api/support", tags=["support"], route_class=SizeLimitedRoute)
+
+ALLOWED_EXTENSIONS = frozenset(
+    {
+        ".jpg",
+        ".jpeg",
+        ".png",
+        ".gif",
+        ".webp",
+        ".bmp",  # Images
+        ".mp4",
+        ".mov",
+        ".avi",
+        ".mkv",
+        ".webm",
+        ".flv",  # Videos
+        ".pdf",
+        ".doc",
+        ".docx",
+        ".txt",
+        ".rtf",  # Documents
+        ".zip",
+        ".rar",
+        ".7z",  # Archives
+    }
+)
+# Listed in the invalid-file-type error; the set never changes, so it is sorted once
+_ALLOWED_EXTENSIONS_TEXT = ", ".join(sorted(ALLOWED_EXTENSIONS))
 
 # Slack configuration
 SLACK_BOT_TOKEN = settings.SLACK_BOT_TOKEN
@@ -54,6 +97,73 @@ SLACK_CHANNEL = settings.SLACK_CHANNEL
 # The old files.upload method was deprecated by Slack and replaced in November 2024
 # If your bot token doesn't have these scopes, file uploads will fail with "missing_scope" error
 
+# One pooled client for every Slack call, so tickets reuse kept-alive connections
+# instead of paying a TCP + TLS handshake per request
+_slack_client: httpx.AsyncClient | None = None
+
+
+def get_slack_client() -> httpx.AsyncClient:
+    """Return the shared Slack HTTP client, creating it on first use."""
+    global _slack_client
+    if _slack_client is None or _slack_client.is_closed:
+        _slack_client = httpx.AsyncClient(
+            timeout=60.0, limits=httpx.Limits(max_keepalive_connections=20, max_connections=100)
+        )
+    return _slack_client
+
+
+async def close_slack_client() -> None:
+    """Close the shared Slack HTTP client (called on application shutdown)."""
+    global _slack_client
+    if _slack_client is not None:
+        await _slack_client.aclose()
+        _slack_client = None
+
+
+def _retry_delay(attempt: int, response: httpx.Response | None) -> float:
+    """Seconds to wait before retry ``attempt``, honoring Slack's ``Retry-After`` when sent."""
+    retry_after = response.headers.get("retry-after", "") if response is not None else ""
+    if retry_after.isdigit():
+        return min(float(retry_after), _SLACK_RETRY_MAX_SECONDS)
+    return compute_backoff(attempt, base_seconds=_SLACK_RETRY_BASE_SECONDS, max_seconds=_SLACK_RETRY_MAX_SECONDS)
+
+
+async def _with_retry(send: Callable[[], Awaitable[httpx.Response]], *, idempotent: bool = True) -> httpx.Response:
+    """Run a Slack request, retrying transport errors and 429/5xx responses.
+
+    ``send`` is called again for every attempt, so it must build a fresh request
+    (including any streamed body). The last response or error is returned or raised.
+    Requests that are not ``idempotent`` (a repeat would post twice) are only retried
+    when Slack cannot have acted on them: on 429 and on failures to connect.
+    """
+    for attempt in range(_MAX_SLACK_RETRIES + 1):
+        response = None
+        try:
+            response = await send()
+        except httpx.TransportError as e:
+            retriable = idempotent or isinstance(e, (httpx.ConnectError, httpx.ConnectTimeout))
+            if not retriable or attempt == _MAX_SLACK_RETRIES:
+                raise
+            reason = str(e)
+        else:
+            retriable_statuses = _RETRIABLE_SLACK_STATUSES if idempotent else {429}
+            if response.status_code not in retriable_statuses or attempt == _MAX_SLACK_RETRIES:
+                return response
+            reason = f"HTTP {response.status_code}"
+
+        delay = _retry_delay(attempt, response)
+        logger.logger.warning(f"Slack request failed ({reason}), retrying in {delay:.1f}s")
+        await asyncio.sleep(delay)
+
+
+_slack_upload_slots = asyncio.Semaphore(MAX_CONCURRENT_SLACK_UPLOADS)
+
+
+async def _upload_with_slot(file: UploadFile, ticket_id: str, channel: str) -> dict | None:
+    """Upload one file to Slack once an upload slot is free."""
+    async with _slack_upload_slots:
+        return await upload_file_to_slack(file, ticket_id, channel)
+
 
 def validate_file(file: UploadFile) -> None:
     """Validate uploaded file for support tickets.
@@ -72,9 +182,34 @@ def validate_file(file: UploadFile) -> None:
     if file_ext not in ALLOWED_EXTENSIONS:
         raise HTTPException(
             status_code=400,
-            detail=f"Invalid file type '{file_ext}'. Allowed types: {', '.join(sorted(ALLOWED_EXTENSIONS))}",
+            detail=f"Invalid file type '{file_ext}'. Allowed types: {_ALLOWED_EXTENSIONS_TEXT}",
         )
 
+    # Reject a file the client already reported as oversized before any of it is sent on
+    if file.size is not None and file.size > MAX_FILE_SIZE:
+        raise _file_too_large(file)
+
+
+def _file_too_large(file: UploadFile) -> HTTPException:
+    return HTTPException(
+        status_code=413,
+        detail=f"File '{file.filename}' is too large. Maximum size: {MAX_FILE_SIZE // (1024 * 1024)}MB",
+    )
+
+
+def _measure_file(fileobj) -> int:
+    """Return the size of a seekable file object, leaving it rewound."""
+    size = fileobj.seek(0, os.SEEK_END)
+    fileobj.seek(0)
+    return size
+
+
+async def _iter_file_chunks(file: UploadFile):
+    """Yield the upload's bytes from the start in `UPLOAD_CHUNK_SIZE` pieces."""
+    await file.seek(0)
+    while chunk := await file.read(UPLOAD_CHUNK_SIZE):
+        yield chunk
+
 
 async def upload_file_to_slack(file: UploadFile, ticket_id: str, channel: str) -> dict | None:
     """Upload file to Slack using the new external upload API.
@@ -100,113 +235,123 @@ async def upload_file_to_slack(file: UploadFile, ticket_id: str, channel: str) -
     try:
         validate_file(file)
 
-        # Read and validate file size
-        file_content = file.file.read()
-        if len(file_content) > MAX_FILE_SIZE:
-            raise HTTPException(
-                status_code=400,
-                detail=f"File '{file.filename}' is too large. Maximum size: {MAX_FILE_SIZE // (1024*1024)}MB",
-            )
+        # Validate file size without reading the file into memory
+        file_size = file.size
+        if file_size is None:
+            # Seeking a spooled file that rolled over to disk blocks, so keep it off the event loop
+            file_size = await run_in_threadpool(_measure_file, file.file)
+        if file_size > MAX_FILE_SIZE:
+            raise _file_too_large(file)
 
-        file_size = len(file_content)
+        client = get_slack_client()
+        headers = {"Authorization": f"Bearer {SLACK_BOT_TOKEN}"}
 
-        # Reset file pointer
-        file.file.seek(0)
-
-        async with httpx.AsyncClient(timeout=60.0) as client:
-            headers = {"Authorization": f"Bearer {SLACK_BOT_TOKEN}"}
-
-            # Step 1: Get upload URL
-            get_url_response = await client.get(
+        # Step 1: Get upload URL
+        get_url_response = await _with_retry(
+            lambda: client.get(
                 "https://slack.com/api/files.getUploadURLExternal",
                 params={"filename": file.filename, "length": file_size},
                 headers=headers,
             )
+        )
 
-            if get_url_response.status_code != 200:
-                logger.logger.error(f"Failed to get upload URL: HTTP {get_url_response.status_code}")
-                return None
-
-            url_result = get_url_response.json()
-            if not url_result.get("ok"):
-                error_msg = url_result.get("error", "Unknown error")
-                if error_msg == "missing_scope":
-                    logger.logger.error(
-                        f"Slack file upload failed: {error_msg}. Your Slack bot token needs 'files:write' scope."
-                    )
-                else:
-                    logger.logger.error(f"Failed to get upload URL: {error_msg}")
-                return None
-
-            upload_url = url_result.get("upload_url")
-            file_id = url_result.get("file_id")
-
-            if not upload_url or not file_id:
-                logger.logger.error("Missing upload_url or file_id in response")
-                return None
+        if get_url_response.status_code != 200:
+            logger.logger.error(f"Failed to get upload URL: HTTP {get_url_response.status_code}")
+            return None
 
-            # Step 2: Upload file to the URL
-            upload_response = await client.post(
-                upload_url, files={"file": (file.filename, file_content, file.content_type)}
+        url_result = get_url_response.json()
+        if not url_result.get("ok"):
+            error_msg = url_result.get("error", "Unknown error")
+            if error_msg == "missing_scope":
+                logger.logger.error(
+                    f"Slack file upload failed: {error_msg}. Your Slack bot token needs 'files:write' scope."
+                )
+            else:
+                logger.logger.error(f"Failed to get upload URL: {error_msg}")
+            return None
+
+        upload_url = url_result.get("upload_url")
+        file_id = url_result.get("file_id")
+
+        if not upload_url or not file_id:
+            logger.logger.error("Missing upload_url or file_id in response")
+            return None
+
+        # Step 2: Stream the raw file body to the URL, one chunk in memory at a time
+        upload_response = await _with_retry(
+            lambda: client.post(
+                upload_url,
+                content=_iter_file_chunks(file),
+                headers={
+                    "Content-Type": file.content_type or "application/octet-stream",
+                    "Content-Length": str(file_size),
+                },
             )
+        )
 
-            if upload_response.status_code != 200:
-                logger.logger.error(f"File upload to URL failed: HTTP {upload_response.status_code}")
-                return None
-
-            # Step 3: Complete the upload and try to share to channel
-            # First try with channel sharing
-            complete_response = await client.post(
+        if upload_response.status_code != 200:
+            logger.logger.error(f"File upload to URL failed: HTTP {upload_response.status_code}")
+            return None
+
+        # Step 3: Complete the upload and try to share to channel
+        # First try with channel sharing
+        complete_body = orjson.dumps(
+            {
+                "files": [{"id": file_id, "title": f"Support Ticket #{ticket_id} - {file.filename}"}],
+                "channel_id": channel,
+                "initial_comment": f"📎 File attached to support ticket #{ticket_id}",
+            }
+        )
+        complete_response = await _with_retry(
+            lambda: client.post(
                 "https://slack.com/api/files.completeUploadExternal",
-                json={
-                    "files": [{"id": file_id, "title": f"Support Ticket #{ticket_id} - {file.filename}"}],
-                    "channel_id": channel,
-                    "initial_comment": f"📎 File attached to support ticket #{ticket_id}",
-                },
-                headers=headers,
-            )
+                content=complete_body,
+                headers={**headers, **_JSON_HEADERS},
+            ),
+            idempotent=False,
+        )
 
-            if complete_response.status_code != 200:
-                logger.logger.error(f"Failed to complete upload: HTTP {complete_response.status_code}")
-                return None
+        if complete_response.status_code != 200:
+            logger.logger.error(f"Failed to complete upload: HTTP {complete_response.status_code}")
+            return None
+
+        complete_result = complete_response.json()
+        logger.logger.info(f"Complete upload response: {complete_result}")
 
-            complete_result = complete_response.json()
-            logger.logger.info(f"Complete upload response: {complete_result}")
-
-            if complete_result.get("ok"):
-                files = complete_result.get("files", [])
-                if files:
-                    uploaded_file = files[0]
-
-                    # File should now be shared to the channel via the completeUploadExternal call above
-                    # Check if the file was properly shared
-                    if uploaded_file.get("shares") and channel in str(uploaded_file.get("shares", {})):
-                        logger.logger.info(f"File '{file.filename}' successfully shared to channel {channel}")
-                    else:
-                        logger.logger.warning(
-                            f"File '{file.filename}' uploaded but may not be visible in channel {channel}"
-                        )
-                        logger.logger.info(f"File sharing info: {uploaded_file.get('shares', 'No shares')}")
-                        logger.logger.info(f"File channels: {uploaded_file.get('channels', 'No channels')}")
-
-                    logger.logger.info(f"File '{file.filename}' uploaded to Slack successfully for ticket #{ticket_id}")
-                    return uploaded_file
+        if complete_result.get("ok"):
+            files = complete_result.get("files", [])
+            if files:
+                uploaded_file = files[0]
+
+                # File should now be shared to the channel via the completeUploadExternal call above
+                # Check if the file was properly shared
+                if uploaded_file.get("shares") and channel in str(uploaded_file.get("shares", {})):
+                    logger.logger.info(f"File '{file.filename}' successfully shared to channel {channel}")
                 else:
-                    logger.logger.error("No files returned in complete upload response")
-                    return None
-            else:
-                error_msg = complete_result.get("error", "Unknown error")
-                if error_msg == "channel_not_found":
-                    logger.logger.error(
-                        f"Slack file upload failed: {error_msg}. Channel '{channel}' not found. Please ensure: 1) Channel exists, 2) Bot is invited to channel, 3) Channel ID is correct (starts with C for public channels, G for private groups)"
+                    logger.logger.warning(
+                        f"File '{file.filename}' uploaded but may not be visible in channel {channel}"
                     )
-                elif error_msg == "missing_scope":
-                    logger.logger.error(
-                        f"Slack file upload failed: {error_msg}. Your Slack bot token needs 'files:write' scope."
-                    )
-                else:
-                    logger.logger.error(f"Failed to complete upload: {error_msg}")
+                    logger.logger.info(f"File sharing info: {uploaded_file.get('shares', 'No shares')}")
+                    logger.logger.info(f"File channels: {uploaded_file.get('channels', 'No channels')}")
+
+                logger.logger.info(f"File '{file.filename}' uploaded to Slack successfully for ticket #{ticket_id}")
+                return uploaded_file
+            else:
+                logger.logger.error("No files returned in complete upload response")
                 return None
+        else:
+            error_msg = complete_result.get("error", "Unknown error")
+            if error_msg == "channel_not_found":
+                logger.logger.error(
+                    f"Slack file upload failed: {error_msg}. Channel '{channel}' not found. Please ensure: 1) Channel exists, 2) Bot is invited to channel, 3) Channel ID is correct (starts with C for public channels, G for private groups)"
+                )
+            elif error_msg == "missing_scope":
+                logger.logger.error(
+                    f"Slack file upload failed: {error_msg}. Your Slack bot token needs 'files:write' scope."
+                )
+            else:
+                logger.logger.error(f"Failed to complete upload: {error_msg}")
+            return None
 
     except Exception as e:
         if isinstance(e, HTTPException):
@@ -215,7 +360,51 @@ async def upload_file_to_slack(file: UploadFile, ticket_id: str, channel: str) -
         raise HTTPException(status_code=500, detail=f"Error processing file '{file.filename}'")
     finally:
         # Reset file pointer
-        file.file.seek(0)
+        await file.seek(0)
+
+
+# Upload response fields that can link to a file, in order of preference
+_ATTACHMENT_URL_FIELDS = ("permalink_public", "url_private", "permalink", "url_private_download")
+
+
+def _attachment_line(file_info: dict) -> str:
+    """Format one uploaded file as a bullet for the ticket message."""
+    file_name = file_info.get("name", file_info.get("title", "Unknown file"))
+    file_size = file_info.get("size", 0)
+    file_type = file_info.get("mimetype", file_info.get("filetype", "unknown"))
+    file_url = next((file_info[field] for field in _ATTACHMENT_URL_FIELDS if file_info.get(field)), None)
+    if file_url:
+        return f"• <{file_url}|{file_name}> ({file_type}, {file_size} bytes)"
+    # If no URL available, just show file info
+    return f"• {file_name} (ID: {file_info.get('id', 'unknown')}, {file_type}, {file_size} bytes)"
+
+
+def _ticket_message(
+    ticket_id: str, user: User, title: str, description: str, uploaded_files: list[dict] | None
+) -> dict:
+    """Build the Slack webhook payload for a support ticket in one pass.
+
+    The blocks are written as literals rather than copied from a module-level
+    template: building a few small dicts is cheaper than deep-copying one.
+    """
+    blocks = [
+        {"type": "header", "text": {"type": "plain_text", "text": f"🎴 Support Ticket #{ticket_id}"}},
+        {
+            "type": "section",
+            "fields": [
+                {"type": "mrkdwn", "text": f"*User:* {user.username}"},
+                {"type": "mrkdwn", "text": f"*Email:* {user.email}"},
+                {"type": "mrkdwn", "text": f"*User ID:* {user.id}"},
+                {"type": "mrkdwn", "text": f"*Premium:* {'Yes' if user.is_specialized_premium else 'No'}"},
+            ],
+        },
+        {"type": "section", "text": {"type": "mrkdwn", "text": f"*Subject:* {title}"}},
+        {"type": "section", "text": {"type": "mrkdwn", "text": f"*Description:*\n{description}"}},
+    ]
+    if uploaded_files:
+        files_text = "\n\n📎 *Attachments:*\n" + "\n".join(_attachment_line(file_info) for file_info in uploaded_files)
+        blocks.append({"type": "section", "text": {"type": "mrkdwn", "text": files_text}})
+    return {"text": f"🎴 New Support Ticket #{ticket_id}", "blocks": blocks}
 
 
 async def send_to_slack(
@@ -239,73 +428,75 @@ async def send_to_slack(
         return None
 
     try:
-        # Prepare file attachments text
-        files_text = ""
-        if uploaded_files:
-            file_list = []
-            for file_info in uploaded_files:
-                file_name = file_info.get("name", file_info.get("title", "Unknown file"))
-                file_size = file_info.get("size", 0)
-                file_type = file_info.get("mimetype", file_info.get("filetype", "unknown"))
-
-                # Try different URL fields from the new API
-                file_url = (
-                    file_info.get("permalink_public")
-                    or file_info.get("url_private")
-                    or file_info.get("permalink")
-                    or file_info.get("url_private_download")
-                )
-
-                if file_url:
-                    file_list.append(f"• <{file_url}|{file_name}> ({file_type}, {file_size} bytes)")
-                else:
-                    # If no URL available, just show file info
-                    file_id = file_info.get("id", "unknown")
-                    file_list.append(f"• {file_name} (ID: {file_id}, {file_type}, {file_size} bytes)")
-
-            if file_list:
-                files_text = "\n\n📎 *Attachments:*\n" + "\n".join(file_list)
-
-        # Prepare Slack message
-        slack_message = {
-            "text": f"🎴 New Support Ticket #{ticket_id}",
-            "blocks": [
-                {"type": "header", "text": {"type": "plain_text", "text": f"🎴 Support Ticket #{ticket_id}"}},
-                {
-                    "type": "section",
-                    "fields": [
-                        {"type": "mrkdwn", "text": f"*User:* {user.username}"},
-                        {"type": "mrkdwn", "text": f"*Email:* {user.email}"},
-                        {"type": "mrkdwn", "text": f"*User ID:* {user.id}"},
-                        {"type": "mrkdwn", "text": f"*Premium:* {'Yes' if user.is_specialized_premium else 'No'}"},
-                    ],
-                },
-                {"type": "section", "text": {"type": "mrkdwn", "text": f"*Subject:* {title}"}},
-                {"type": "section", "text": {"type": "mrkdwn", "text": f"*Description:*\n{description}"}},
-            ],
-        }
-
-        # Add files section if there are attachments
-        if files_text:
-            slack_message["blocks"].append({"type": "section", "text": {"type": "mrkdwn", "text": files_text}})
+        # Encoded once, so a retried post resends the same bytes
+        slack_message = orjson.dumps(_ticket_message(ticket_id, user, title, description, uploaded_files))
 
         # Send to Slack
-        async with httpx.AsyncClient(timeout=30.0) as client:
-            response = await client.post(webhook_url, json=slack_message)
-            response.raise_for_status()
+        client = get_slack_client()
+        response = await _with_retry(
+            lambda: client.post(webhook_url, content=slack_message, headers=_JSON_HEADERS, timeout=30.0),
+            idempotent=False,
+        )
+        response.raise_for_status()
 
-            logger.logger.info(f"Support ticket #{ticket_id} sent to Slack successfully")
-            return "success"  # Slack webhooks don't return message IDs
+        logger.logger.info(f"Support ticket #{ticket_id} sent to Slack successfully")
+        return "success"  # Slack webhooks don't return message IDs
 
     except Exception as e:
         logger.logger.error(f"Failed to send support ticket #{ticket_id} to Slack: {str(e)}")
         return None
 
 
+async def _deliver_ticket(ticket_id: str, user: User, title: str, description: str, files: list[UploadFile]) -> None:
+    """Upload a ticket's attachments and post the ticket to Slack.
+
+    Runs as a background task after the ticket response has been sent, so
+    failures are logged rather than raised.
+    """
+    try:
+        uploaded_files = []
+        if files:
+            # Upload the attachments concurrently; the ticket waits for the slowest file, not the sum
+            results = await asyncio.gather(
+                *(_upload_with_slot(file, ticket_id, SLACK_CHANNEL) for file in files), return_exceptions=True
+            )
+            for file, result in zip(files, results, strict=True):
+                if isinstance(result, Exception):
+                    # Log error but continue - we don't want to drop the entire ticket for one file
+                    logger.logger.error(f"Error uploading file '{file.filename}' to Slack: {str(result)}")
+                elif result:
+                    uploaded_files.append(result)
+                else:
+                    logger.logger.warning(f"Failed to upload file '{file.filename}' to Slack for ticket #{ticket_id}")
+
+        slack_message_id = await send_to_slack(
+            ticket_id=ticket_id,
+            user=user,
+            title=title,
+            description=description,
+            uploaded_files=uploaded_files if uploaded_files else None,
+        )
+
+        logger.logger.info(
+            "Support ticket delivered to Slack",
+            extra={
+                "ticket_id": ticket_id,
+                "files_count": len(files),
+                "files_uploaded_to_slack": len(uploaded_files),
+                "sent_to_slack": slack_message_id is not None,
+            },
+        )
+    except Exception as e:
+        logger.logger.exception(
+            f"Failed to deliver support ticket #{ticket_id} to Slack", extra={"error": str(e), "user_id": user.id}
+        )
+
+
 @router.post("/", response_model=SupportTicketResponse)
 @limiter.limit(RATE_LIMITS["upload"])  # Use upload rate limit (more restrictive)
 async def create_support_ticket(
     request: Request,
+    background_tasks: BackgroundTasks,
     title: str = Form(..., description="Support ticket title/subject"),
     description: str = Form(..., description="Detailed description of the issue"),
     files: list[UploadFile] = File(None, description="Optional file attachments"),
@@ -315,11 +506,13 @@ async def create_support_ticket(
     """
     Create Support Ticket
 
-    Submit a new support ticket with optional file attachments. The ticket and files will be
-    automatically uploaded to Slack for immediate support team access. No files are stored locally.
+    Submit a new support ticket with optional file attachments. The ticket and files are
+    uploaded to Slack for support team access after the response is sent, so a slow or
+    unavailable Slack never delays or fails the request. No files are stored locally.
 
     Args:
         request (Request): FastAPI request object for rate limiting
+        background_tasks (BackgroundTasks): Runs the Slack uploads and notification
         title (str): Support ticket title/subject (1-200 characters)
         description (str): Detailed description of the issue (1-2000 characters)
         files (List[UploadFile], optional): File attachments (max 5 files, 25MB each)
@@ -330,11 +523,12 @@ async def create_support_ticket(
         SupportTicketResponse: Ticket creation confirmation
             - message (str): Success message
             - ticket_id (str): Unique ticket identifier
-            - slack_message_id (str, optional): Slack message ID if sent successfully
+            - slack_message_id (str, optional): Always null; Slack delivery happens after the response
 
     Raises:
         HTTPException (400): If validation fails or files are invalid
         HTTPException (401): If user is not authenticated
+        HTTPException (413): If the request or an attachment is too large
         HTTPException (429): If rate limit is exceeded
         HTTPException (500): If ticket creation fails
 
@@ -382,63 +576,48 @@ async def create_support_ticket(
                 raise HTTPException(status_code=400, detail=f"Too many files. Maximum allowed: {MAX_FILES}")
 
         # Generate unique ticket ID
-        ticket_id = str(uuid.uuid4())
-
-        # Upload files directly to Slack
-        uploaded_files = []
+        ticket_id = uuid.uuid4().hex
 
         if files:
+            # Reject bad file types and sizes while the client is still waiting for an answer
             for file in files:
-                try:
-                    file_info = await upload_file_to_slack(file, ticket_id, SLACK_CHANNEL)
-                    if file_info:
-                        uploaded_files.append(file_info)
-                    else:
-                        logger.logger.warning(
-                            f"Failed to upload file '{file.filename}' to Slack for ticket #{ticket_id}"
-                        )
-
-                except Exception as e:
-                    # Log error but continue - we don't want to fail the entire ticket for one file
-                    logger.logger.error(f"Error uploading file '{file.filename}' to Slack: {str(e)}")
-                    # Re-raise if it's a validation error
-                    if isinstance(e, HTTPException):
-                        raise
-
-        # Send ticket info to Slack
-        slack_message_id = await send_to_slack(
-            ticket_id=ticket_id,
-            user=current_user,
-            title=title.strip(),
-            description=description.strip(),
-            uploaded_files=uploaded_files if uploaded_files else None,
+                validate_file(file)
+
+            if not SLACK_BOT_TOKEN:
+                # Uploads are disabled; skip the per-file tasks instead of letting each one bail out
+                logger.logger.warning(
+                    f"SLACK_BOT_TOKEN not configured, skipping {len(files)} attachment(s) for ticket #{ticket_id}"
+                )
+                files = []
+
+        # Slack delivery is best effort, so it runs after the response has been sent. The form
+        # files stay open until the background tasks finish.
+        background_tasks.add_task(
+            _deliver_ticket, ticket_id, current_user, title.strip(), description.strip(), files or []
         )
 
-        # Log successful ticket creation
         logger.logger.info(
             "Support ticket created successfully",
             extra={
                 "ticket_id": ticket_id,
                 "user_id": current_user.id,
                 "username": current_user.username,
-                "files_count": len(uploaded_files),
-                "files_uploaded_to_slack": len(uploaded_files),
-                "sent_to_slack": slack_message_id is not None,
+                "files_count": len(files or []),
             },
         )
 
         return SupportTicketResponse(
             message="Support ticket created successfully. Our team will get back to you soon!",
             ticket_id=ticket_id,
-            slack_message_id=slack_message_id,
         )
 
     except HTTPException:
         raise
     except Exception as e:
-        logger.logger.error(
+        # The traceback is attached to the record and only formatted by a sink that emits it
+        logger.logger.exception(
             "Error creating support ticket",
-            extra={"error": str(e), "user_id": current_user.id, "traceback": traceback.format_exc()},
+            extra={"error": str(e), "user_id": current_user.id},
         )
         raise HTTPException(
             status_code=500, detail="An error occurred while creating your support ticket. Please try again."
@@ -4,6 +4,7 @@ import time
 from datetime import date
 
 from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response, status
+from fastapi.concurrency import run_in_threadpool
 from fastapi.responses import StreamingResponse
 from sqlalchemy import or_
 from sqlalchemy.orm import Session
@@ -25,11 +26,13 @@ from schemas import (
     SpreadListResponse,
     SpreadResponse,
 )
+from services import spread_catalog
 from services.streak_service import record_activity as record_streak_activity
-from services.subscription_service import SubscriptionService
+from services.subscription_service import SubscriptionService, get_subscription_service
 from tarot_reader import TarotReader
 from utils.error_handlers import TarotAPIException, ValidationError, logger
-from utils.metrics import record_tarot_reading
+from utils.etag import etag_matches
+from utils.metrics import record_tarot_reading, track_tarot_reading_in_progress
 from utils.rate_limiter import RATE_LIMITS, limiter
 
 router = APIRouter(prefix="/api/tarot", tags=["tarot"])
@@ -141,6 +144,7 @@ async def get_reading(
     response: Response,
     current_user: User = Depends(get_current_user),
     db: Session = Depends(get_db),
+    subscription_service: SubscriptionService = Depends(get_subscription_service),
 ):
     """
     Generate Tarot Reading
@@ -208,63 +212,61 @@ async def get_reading(
     reading_type = f"{request_data.num_cards}_card"
     reading_status = "error"
 
-    try:
-        # Check and consume turns before generating reading
-        subscription_service = SubscriptionService()
-        turn_result = subscription_service.consume_user_turn(db, current_user, usage_context="reading")
-
-        # If turn consumption failed, but the user is specialized premium, allow the reading to proceed.
-        if not turn_result.success and current_user.is_specialized_premium:
-            # Log the fallback and continue without raising an error
-            logger.logger.warning(
-                "Turn consumption failed but user is specialized premium – proceeding without consuming a turn",
-                extra={"user_id": current_user.id},
-            )
-        elif not turn_result.success:
-            reading_status = "insufficient_turns"
-            raise HTTPException(
-                status_code=status.HTTP_402_PAYMENT_REQUIRED,
-                detail={
-                    "message": "No turns available",
-                    "remaining_free_turns": turn_result.remaining_free_turns,
-                    "remaining_paid_turns": turn_result.remaining_paid_turns,
-                    "total_remaining_turns": turn_result.total_remaining_turns,
-                },
-            )
+    with track_tarot_reading_in_progress(settings.FASTAPI_ENV):
+        try:
+            # Check and consume turns before generating reading; the row update runs off the event loop
+            turn_result = await run_in_threadpool(subscription_service.consume_user_turn, db, current_user, "reading")
+
+            # If turn consumption failed, but the user is specialized premium, allow the reading to proceed.
+            if not turn_result.success and current_user.is_specialized_premium:
+                # Log the fallback and continue without raising an error
+                logger.logger.warning(
+                    "Turn consumption failed but user is specialized premium – proceeding without consuming a turn",
+                    extra={"user_id": current_user.id},
+                )
+            elif not turn_result.success:
+                reading_status = "insufficient_turns"
+                raise HTTPException(
+                    status_code=status.HTTP_402_PAYMENT_REQUIRED,
+                    detail={
+                        "message": "No turns available",
+                        "remaining_free_turns": turn_result.remaining_free_turns,
+                        "remaining_paid_turns": turn_result.remaining_paid_turns,
+                        "total_remaining_turns": turn_result.total_remaining_turns,
+                    },
+                )
 
-        # Get spread if specified
-        spread = None
-        if request_data.spread_id:
-            spread = db.query(Spread).filter(Spread.id == request_data.spread_id).first()
-            if not spread:
+            # Get spread if specified
+            spread = None
+            if request_data.spread_id:
+                spread = spread_catalog.get_spread(db, request_data.spread_id)
+                if not spread:
+                    reading_status = "validation_error"
+                    raise ValidationError(
+                        message="Spread not found",
+                        details={"spread_id": request_data.spread_id},
+                    )
+                # Use spread's card count, but allow override if num_cards is explicitly provided
+                if request_data.num_cards == 3:  # Default value, use spread's count
+                    request_data.num_cards = spread.num_cards
+                    reading_type = f"{request_data.num_cards}_card"
+
+            # Validate number of cards
+            if request_data.num_cards < 1 or request_data.num_cards > 10:
                 reading_status = "validation_error"
                 raise ValidationError(
-                    message="Spread not found",
-                    details={"spread_id": request_data.spread_id},
+                    message="Invalid number of cards",
+                    details={"num_cards": "Must be between 1 and 10"},
                 )
-            # Use spread's card count, but allow override if num_cards is explicitly provided
-            if request_data.num_cards == 3:  # Default value, use spread's count
-                request_data.num_cards = spread.num_cards
-                reading_type = f"{request_data.num_cards}_card"
-
-        # Validate number of cards
-        if request_data.num_cards < 1 or request_data.num_cards > 10:
-            reading_status = "validation_error"
-            raise ValidationError(
-                message="Invalid number of cards",
-                details={"num_cards": "Must be between 1 and 10"},
-            )
 
-        # Initialize TarotReader with user's favorite deck
-        reader = TarotReader(db=db, deck_id=current_user.favorite_deck_id)
+            # Initialize TarotReader with user's favorite deck
+            reader = TarotReader(db=db, deck_id=current_user.favorite_deck_id)
 
-        # Draw cards
-        cards = reader.shuffle_and_draw(request_data.num_cards, spread=spread)
+            # Draw cards
+            cards = reader.shuffle_and_draw(request_data.num_cards, spread=spread)
 
-        # Format response
-        response_cards = []
-        for i, card in enumerate(cards):
-            response_cards.append(
+            # Format response
+            response_cards = [
                 CardResponse(
                     name=card["name"],
                     orientation=card["orientation"],
@@ -273,48 +275,49 @@ async def get_reading(
                     position=card.get("position"),
                     position_index=card.get("position_index", i),
                 )
-            )
+                for i, card in enumerate(cards)
+            ]
 
-        duration = time.time() - start_time
+            duration = time.time() - start_time
 
-        try:
-            record_streak_activity(db, current_user.id)
-            db.commit()
-        except Exception as streak_exc:  # noqa: BLE001
-            db.rollback()
-            logger.logger.warning(
-                "Failed to record streak activity for reading",
-                extra={"error": str(streak_exc), "user_id": current_user.id},
-            )
+            try:
+                record_streak_activity(db, current_user.id)
+                db.commit()
+            except Exception as streak_exc:  # noqa: BLE001
+                db.rollback()
+                logger.logger.warning(
+                    "Failed to record streak activity for reading",
+                    extra={"error": str(streak_exc), "user_id": current_user.id},
+                )
 
-        logger.logger.info(
-            "Reading generated successfully",
-            extra={
-                "user_id": current_user.id,
-                "num_cards": request_data.num_cards,
-                "concern": request_data.concern,
-                "duration": duration,
-                "deck_id": current_user.favorite_deck_id,
-            },
-        )
-        reading_status = "success"
-        return response_cards
+            logger.logger.info(
+                "Reading generated successfully",
+                extra={
+                    "user_id": current_user.id,
+                    "num_cards": request_data.num_cards,
+                    "concern": request_data.concern,
+                    "duration": duration,
+                    "deck_id": current_user.favorite_deck_id,
+                },
+            )
+            reading_status = "success"
+            return response_cards
 
-    except ValidationError:
-        raise
-    except Exception as e:
-        logger.logger.error(
-            "Error generating reading",
-            extra={"user_id": current_user.id, "error": str(e)},
-        )
-        raise TarotAPIException(message="Error generating reading", details={"error": str(e)})
-    finally:
-        record_tarot_reading(
-            env=settings.FASTAPI_ENV,
-            reading_type=reading_type,
-            status=reading_status,
-            duration=time.time() - start_time,
-        )
+        except ValidationError:
+            raise
+        except Exception as e:
+            logger.logger.error(
+                "Error generating reading",
+                extra={"user_id": current_user.id, "error": str(e)},
+            )
+            raise TarotAPIException(message="Error generating reading", details={"error": str(e)})
+        finally:
+            record_tarot_reading(
+                env=settings.FASTAPI_ENV,
+                reading_type=reading_type,
+                status=reading_status,
+                duration=time.time() - start_time,
+            )
 
 
 COMPATIBILITY_SPREAD_NAME = "Relationship Cross"
@@ -338,6 +341,7 @@ async def get_compatibility_reading(
     response: Response,
     current_user: User = Depends(get_current_user),
     db: Session = Depends(get_db),
+    subscription_service: SubscriptionService = Depends(get_subscription_service),
 ):
     """Draw a relationship-focused tarot reading for two people.
 
@@ -349,103 +353,102 @@ async def get_compatibility_reading(
     reading_type = "compatibility"
     reading_status = "error"
 
-    try:
-        spread = db.query(Spread).filter(Spread.name == COMPATIBILITY_SPREAD_NAME).first()
-        if not spread:
-            reading_status = "not_found"
-            raise TarotAPIException(
-                message="Compatibility spread is not configured",
-                details={"spread_name": COMPATIBILITY_SPREAD_NAME},
-            )
-        subscription_service = SubscriptionService()
-        turn_result = subscription_service.consume_user_turn(db, current_user, usage_context="reading")
+    with track_tarot_reading_in_progress(settings.FASTAPI_ENV):
+        try:
+            spread = db.query(Spread).filter(Spread.name == COMPATIBILITY_SPREAD_NAME).first()
+            if not spread:
+                reading_status = "not_found"
+                raise TarotAPIException(
+                    message="Compatibility spread is not configured",
+                    details={"spread_name": COMPATIBILITY_SPREAD_NAME},
+                )
+            turn_result = await run_in_threadpool(subscription_service.consume_user_turn, db, current_user, "reading")
 
-        if not turn_result.success and current_user.is_specialized_premium:
-            logger.logger.warning(
-                "Turn consumption failed but user is specialized premium - proceeding",
-                extra={"user_id": current_user.id},
-            )
-        elif not turn_result.success:
-            reading_status = "insufficient_turns"
-            raise HTTPException(
-                status_code=status.HTTP_402_PAYMENT_REQUIRED,
-                detail={
-                    "message": "No turns available",
-                    "remaining_free_turns": turn_result.remaining_free_turns,
-                    "remaining_paid_turns": turn_result.remaining_paid_turns,
-                    "total_remaining_turns": turn_result.total_remaining_turns,
-                },
-            )
+            if not turn_result.success and current_user.is_specialized_premium:
+                logger.logger.warning(
+                    "Turn consumption failed but user is specialized premium - proceeding",
+                    extra={"user_id": current_user.id},
+                )
+            elif not turn_result.success:
+                reading_status = "insufficient_turns"
+                raise HTTPException(
+                    status_code=status.HTTP_402_PAYMENT_REQUIRED,
+                    detail={
+                        "message": "No turns available",
+                        "remaining_free_turns": turn_result.remaining_free_turns,
+                        "remaining_paid_turns": turn_result.remaining_paid_turns,
+                        "total_remaining_turns": turn_result.total_remaining_turns,
+                    },
+                )
 
-        reader = TarotReader(db=db, deck_id=current_user.favorite_deck_id)
-        drawn = reader.shuffle_and_draw(spread.num_cards, spread=spread)
-
-        person_a_name = request_data.person_a.name
-        person_b_name = request_data.person_b.name
-        response_cards = []
-        for i, card in enumerate(drawn):
-            position_name = card.get("position", f"Card {i + 1}")
-            personalized = _personalize_position(position_name, person_a_name, person_b_name, i)
-            response_cards.append(
+            reader = TarotReader(db=db, deck_id=current_user.favorite_deck_id)
+            drawn = reader.shuffle_and_draw(spread.num_cards, spread=spread)
+
+            person_a_name = request_data.person_a.name
+            person_b_name = request_data.person_b.name
+            response_cards = [
                 CardResponse(
                     name=card["name"],
                     orientation=card["orientation"],
                     meaning=card["meaning"],
                     image_url=card.get("image_url"),
-                    position=personalized,
+                    position=_personalize_position(
+                        card.get("position", f"Card {i + 1}"), person_a_name, person_b_name, i
+                    ),
                     position_index=card.get("position_index", i),
                 )
-            )
+                for i, card in enumerate(drawn)
+            ]
 
-        duration = time.time() - start_time
+            duration = time.time() - start_time
 
-        try:
-            record_streak_activity(db, current_user.id)
-            db.commit()
-        except Exception as streak_exc:  # noqa: BLE001
-            db.rollback()
-            logger.logger.warning(
-                "Failed to record streak activity for compatibility reading",
-                extra={"error": str(streak_exc), "user_id": current_user.id},
-            )
+            try:
+                record_streak_activity(db, current_user.id)
+                db.commit()
+            except Exception as streak_exc:  # noqa: BLE001
+                db.rollback()
+                logger.logger.warning(
+                    "Failed to record streak activity for compatibility reading",
+                    extra={"error": str(streak_exc), "user_id": current_user.id},
+                )
 
-        logger.logger.info(
-            "Compatibility reading generated",
-            extra={
-                "user_id": current_user.id,
-                "person_a": person_a_name,
-                "person_b": person_b_name,
-                "duration": duration,
-            },
-        )
-        reading_status = "success"
+            logger.logger.info(
+                "Compatibility reading generated",
+                extra={
+                    "user_id": current_user.id,
+                    "person_a": person_a_name,
+                    "person_b": person_b_name,
+                    "duration": duration,
+                },
+            )
+            reading_status = "success"
 
-        return CompatibilityReadingResponse(
-            person_a=request_data.person_a,
-            person_b=request_data.person_b,
-            focus=request_data.focus,
-            spread_name=spread.name,
-            cards=response_cards,
-            remaining_free_turns=turn_result.remaining_free_turns,
-            remaining_paid_turns=turn_result.remaining_paid_turns,
-            total_remaining_turns=turn_result.total_remaining_turns,
-        )
+            return CompatibilityReadingResponse(
+                person_a=request_data.person_a,
+                person_b=request_data.person_b,
+                focus=request_data.focus,
+                spread_name=spread.name,
+                cards=response_cards,
+                remaining_free_turns=turn_result.remaining_free_turns,
+                remaining_paid_turns=turn_result.remaining_paid_turns,
+                total_remaining_turns=turn_result.total_remaining_turns,
+            )
 
-    except HTTPException:
-        raise
-    except Exception as e:  # noqa: BLE001
-        logger.logger.error(
-            "Error generating compatibility reading",
-            extra={"user_id": current_user.id, "error": str(e)},
-        )
-        raise TarotAPIException(message="Error generating compatibility reading", details={"error": str(e)})
-    finally:
-        record_tarot_reading(
-            env=settings.FASTAPI_ENV,
-            reading_type=reading_type,
-            status=reading_status,
-            duration=time.time() - start_time,
-        )
+        except HTTPException:
+            raise
+        except Exception as e:  # noqa: BLE001
+            logger.logger.error(
+                "Error generating compatibility reading",
+                extra={"user_id": current_user.id, "error": str(e)},
+            )
+            raise TarotAPIException(message="Error generating compatibility reading", details={"error": str(e)})
+        finally:
+            record_tarot_reading(
+                env=settings.FASTAPI_ENV,
+                reading_type=reading_type,
+                status=reading_status,
+                duration=time.time() - start_time,
+            )
 
 
 @router.post("/compatibility/interpret", response_model=CompatibilityInterpretResponse)
@@ -526,17 +529,22 @@ async def stream_compatibility_interpretation(
 
 
 @router.get("/spreads", response_model=list[SpreadListResponse])
-async def get_spreads(db: Session = Depends(get_db)):
+async def get_spreads(request: Request, db: Session = Depends(get_db)):
     """
     Get Available Tarot Spreads
 
-    Retrieve a list of all available tarot spread templates.
+    Retrieve a list of all available tarot spread templates. The encoded list is
+    served from an in-process cache with a weak ``ETag``; a matching
+    ``If-None-Match`` gets ``304 Not Modified``.
 
     Returns:
         List[SpreadListResponse]: List of available spreads with basic information
     """
-    spreads = db.query(Spread).order_by(Spread.num_cards, Spread.name).all()
-    return spreads
+    body, etag = spread_catalog.get_spread_listing(db)
+    headers = {"ETag": etag}
+    if etag_matches(request.headers.get("if-none-match"), etag):
+        return Response(status_code=304, headers=headers)
+    return Response(content=body, media_type="application/json", headers=headers)
 
 
 @router.get("/spreads/{spread_id}", response_model=SpreadResponse)
@@ -555,7 +563,7 @@ async def get_spread(spread_id: int, db: Session = Depends(get_db)):
     Raises:
         ValidationError (404): Spread not found
     """
-    spread = db.query(Spread).filter(Spread.id == spread_id).first()
+    spread = db.get(Spread, spread_id)
     if not spread:
         raise ValidationError(message="Spread not found", details={"spread_id": spread_id})
 
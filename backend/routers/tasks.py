@@ -2,15 +2,23 @@
 Task management API endpoints for monitoring and controlling Celery tasks.
 """
 
+import asyncio
+import contextlib
 from typing import Any
 
-from fastapi import APIRouter, Depends, HTTPException, status
+import redis.asyncio as aioredis
+from fastapi import APIRouter, Depends, HTTPException, Query, WebSocket, WebSocketDisconnect, status
+from fastapi.concurrency import run_in_threadpool
 from pydantic import BaseModel, EmailStr
 
+from celery_app import celery_app
+from config import settings
+from database import SessionLocal
 from models import User
-from routers.auth import get_admin_user
+from routers.auth import get_admin_user, get_optional_current_user
 from tasks.dead_letter import get_dead_letter_entries, replay_dead_letter_entry
 from utils.celery_utils import (
+    BULK_EMAIL_CHUNK_SIZE,
     email_task_manager,
     notification_task_manager,
     task_manager,
@@ -19,6 +27,38 @@ from utils.logging import logger
 
 router = APIRouter(prefix="/api/tasks", tags=["tasks"])
 
+# States after which a task's status no longer changes
+TERMINAL_TASK_STATES = frozenset({"SUCCESS", "FAILURE", "REVOKED"})
+# How long a status socket waits for a published update before re-reading the status itself
+TASK_STATUS_RECHECK_SECONDS = 15.0
+
+_task_status_redis: aioredis.Redis | None = None
+
+
+def _get_task_status_redis() -> aioredis.Redis | None:
+    """Return the shared async client for the Celery result backend, or None when it is not Redis.
+
+    Connects lazily so the module imports without Redis (e.g. during testing).
+    """
+    global _task_status_redis
+    if _task_status_redis is None:
+        backend_url = str(celery_app.conf.result_backend or "")
+        if not backend_url.startswith(("redis://", "rediss://", "unix://")):
+            return None
+        try:
+            _task_status_redis = aioredis.from_url(backend_url, socket_connect_timeout=2)
+        except Exception:
+            return None
+    return _task_status_redis
+
+
+async def close_task_status_redis() -> None:
+    """Close the shared result backend client (called on application shutdown)."""
+    global _task_status_redis
+    if _task_status_redis is not None:
+        await _task_status_redis.aclose()
+        _task_status_redis = None
+
 
 # Pydantic models for request/response
 class TaskStatusResponse(BaseModel):
@@ -69,6 +109,91 @@ async def get_task_status(task_id: str, current_user: User = Depends(get_admin_u
         )
 
 
+@router.websocket("/ws/status/{task_id}")
+async def task_status_updates(
+    websocket: WebSocket,
+    task_id: str,
+    token: str | None = Query(None, description="Access token, for clients that cannot send the cookie"),
+):
+    """
+    Push the status of a task until it finishes.
+
+    Sends the current status on connect, then a new message each time the status
+    changes, and closes once the task reaches a terminal state. Celery's Redis result
+    backend publishes every stored state on the task's ``celery-task-meta-<id>``
+    channel, so the socket waits on that channel instead of polling. A group (such as
+    a bulk email send) never publishes under its own id, so for a group id the socket
+    subscribes to the channels of its member tasks. The status is also re-read when
+    nothing arrives within `TASK_STATUS_RECHECK_SECONDS`, which is the only source of
+    updates when the result backend is not Redis.
+    `GET /status/{task_id}` stays available for clients that cannot hold a socket.
+
+    Args:
+        websocket: The client connection
+        task_id: The ID of the task to follow
+        token: Access token; the access cookie is used when omitted
+    """
+    # Authenticate in a short-lived session so no pooled connection is held for the socket's lifetime
+    with SessionLocal() as db:
+        user = await get_optional_current_user(
+            websocket, token or websocket.cookies.get(settings.ACCESS_COOKIE_NAME), db
+        )
+        is_admin = user is not None and user.is_admin
+    if not is_admin:
+        await websocket.close(code=status.WS_1008_POLICY_VIOLATION)
+        return
+    await websocket.accept()
+
+    redis_client = _get_task_status_redis()
+    pubsub = redis_client.pubsub() if redis_client is not None else None
+    client_gone = None
+    try:
+        if pubsub is not None:
+            try:
+                # Subscribe before the first read so an update between the two is not missed
+                member_ids = await run_in_threadpool(task_manager.get_group_task_ids, task_id)
+                await pubsub.subscribe(*(f"celery-task-meta-{member_id}" for member_id in [task_id, *member_ids]))
+            except Exception as e:
+                logger.warning(f"Task status updates unavailable for {task_id}, re-reading instead: {str(e)}")
+                pubsub = None
+
+        # Clients only listen, so anything received is the disconnect
+        client_gone = asyncio.ensure_future(websocket.receive())
+        last_sent = None
+        while True:
+            status_info = TaskStatusResponse(
+                **await run_in_threadpool(task_manager.get_task_status, task_id)
+            ).model_dump(mode="json")
+            if status_info != last_sent:
+                await websocket.send_json(status_info)
+                last_sent = status_info
+            if status_info["status"] in TERMINAL_TASK_STATES:
+                await websocket.close()
+                break
+
+            if pubsub is not None:
+                update = asyncio.ensure_future(
+                    pubsub.get_message(ignore_subscribe_messages=True, timeout=TASK_STATUS_RECHECK_SECONDS)
+                )
+            else:
+                update = asyncio.ensure_future(asyncio.sleep(TASK_STATUS_RECHECK_SECONDS))
+            await asyncio.wait({update, client_gone}, return_when=asyncio.FIRST_COMPLETED)
+            if client_gone.done():
+                update.cancel()
+                break
+    except WebSocketDisconnect:
+        pass
+    except HTTPException:
+        # get_task_status already logged why the result backend could not be read
+        await websocket.close(code=status.WS_1011_INTERNAL_ERROR)
+    finally:
+        if client_gone is not None:
+            client_gone.cancel()
+        if pubsub is not None:
+            with contextlib.suppress(Exception):
+                await pubsub.aclose()
+
+
 @router.delete("/cancel/{task_id}")
 async def cancel_task(task_id: str, current_user: User = Depends(get_admin_user)):
     """
@@ -138,6 +263,9 @@ async def send_bulk_email(request: BulkEmailRequest, current_user: User = Depend
     """
     Send bulk emails asynchronously.
 
+    Recipients are split into tasks of `BULK_EMAIL_CHUNK_SIZE` addresses that run in
+    parallel on the email workers; the returned ID follows the whole send.
+
     Args:
         request: Bulk email request data
         current_user: Current authenticated user
@@ -153,8 +281,10 @@ async def send_bulk_email(request: BulkEmailRequest, current_user: User = Depend
             text_body=request.text_body,
         )
 
+        batches = -(-len(request.emails) // BULK_EMAIL_CHUNK_SIZE)
         return TaskCreateResponse(
-            task_id=task_id, message=f"Bulk email task created for {len(request.emails)} recipients"
+            task_id=task_id,
+            message=f"Bulk email task created for {len(request.emails)} recipients in {batches} batch(es)",
         )
     except Exception as e:
         logger.error(f"Error creating bulk email task: {str(e)}")
@@ -1915,8 +1915,9 @@ class SupportTicketResponse(BaseModel):
 
     Attributes:
         message (str): Success message
-        ticket_id (str): Unique identifier for the ticket
-        slack_message_id (Optional[str]): Slack message ID if successfully sent
+        ticket_id (str): Unique identifier for the ticket (32 hex characters, no hyphens)
+        slack_message_id (Optional[str]): Unused and always None since tickets reach Slack after the
+            response is sent; kept for API compatibility
     """
 
     message: str
@@ -0,0 +1,74 @@
+"""Short-lived Redis cache for journal analytics responses.
+
+The analytics endpoints scan a user's whole journal, but the underlying data
+only changes when an entry is created, updated or deleted. Encoded JSON
+responses are cached under a key that embeds a per-user journal version;
+every journal write bumps that version with ``INCR``, so stale payloads are
+simply never read again and expire on their own TTL. Hits are returned as
+raw bytes, skipping both decoding and re-encoding.
+
+Redis is optional here: a failed command degrades to a miss or a no-op and
+marks Redis down for a while (see `utils.redis_client`), so the endpoints
+compute their payload as before without waiting on a dead server each time.
+The helpers block, so async endpoints call them through ``run_in_threadpool``.
+"""
+
+from __future__ import annotations
+
+from utils.logging import logger
+from utils.redis_client import get_redis, note_redis_failure
+
+ANALYTICS_CACHE_TTL = 60
+
+
+def _version_key(user_id: int) -> str:
+    return f"user:{user_id}:journal_ver"
+
+
+def get_cached_analytics(user_id: int, name: str) -> tuple[bytes | None, str | None]:
+    """Look up a cached analytics payload.
+
+    Returns:
+        ``(payload, cache_key)``. ``payload`` is the cached JSON body, or
+        ``None`` on a miss; pass the
+        key to `set_cached_analytics` once the payload is computed. Both are
+        ``None`` when Redis is unavailable.
+    """
+    r = get_redis()
+    if r is None:
+        return None, None
+    try:
+        version = int(r.get(_version_key(user_id)) or 0)
+        cache_key = f"analytics:{name}:{user_id}:{version}"
+        cached = r.get(cache_key)
+    except Exception as e:
+        note_redis_failure(e)
+        logger.debug("Analytics cache unavailable", extra={"error": str(e)})
+        return None, None
+    return cached, cache_key
+
+
+def set_cached_analytics(cache_key: str | None, payload: bytes) -> None:
+    """Store an encoded JSON analytics payload under ``cache_key``."""
+    if cache_key is None:
+        return
+    r = get_redis()
+    if r is None:
+        return
+    try:
+        r.set(cache_key, payload, ex=ANALYTICS_CACHE_TTL)
+    except Exception as e:
+        note_redis_failure(e)
+        logger.debug("Analytics cache write failed", extra={"error": str(e)})
+
+
+def bump_journal_version(user_id: int) -> None:
+    """Invalidate every cached analytics payload for ``user_id``."""
+    r = get_redis()
+    if r is None:
+        return
+    try:
+        r.incr(_version_key(user_id))
+    except Exception as e:
+        note_redis_failure(e)
+        logger.debug("Analytics cache invalidation failed", extra={"error": str(e)})
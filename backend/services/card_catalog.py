@@ -0,0 +1,45 @@
+"""In-process cache of valid card ids.
+
+The card catalogue is small and changes only through the admin card
+endpoints, yet every personal card meaning write used to validate its
+``card_id`` with a query. `card_exists` answers from a process-local
+frozenset loaded on first use.
+
+Each API worker holds its own copy. The admin endpoints call
+`invalidate_card_ids` in the worker that handled the change; other workers
+fall back to the database on a miss and reload their set when that finds a
+card they did not know about.
+"""
+
+from __future__ import annotations
+
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from models import Card
+
+_card_ids: frozenset[int] | None = None
+
+
+def _load_card_ids(db: Session) -> frozenset[int]:
+    global _card_ids
+    _card_ids = frozenset(db.execute(select(Card.id)).scalars())
+    return _card_ids
+
+
+def card_exists(db: Session, card_id: int) -> bool:
+    """Return whether a card with ``card_id`` exists, usually without a query."""
+    card_ids = _card_ids if _card_ids is not None else _load_card_ids(db)
+    if card_id in card_ids:
+        return True
+    # Unknown id: either invalid or added by another worker since we loaded.
+    if db.execute(select(Card.id).where(Card.id == card_id)).first() is None:
+        return False
+    _load_card_ids(db)
+    return True
+
+
+def invalidate_card_ids() -> None:
+    """Drop the cached ids so the next lookup reloads them."""
+    global _card_ids
+    _card_ids = None
@@ -0,0 +1,44 @@
+"""In-process cache of the active subscription plans.
+
+Plans are the same for every user and only change through migrations or
+direct database edits, yet both the plans endpoint and the subscription
+history endpoint used to query them on every request. `get_active_plans`
+serves the validated response models from a process-local copy that is
+reloaded after `PLANS_CACHE_TTL` seconds, so an edited plan shows up
+without a restart. Call `invalidate_plans` after changing plans in-process.
+"""
+
+from __future__ import annotations
+
+import time
+
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from models import SubscriptionPlan
+from schemas import SubscriptionPlanResponse
+
+PLANS_CACHE_TTL = 300
+
+_active_plans: tuple[SubscriptionPlanResponse, ...] | None = None
+_loaded_at = 0.0
+
+
+def get_active_plans(db: Session) -> list[SubscriptionPlanResponse]:
+    """Return the active plans in display order, querying only when the copy is stale."""
+    global _active_plans, _loaded_at
+    if _active_plans is None or time.monotonic() - _loaded_at > PLANS_CACHE_TTL:
+        plans = db.execute(
+            select(SubscriptionPlan)
+            .where(SubscriptionPlan.is_active.is_(True))
+            .order_by(SubscriptionPlan.sort_order, SubscriptionPlan.turns_included)
+        ).scalars()
+        _active_plans = tuple(SubscriptionPlanResponse.model_validate(plan) for plan in plans)
+        _loaded_at = time.monotonic()
+    return list(_active_plans)
+
+
+def invalidate_plans() -> None:
+    """Drop the cached plans so the next lookup reloads them."""
+    global _active_plans
+    _active_plans = None
@@ -0,0 +1,69 @@
+"""Short-lived Redis read-aside cache for public shared readings.
+
+A shared reading never changes after it is created apart from its view
+count, and popular links are fetched far more often than they are written.
+The encoded ``SharedReadingResponse`` body is cached per UUID together with
+its ETag for a few seconds, so hot links are served without touching the
+database. Deleting a reading drops its entry; the TTL bounds everything else,
+including how stale the cached view count can get.
+
+Like the analytics cache, Redis is optional: a failed command degrades to a
+miss or a no-op, marks Redis down for a while (see `utils.redis_client`), and
+the endpoint reads from the database. The helpers block, so the endpoint
+calls them through ``run_in_threadpool``.
+"""
+
+from __future__ import annotations
+
+from utils.logging import logger
+from utils.redis_client import get_redis, note_redis_failure
+
+SHARED_READING_CACHE_TTL = 30
+
+
+def _cache_key(uuid: str) -> str:
+    return f"shared:{uuid}"
+
+
+def get_cached_shared_reading(uuid: str) -> tuple[str, bytes] | None:
+    """Return the cached ``(etag, body)`` for a shared reading, or ``None`` on a miss."""
+    r = get_redis()
+    if r is None:
+        return None
+    try:
+        cached = r.get(_cache_key(uuid))
+    except Exception as e:
+        note_redis_failure(e)
+        logger.debug("Shared reading cache unavailable", extra={"error": str(e)})
+        return None
+    if not cached:
+        return None
+    # Stored as "<etag>\n<body>"; compact JSON never contains a raw newline.
+    etag, _, body = cached.partition(b"\n")
+    return etag.decode(), body
+
+
+def set_cached_shared_reading(uuid: str, etag: str, body: bytes, ttl: int = SHARED_READING_CACHE_TTL) -> None:
+    """Cache the encoded response ``body`` and its ``etag`` for ``ttl`` seconds."""
+    if ttl <= 0:
+        return
+    r = get_redis()
+    if r is None:
+        return
+    try:
+        r.set(_cache_key(uuid), etag.encode() + b"\n" + body, ex=ttl)
+    except Exception as e:
+        note_redis_failure(e)
+        logger.debug("Shared reading cache write failed", extra={"error": str(e)})
+
+
+def invalidate_shared_reading(uuid: str) -> None:
+    """Drop the cached entry for ``uuid``."""
+    r = get_redis()
+    if r is None:
+        return
+    try:
+        r.delete(_cache_key(uuid))
+    except Exception as e:
+        note_redis_failure(e)
+        logger.debug("Shared reading cache invalidation failed", extra={"error": str(e)})
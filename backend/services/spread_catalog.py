@@ -0,0 +1,89 @@
+"""In-process cache of tarot spreads.
+
+Spreads are configuration rows that only change through the admin spread
+endpoints, yet every reading with a ``spread_id`` and every spreads listing
+used to query them. `get_spread` serves detached copies keyed by id and
+`get_spread_listing` serves the encoded listing with its ETag, each reloaded
+after `SPREAD_CACHE_TTL` seconds so a change made through another worker
+shows up without a restart. The admin endpoints call `invalidate_spreads`
+after changing a spread.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import time
+from dataclasses import dataclass
+
+from pydantic import TypeAdapter
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from models import Spread
+from schemas import SpreadListResponse
+
+SPREAD_CACHE_TTL = 300
+
+_LISTING_ADAPTER = TypeAdapter(list[SpreadListResponse])
+
+
+@dataclass(frozen=True)
+class CachedSpread:
+    """Detached copy of a `Spread` row that can be shared across sessions."""
+
+    id: int
+    name: str
+    description: str | None
+    num_cards: int
+    positions: tuple[dict, ...]
+
+    def get_positions(self) -> list[dict]:
+        """Return the position definitions, like `Spread.get_positions`."""
+        return list(self.positions)
+
+
+_spreads: dict[int, tuple[float, CachedSpread]] = {}
+_listing: tuple[float, bytes, str] | None = None
+
+
+def get_spread(db: Session, spread_id: int) -> CachedSpread | None:
+    """Return the spread with ``spread_id``, querying only when the copy is missing or stale."""
+    cached = _spreads.get(spread_id)
+    if cached is not None and time.monotonic() - cached[0] <= SPREAD_CACHE_TTL:
+        return cached[1]
+
+    spread = db.get(Spread, spread_id)
+    if spread is None:
+        # Misses are not cached, so a spread created through another worker is found right away
+        _spreads.pop(spread_id, None)
+        return None
+    copy = CachedSpread(
+        id=spread.id,
+        name=spread.name,
+        description=spread.description,
+        num_cards=spread.num_cards,
+        positions=tuple(spread.get_positions()),
+    )
+    _spreads[spread_id] = (time.monotonic(), copy)
+    return copy
+
+
+def get_spread_listing(db: Session) -> tuple[bytes, str]:
+    """Return the encoded spreads listing and its ETag, ordered by card count then name."""
+    global _listing
+    if _listing is None or time.monotonic() - _listing[0] > SPREAD_CACHE_TTL:
+        # Only the listed columns; the positions JSON is left in the database
+        spreads = db.execute(
+            select(Spread.id, Spread.name, Spread.description, Spread.num_cards).order_by(Spread.num_cards, Spread.name)
+        ).mappings()
+        body = _LISTING_ADAPTER.dump_json(_LISTING_ADAPTER.validate_python(list(spreads)))
+        etag = f'W/"{hashlib.sha256(body).hexdigest()[:32]}"'
+        _listing = (time.monotonic(), body, etag)
+    return _listing[1], _listing[2]
+
+
+def invalidate_spreads() -> None:
+    """Drop every cached spread and the listing so the next lookups reload them."""
+    global _listing
+    _spreads.clear()
+    _listing = None
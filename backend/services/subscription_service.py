@@ -1,15 +1,60 @@
 import hashlib
 import hmac
-from datetime import UTC, datetime
+from datetime import UTC, date, datetime, timedelta
+from functools import lru_cache
 
 import httpx
+from sqlalchemy import select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
 from sqlalchemy.orm import Session
 
 from config import settings
-from database import get_db
-from models import CheckoutSession, PaymentTransaction, SubscriptionEvent, TurnUsageHistory, User
+from database import SessionLocal, get_db
+from models import (
+    CheckoutSession,
+    PaymentTransaction,
+    SubscriptionEvent,
+    TurnUsageDaily,
+    TurnUsageHistory,
+    User,
+    WebhookInbox,
+)
 from schemas import TurnConsumptionResult
 from utils.logging import logger
+from utils.metrics import record_payment_event
+
+# Pending inbox rows younger than this are left to the background task that stored them
+WEBHOOK_REPLAY_GRACE = timedelta(minutes=5)
+
+# Static display details for each purchasable product variant
+_PRODUCT_INFO = {
+    "10_turns": {
+        "name": "10 Drawing Turns",
+        "price": "$3.99",
+        "description": "10 additional tarot card drawing turns",
+    },
+    "20_turns": {
+        "name": "20 Drawing Turns",
+        "price": "$5.99",
+        "description": "20 additional tarot card drawing turns",
+    },
+}
+
+
+def record_daily_turn_usage(db: Session, user_id: int, usage_context: str, day: date) -> None:
+    """Count one consumed turn in the user's daily usage rollup.
+
+    A single upsert on the (user_id, day, usage_context) primary key, executed in
+    the caller's transaction so it commits together with the usage history row.
+    """
+    insert = pg_insert if db.get_bind().dialect.name == "postgresql" else sqlite_insert
+    stmt = insert(TurnUsageDaily).values(user_id=user_id, day=day, usage_context=usage_context, uses=1)
+    stmt = stmt.on_conflict_do_update(
+        index_elements=[TurnUsageDaily.user_id, TurnUsageDaily.day, TurnUsageDaily.usage_context],
+        set_={"uses": TurnUsageDaily.uses + 1},
+    )
+    db.execute(stmt)
 
 
 class SubscriptionService:
@@ -19,6 +64,8 @@ class SubscriptionService:
         self.api_key = settings.LEMON_SQUEEZY_API_KEY
         self.store_id = settings.LEMON_SQUEEZY_STORE_ID
         self.webhook_secret = settings.LEMON_SQUEEZY_WEBHOOK_SECRET
+        # Keyed HMAC template, built on first use; each webhook copies it instead of re-deriving the key pads
+        self._webhook_hmac: hmac.HMAC | None = None
         self.product_id_10_turns = settings.LEMON_SQUEEZY_PRODUCT_ID_10_TURNS
         self.product_id_20_turns = settings.LEMON_SQUEEZY_PRODUCT_ID_20_TURNS
         self.enable_test_mode = settings.LEMON_SQUEEZY_ENABLE_TEST_MODE
@@ -119,26 +166,62 @@ class SubscriptionService:
             logger.info(f"Successfully created checkout URL for user {user.id}, checkout_id: {checkout_id}")
             return checkout_url
 
-    def verify_webhook_signature(self, payload: bytes, signature: str) -> bool:
-        """Verify the webhook signature from Lemon Squeezy.
+    def new_webhook_mac(self) -> hmac.HMAC | None:
+        """Start a webhook signature check.
+
+        Returns:
+            hmac.HMAC | None: A fresh HMAC keyed with the webhook secret, to be fed the raw
+            payload as it arrives and checked with `verify_webhook_mac`, or None when no
+            secret is configured.
+        """
+        if not self.webhook_secret:
+            return None
+        if self._webhook_hmac is None:
+            self._webhook_hmac = hmac.new(self.webhook_secret.encode(), digestmod=hashlib.sha256)
+        return self._webhook_hmac.copy()
+
+    def verify_webhook_mac(self, mac: hmac.HMAC | None, signature: str) -> bool:
+        """Check a signature against an HMAC that has been fed the whole payload.
 
         Args:
-            payload (bytes): The raw payload from the webhook.
+            mac (hmac.HMAC | None): The HMAC returned by `new_webhook_mac`.
             signature (str): The signature from the X-Signature header.
 
         Returns:
             bool: True if the signature is valid, False otherwise.
         """
-        if not self.webhook_secret:
+        if mac is None:
             return False
 
-        expected_signature = hmac.new(self.webhook_secret.encode(), payload, hashlib.sha256).hexdigest()
+        # Compare raw digests in constant time; a header that isn't hex can't match
+        try:
+            received_signature = bytes.fromhex(signature)
+        except ValueError:
+            return False
+
+        return hmac.compare_digest(mac.digest(), received_signature)
+
+    def verify_webhook_signature(self, payload: bytes, signature: str) -> bool:
+        """Verify the webhook signature from Lemon Squeezy.
+
+        Args:
+            payload (bytes): The raw payload from the webhook.
+            signature (str): The signature from the X-Signature header.
 
-        return hmac.compare_digest(signature, expected_signature)
+        Returns:
+            bool: True if the signature is valid, False otherwise.
+        """
+        mac = self.new_webhook_mac()
+        if mac is not None:
+            mac.update(payload)
+        return self.verify_webhook_mac(mac, signature)
 
     def process_webhook_event(self, db: Session, event_data: dict) -> None:
         """Process a webhook event from Lemon Squeezy.
 
+        Changes are flushed, not committed: the caller commits them together
+        with the webhook inbox row that records the event as processed.
+
         Args:
             db (Session): Database session.
             event_data (Dict): The webhook event data.
@@ -298,7 +381,7 @@ class SubscriptionService:
 
         # Update sync timestamp
         user.last_subscription_sync = datetime.now(UTC)
-        db.commit()
+        db.flush()
 
     def _handle_subscription_created_updated(self, user: User, attributes: dict, custom_data: dict, db: Session) -> int:
         """Handle subscription created/updated events.
@@ -606,19 +689,8 @@ class SubscriptionService:
         Returns:
             Dict[str, str]: Product information.
         """
-        products = {
-            "10_turns": {
-                "name": "10 Drawing Turns",
-                "price": "$3.99",
-                "description": "10 additional tarot card drawing turns",
-            },
-            "20_turns": {
-                "name": "20 Drawing Turns",
-                "price": "$5.99",
-                "description": "20 additional tarot card drawing turns",
-            },
-        }
-        return products.get(product_variant, {})
+        # A copy, so callers can't modify the shared catalog
+        return dict(_PRODUCT_INFO.get(product_variant, {}))
 
     def log_subscription_event(
         self,
@@ -757,4 +829,87 @@ class SubscriptionService:
         )
 
         db.add(turn_usage)
+        record_daily_turn_usage(db, user.id, usage_context, datetime.now(UTC).date())
         return turn_usage
+
+
+@lru_cache(maxsize=1)
+def get_subscription_service() -> SubscriptionService:
+    """Return the shared `SubscriptionService`.
+
+    The service only holds settings read at construction, so one instance per
+    process serves every request; use it as a FastAPI dependency or call it directly.
+    """
+    return SubscriptionService()
+
+
+def _extract_lemon_squeezy_amount_usd(event_data: dict) -> float:
+    attributes = event_data.get("data", {}).get("attributes", {})
+    total_cents = attributes.get("total") or 0
+    try:
+        return float(total_cents) / 100
+    except (TypeError, ValueError):
+        return 0.0
+
+
+def apply_stored_webhook(inbox_id: int) -> bool:
+    """Apply a stored Lemon Squeezy webhook in its own session.
+
+    The row is locked and skipped once ``processed_at`` is set, so the request's
+    background task and a replay never apply the same event twice. The event's
+    changes and ``processed_at`` commit in one transaction; on failure the row
+    keeps the error and stays pending for ``replay_pending_webhooks``.
+
+    Returns:
+        bool: True if the event was applied by this call.
+    """
+    with SessionLocal() as db:
+        inbox = db.get(WebhookInbox, inbox_id, with_for_update=True)
+        if inbox is None or inbox.processed_at is not None:
+            return False
+        event_data = inbox.payload
+        event_name = inbox.event_name
+        try:
+            get_subscription_service().process_webhook_event(db, event_data)
+            inbox.processed_at = datetime.now(UTC)
+            inbox.error = None
+            db.commit()
+        except Exception as e:
+            db.rollback()
+            record_payment_event(settings.FASTAPI_ENV, "lemon_squeezy", event_name, "error")
+            logger.error(f"Error processing Lemon Squeezy webhook {inbox_id} ({event_name}): {e}")
+            try:
+                db.query(WebhookInbox).filter(WebhookInbox.id == inbox_id).update({WebhookInbox.error: str(e)})
+                db.commit()
+            except Exception:
+                db.rollback()
+            return False
+
+    record_payment_event(
+        settings.FASTAPI_ENV,
+        provider="lemon_squeezy",
+        event_type=event_name,
+        status="paid" if event_name == "order_created" else "success",
+        amount_usd=_extract_lemon_squeezy_amount_usd(event_data),
+    )
+    return True
+
+
+def replay_pending_webhooks(older_than: timedelta = WEBHOOK_REPLAY_GRACE, limit: int = 100) -> int:
+    """Apply stored webhooks that were never processed.
+
+    Picks up rows whose background task was lost to a restart or failed, oldest
+    first, once they are older than ``older_than``.
+
+    Returns:
+        int: Number of webhooks applied.
+    """
+    cutoff = datetime.now(UTC) - older_than
+    with SessionLocal() as db:
+        inbox_ids = db.scalars(
+            select(WebhookInbox.id)
+            .where(WebhookInbox.processed_at.is_(None), WebhookInbox.received_at <= cutoff)
+            .order_by(WebhookInbox.received_at, WebhookInbox.id)
+            .limit(limit)
+        ).all()
+    return sum(apply_stored_webhook(inbox_id) for inbox_id in inbox_ids)
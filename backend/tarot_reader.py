@@ -1,10 +1,11 @@
 import asyncio
 import json
-import random
 import time
 from collections.abc import AsyncGenerator
+from functools import lru_cache
 from pathlib import Path
 
+import numpy as np
 from dotenv import load_dotenv
 from langchain_core.callbacks import UsageMetadataCallbackHandler
 from langchain_core.output_parsers import StrOutputParser
@@ -27,6 +28,9 @@ _RETRIABLE_ERRORS = (RateLimitError, APIConnectionError)
 _MAX_LLM_RETRIES = 3
 _LLM_RETRY_BASE_SECONDS = 1.0
 
+# Shared generator for card draws; numpy's Generator is seeded from OS entropy
+_RNG = np.random.default_rng()
+
 
 def _usage_from_callback(cb: UsageMetadataCallbackHandler) -> tuple[int, int]:
     """Sum (prompt_tokens, completion_tokens) collected by a usage callback.
@@ -44,69 +48,105 @@ def _usage_from_callback(cb: UsageMetadataCallbackHandler) -> tuple[int, int]:
     return prompt_tokens, completion_tokens
 
 
+# Deck contents only change through the admin card and deck endpoints, so readers share a
+# process-local copy per deck instead of querying it on every reading. Call
+# `invalidate_deck_cards` after changing cards or decks in-process.
+DECK_CARDS_CACHE_TTL = 300
+
+_deck_cards: dict[int, tuple[float, list[dict]]] = {}
+
+
+def invalidate_deck_cards() -> None:
+    """Drop the cached deck contents so the next reader reloads them."""
+    _deck_cards.clear()
+
+
+@lru_cache(maxsize=1)
+def _image_urls() -> dict[str, str]:
+    """Load image URLs from upload_results.json, once per process."""
+    try:
+        logger.info("Loading image URLs from upload_results.json...")
+        with Path("upload_results.json").open() as f:
+            results = json.load(f)
+        urls = {filename: data["image_url"] for filename, data in results.items() if data["status"] == "success"}
+        logger.info(f"Loaded {len(urls)} image URLs successfully")
+        return urls
+    except FileNotFoundError:
+        logger.warning("upload_results.json not found. Image URLs will not be available.")
+        return {}
+
+
+@lru_cache(maxsize=1)
+def _json_cards() -> list[dict]:
+    """Load all tarot cards from the JSON file, once per process."""
+    logger.info("Loading tarot cards from tarot_cards.json...")
+    with Path("tarot_cards.json").open() as f:
+        data = json.load(f)
+
+    image_urls = _image_urls()
+    all_cards = []
+    # Add Major Arcana cards
+    logger.info("Processing Major Arcana cards...")
+    for card in data["major_arcana"]:
+        filename = f"m{card['number']:02d}.jpg"
+        cdn_url = image_urls.get(filename, None)
+        if cdn_url:
+            card["image_url"] = cdn_url
+        # else keep the original image_url from the card data
+        all_cards.append(card)
+
+    # Add Minor Arcana cards
+    logger.info("Processing Minor Arcana cards...")
+    suit_prefixes = {"wands": "w", "cups": "c", "swords": "s", "pentacles": "p"}
+    for suit, cards in data["minor_arcana"].items():
+        prefix = suit_prefixes[suit]
+        for card in cards:
+            filename = f"{prefix}{card['number']:02d}.jpg"
+            cdn_url = image_urls.get(filename, None)
+            if cdn_url:
+                card["image_url"] = cdn_url
+            # else keep the original image_url from the card data
+            all_cards.append(card)
+
+    logger.info(f"Loaded {len(all_cards)} tarot cards successfully")
+    return all_cards
+
+
+@lru_cache(maxsize=1)
+def _get_reading_llm() -> ChatOpenAI:
+    """Return the process-wide reading model, building its HTTP client once."""
+    return ChatOpenAI(
+        temperature=0.7,
+        model="gpt-4.1-mini",
+        streaming=True,
+        stream_usage=True,  # Emit token usage on the final stream chunk for cost metrics
+        max_tokens=800,  # This will ensure responses are under 1000 words
+    )
+
+
 class TarotReader:
     def __init__(self, db: Session = None, deck_id: int = 1):
         logger.info("Initializing TarotReader...")
-        self.llm = ChatOpenAI(
-            temperature=0.7,
-            model="gpt-4.1-mini",
-            streaming=True,
-            stream_usage=True,  # Emit token usage on the final stream chunk for cost metrics
-            max_tokens=800,  # This will ensure responses are under 1000 words
-        )
+        self.llm = _get_reading_llm()
         self.image_urls = self._load_image_urls()
         self.cards = self._load_cards(db, deck_id) if db else self._load_cards_from_json()
         self.output_parser = StrOutputParser()
         logger.info("TarotReader initialized successfully")
 
     def _load_image_urls(self) -> dict[str, str]:
-        """Load image URLs from upload_results.json."""
-        try:
-            logger.info("Loading image URLs from upload_results.json...")
-            with Path("upload_results.json").open() as f:
-                results = json.load(f)
-            urls = {filename: data["image_url"] for filename, data in results.items() if data["status"] == "success"}
-            logger.info(f"Loaded {len(urls)} image URLs successfully")
-            return urls
-        except FileNotFoundError:
-            logger.warning("upload_results.json not found. Image URLs will not be available.")
-            return {}
+        """Return the card image URLs from upload_results.json."""
+        return _image_urls()
 
     def _load_cards_from_json(self) -> list[dict]:
-        """Load all tarot cards from the JSON file."""
-        logger.info("Loading tarot cards from tarot_cards.json...")
-        with Path("tarot_cards.json").open() as f:
-            data = json.load(f)
-
-        all_cards = []
-        # Add Major Arcana cards
-        logger.info("Processing Major Arcana cards...")
-        for card in data["major_arcana"]:
-            filename = f"m{card['number']:02d}.jpg"
-            cdn_url = self.image_urls.get(filename, None)
-            if cdn_url:
-                card["image_url"] = cdn_url
-            # else keep the original image_url from the card data
-            all_cards.append(card)
-
-        # Add Minor Arcana cards
-        logger.info("Processing Minor Arcana cards...")
-        suit_prefixes = {"wands": "w", "cups": "c", "swords": "s", "pentacles": "p"}
-        for suit, cards in data["minor_arcana"].items():
-            prefix = suit_prefixes[suit]
-            for card in cards:
-                filename = f"{prefix}{card['number']:02d}.jpg"
-                cdn_url = self.image_urls.get(filename, None)
-                if cdn_url:
-                    card["image_url"] = cdn_url
-                # else keep the original image_url from the card data
-                all_cards.append(card)
-
-        logger.info(f"Loaded {len(all_cards)} tarot cards successfully")
-        return all_cards
+        """Return all tarot cards from the JSON file."""
+        return _json_cards()
 
     def _load_cards(self, db: Session, deck_id: int) -> list[dict]:
-        """Load cards from the database for a specific deck."""
+        """Return the cards of a specific deck, from the process-local copy when it is fresh."""
+        cached = _deck_cards.get(deck_id)
+        if cached is not None and time.monotonic() - cached[0] <= DECK_CARDS_CACHE_TTL:
+            return cached[1]
+
         logger.info(f"Loading cards from database for deck {deck_id}...")
         from models import Card, Deck
 
@@ -133,6 +173,7 @@ class TarotReader:
             all_cards.append(card_dict)
 
         logger.info(f"Loaded {len(all_cards)} cards from database for deck {deck_id}")
+        _deck_cards[deck_id] = (time.monotonic(), all_cards)
         return all_cards
 
     def shuffle_and_draw(self, num_cards: int = 3, spread=None) -> list[dict]:
@@ -146,44 +187,15 @@ class TarotReader:
             num_cards = spread.num_cards
             logger.info(f"Using spread: {spread.name} with {num_cards} cards")
 
-        # Create a copy of the cards list to avoid modifying the original
-        deck = self.cards.copy()
-
-        # Implement Monte Carlo Probability-based shuffling
-        num_shuffles = random.randint(7, 9)  # Traditional number of shuffles
-        logger.info(f"Performing {num_shuffles} shuffles...")
-        for i in range(num_shuffles):
-            # Split the deck at a random point with normal distribution
-            split_point = int(random.gauss(len(deck) / 2, len(deck) / 6))
-            split_point = max(1, min(split_point, len(deck) - 1))
-
-            # Perfect riffle shuffle with some imperfection
-            left = deck[:split_point]
-            right = deck[split_point:]
-            shuffled = []
-
-            while left and right:
-                # Add some randomness to which pile we draw from
-                if random.random() < 0.5:
-                    if left:
-                        shuffled.append(left.pop(0))
-                else:
-                    if right:
-                        shuffled.append(right.pop(0))
-
-            # Add remaining cards
-            shuffled.extend(left)
-            shuffled.extend(right)
-            deck = shuffled
-            logger.info(f"Completed shuffle {i + 1}/{num_shuffles}")
-
-        # Draw cards
-        logger.info("Drawing cards...")
+        # Pick distinct cards and their orientations in one pass, without copying the deck
+        deck = self.cards
+        count = min(num_cards, len(deck))
+        indices = _RNG.choice(len(deck), size=count, replace=False).tolist()
+        reversals = (_RNG.random(count) < 0.5).tolist()
+
         drawn = []
-        for i in range(min(num_cards, len(deck))):
-            card = deck.pop(random.randint(0, len(deck) - 1))
-            # Randomly decide if card is reversed
-            is_reversed = random.random() < 0.5
+        for i, (index, is_reversed) in enumerate(zip(indices, reversals, strict=True)):
+            card = deck[index]
             card_copy = card.copy()  # Create a copy to avoid modifying the original
             card_copy["orientation"] = "Reversed" if is_reversed else "Upright"
             if "reversed" in card and "upright" in card:
@@ -208,14 +220,10 @@ class TarotReader:
                 card_copy["position_index"] = i
 
             drawn.append(card_copy)
-            logger.info(
-                (
-                    f"Drew card {i + 1}: {card_copy['name']} ({card_copy['orientation']}) in position "
-                    f"'{card_copy.get('position', f'Card {i + 1}')}'"
-                ),
-            )
 
-        logger.info(f"Successfully drew {len(drawn)} cards")
+        # One log record for the whole draw rather than one per card
+        summary = "; ".join(f"{card['name']} ({card['orientation']}) in '{card['position']}'" for card in drawn)
+        logger.info(f"Successfully drew {len(drawn)} cards: {summary}")
         return drawn
 
     async def create_reading(self, concern: str, cards: list[dict]) -> AsyncGenerator[str, None]:
@@ -10,14 +10,17 @@ from datetime import datetime, timezone
 import redis
 
 from celery_app import celery_app
-from config import settings
 from utils.logging import logger
+from utils.redis_client import get_redis, note_redis_failure
 
 DEAD_LETTER_REDIS_KEY = "arcana:dead_letter"
 
 
 def _dead_letter_redis() -> redis.Redis:
-    return redis.from_url(settings.REDIS_URL, socket_connect_timeout=2)
+    r = get_redis()
+    if r is None:
+        raise redis.ConnectionError("Redis is marked down after a recent connection failure")
+    return r
 
 
 @celery_app.task(bind=True, name="log_failed_task", queue="dead_letter")
@@ -42,6 +45,7 @@ def log_failed_task(self, original_task_name: str, original_args: list, error: s
             extra={"original_task": original_task_name, "error": error},
         )
     except Exception as exc:
+        note_redis_failure(exc)
         logger.exception("Failed to persist dead-letter entry: {}", exc)
 
 
@@ -51,7 +55,8 @@ def get_dead_letter_entries(limit: int = 100) -> list[dict]:
         r = _dead_letter_redis()
         raw = r.lrange(DEAD_LETTER_REDIS_KEY, 0, limit - 1)
         return [json.loads(entry) for entry in raw]
-    except Exception:
+    except Exception as exc:
+        note_redis_failure(exc)
         return []
 
 
@@ -76,5 +81,6 @@ def replay_dead_letter_entry(index: int) -> dict | None:
         r.lrem(DEAD_LETTER_REDIS_KEY, 1, raw)
         return entry
     except Exception as exc:
+        note_redis_failure(exc)
         logger.exception("Failed to replay dead-letter entry: {}", exc)
         return None
@@ -0,0 +1,52 @@
+"""Celery tasks for payment webhooks.
+
+Verified Lemon Squeezy webhooks are stored in ``webhook_inbox`` and applied
+in a request background task. The ``replay_pending_webhooks`` task applies
+the ones that background task never finished. Scheduled via Celery Beat (see
+``celery_app.py``).
+"""
+
+from celery import current_task
+
+from celery_app import celery_app
+from services.subscription_service import replay_pending_webhooks
+from utils.logging import logger
+from utils.retry import compute_backoff
+
+
+@celery_app.task(bind=True, name="replay_pending_webhooks", acks_late=True)
+def replay_pending_webhooks_task(self):
+    """
+    Periodic task to apply stored payment webhooks that were never processed.
+
+    A webhook is acknowledged once it is stored in the inbox, so one whose
+    background task was lost to a restart or failed is only applied here.
+
+    Returns:
+        dict: Task result with status and details
+    """
+    try:
+        replayed = replay_pending_webhooks()
+
+        logger.info(
+            "Pending webhook replay completed",
+            extra={"task_id": current_task.request.id, "replayed": replayed},
+        )
+
+        return {
+            "status": "success",
+            "message": f"Replayed {replayed} pending webhooks",
+            "task_id": current_task.request.id,
+            "replayed": replayed,
+        }
+
+    except Exception as e:
+        logger.error(
+            f"Error replaying pending webhooks: {str(e)}",
+            extra={"task_id": current_task.request.id, "error": str(e)},
+        )
+
+        if self.request.retries >= self.max_retries:
+            celery_app.send_task("log_failed_task", args=[self.name, [], str(e)], queue="dead_letter")
+            raise
+        raise self.retry(countdown=compute_backoff(self.request.retries), exc=e)
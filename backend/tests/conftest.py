@@ -1,5 +1,6 @@
 import os
 import sys
+from contextlib import contextmanager
 from pathlib import Path
 os.environ["FASTAPI_ENV"] = "local"
 os.environ["MAIL_FROM"] = "test@example.com"
@@ -18,7 +19,7 @@ limiter.limit = no_limit
 
 import pytest
 from fastapi.testclient import TestClient
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, event
 from sqlalchemy.orm import sessionmaker
 from sqlalchemy.pool import StaticPool
 from unittest.mock import patch, MagicMock
@@ -106,6 +107,117 @@ def db_session():
             Base.metadata.drop_all(bind=engine)
 
 
+@pytest.fixture(scope="function")
+def session_factory(db_session):
+    """Session factory bound to the test database, for code that opens its own ``SessionLocal()``."""
+    return TestingSessionLocal
+
+
+@pytest.fixture(scope="function")
+def no_lazy_loads(db_session):
+    """Return a context manager that fails on any relationship lazy load query.
+
+    Endpoints that serialize ORM objects must load what their response schema
+    traverses up front. Wrapping a request in ``with no_lazy_loads():`` makes a
+    missed relationship (an N+1 lazy load) raise instead of silently issuing a
+    query per row.
+    """
+    def fail_on_lazy_load(orm_execute_state):
+        if orm_execute_state.is_select and orm_execute_state.lazy_loaded_from is not None:
+            raise AssertionError(f"Unexpected lazy load: {orm_execute_state.statement}")
+
+    @contextmanager
+    def guard():
+        event.listen(db_session, "do_orm_execute", fail_on_lazy_load)
+        try:
+            yield
+        finally:
+            event.remove(db_session, "do_orm_execute", fail_on_lazy_load)
+
+    return guard
+
+
+class FakePubSub:
+    """Stand-in for an async Redis pub/sub connection that reports an update on every wait."""
+
+    def __init__(self):
+        self.channels = []
+        self.closed = False
+
+    async def subscribe(self, *channels):
+        self.channels.extend(channels)
+
+    async def get_message(self, ignore_subscribe_messages=False, timeout=None):
+        return {"type": "message", "channel": self.channels[0], "data": b"{}"}
+
+    async def aclose(self):
+        self.closed = True
+
+
+class FakeRedis:
+    """In-memory stand-in for the Redis commands the caches, guards and status sockets use."""
+
+    def __init__(self):
+        self.store = {}
+        self.pubsubs = []
+
+    def get(self, key):
+        return self.store.get(key)
+
+    def set(self, key, value, nx=False, ex=None):
+        if nx and key in self.store:
+            return None
+        self.store[key] = value if isinstance(value, bytes) else str(value).encode()
+        return True
+
+    def incr(self, key):
+        self.store[key] = str(int(self.store.get(key, 0)) + 1).encode()
+        return int(self.store[key])
+
+    def delete(self, key):
+        self.store.pop(key, None)
+
+    def pubsub(self):
+        self.pubsubs.append(FakePubSub())
+        return self.pubsubs[-1]
+
+
+@pytest.fixture(scope="function")
+def fake_redis():
+    """Serve the shared Redis client (`utils.redis_client`) from an in-memory fake."""
+    from utils import redis_client
+
+    fake = FakeRedis()
+    with patch.object(redis_client, "_redis", fake), patch.object(redis_client, "_down_until", 0.0):
+        yield fake
+
+
+@pytest.fixture(scope="function")
+def count_statements(db_session):
+    """Return a context manager that records the SQL sent to the test database.
+
+    ``with count_statements() as statements:`` collects every statement executed
+    inside the block, so a test can assert that a cached path runs no query or
+    that a handler does not re-select what it just wrote.
+    """
+    engine = db_session.get_bind()
+
+    @contextmanager
+    def recorder():
+        statements = []
+
+        def record(conn, cursor, statement, parameters, context, executemany):
+            statements.append(statement)
+
+        event.listen(engine, "before_cursor_execute", record)
+        try:
+            yield statements
+        finally:
+            event.remove(engine, "before_cursor_execute", record)
+
+    return recorder
+
+
 @pytest.fixture(scope="function")
 def mock_celery_app():
     """Mock the entire Celery app to prevent Redis connections"""
@@ -418,9 +530,20 @@ def mock_openai():
 
 @pytest.fixture(autouse=True)
 def disable_rate_limiting():
-    """Clear user_request_counts for custom chat limiter"""
-    from routers.chat import user_request_counts
+    """Clear user_request_counts for custom chat limiter and per-process caches"""
+    from routers.chat import _get_chat_llm, _get_tool_llm, user_request_counts
+    from services.card_catalog import invalidate_card_ids
+    from services.plan_catalog import invalidate_plans
+    from services.spread_catalog import invalidate_spreads
+    from tarot_reader import _get_reading_llm, invalidate_deck_cards
     user_request_counts.clear()
+    _get_chat_llm.cache_clear()
+    _get_tool_llm.cache_clear()
+    _get_reading_llm.cache_clear()
+    invalidate_card_ids()
+    invalidate_plans()
+    invalidate_spreads()
+    invalidate_deck_cards()
     yield
 
 # Restore limiter after all tests (optional, for safety)
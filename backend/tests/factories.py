@@ -1,10 +1,15 @@
-from models import User, ChatSession, Card, PasswordResetToken, UserReadingJournal, UserCardMeaning, ReadingReminder
+from models import (
+    User, ChatSession, Card, PasswordResetToken, UserReadingJournal, UserCardMeaning, ReadingReminder, SharedReading,
+    SubscriptionEvent, PaymentTransaction, TurnUsageHistory
+)
 from sqlalchemy.orm import Session
 import random
 import string
 import uuid
 from datetime import datetime, timedelta
 
+from services.subscription_service import record_daily_turn_usage
+
 def random_string(length=8):
     return ''.join(random.choices(string.ascii_lowercase, k=length))
 
@@ -200,3 +205,89 @@ class ReminderFactory:
         db.commit()
         db.refresh(reminder)
         return reminder
+
+
+class SharedReadingFactory:
+    @staticmethod
+    def create(db: Session, user_id: int, **kwargs):
+        reading = SharedReading(
+            user_id=user_id,
+            creator_username=kwargs.get('creator_username') or db.get(User, user_id).username,
+            title=kwargs.get('title', 'Shared Reading'),
+            concern=kwargs.get('concern', 'What does the week hold?'),
+            spread_name=kwargs.get('spread_name', 'three_card'),
+            deck_name=kwargs.get('deck_name'),
+            expires_at=kwargs.get('expires_at'),
+            is_public=kwargs.get('is_public', True),
+            view_count=kwargs.get('view_count', 0),
+        )
+        reading.set_cards_data(kwargs.get('cards', [
+            {"name": "The Fool", "orientation": "upright", "meaning": "New beginnings"}
+        ]))
+        if 'created_at' in kwargs:
+            reading.created_at = kwargs['created_at']
+        db.add(reading)
+        db.commit()
+        db.refresh(reading)
+        return reading
+
+
+class SubscriptionEventFactory:
+    @staticmethod
+    def create(db: Session, user_id: int, **kwargs):
+        event = SubscriptionEvent(
+            user_id=user_id,
+            event_type=kwargs.get('event_type', 'created'),
+            event_source=kwargs.get('event_source', 'lemon_squeezy'),
+            external_id=kwargs.get('external_id'),
+            subscription_status=kwargs.get('subscription_status', 'active'),
+            turns_affected=kwargs.get('turns_affected', 10),
+            created_at=kwargs.get('created_at', datetime.utcnow()),
+        )
+        db.add(event)
+        db.commit()
+        db.refresh(event)
+        return event
+
+
+class PaymentTransactionFactory:
+    @staticmethod
+    def create(db: Session, user_id: int, **kwargs):
+        transaction = PaymentTransaction(
+            user_id=user_id,
+            transaction_type=kwargs.get('transaction_type', 'purchase'),
+            payment_method=kwargs.get('payment_method', 'lemon_squeezy'),
+            external_transaction_id=kwargs.get('external_transaction_id', str(uuid.uuid4())),
+            amount=kwargs.get('amount', '9.99'),
+            currency=kwargs.get('currency', 'USD'),
+            product_variant=kwargs.get('product_variant', '10_turns'),
+            turns_purchased=kwargs.get('turns_purchased', 10),
+            status=kwargs.get('status', 'completed'),
+        )
+        if 'created_at' in kwargs:
+            transaction.created_at = kwargs['created_at']
+        db.add(transaction)
+        db.commit()
+        db.refresh(transaction)
+        return transaction
+
+
+class TurnUsageHistoryFactory:
+    @staticmethod
+    def create(db: Session, user_id: int, **kwargs):
+        usage = TurnUsageHistory(
+            user_id=user_id,
+            turn_type=kwargs.get('turn_type', 'free'),
+            usage_context=kwargs.get('usage_context', 'reading'),
+            turns_before=kwargs.get('turns_before', 3),
+            turns_after=kwargs.get('turns_after', 2),
+        )
+        if 'consumed_at' in kwargs:
+            usage.consumed_at = kwargs['consumed_at']
+        db.add(usage)
+        # Mirror SubscriptionService.log_turn_usage, which keeps the daily rollup in step
+        day = kwargs['consumed_at'].date() if 'consumed_at' in kwargs else datetime.utcnow().date()
+        record_daily_turn_usage(db, user_id, usage.usage_context, day)
+        db.commit()
+        db.refresh(usage)
+        return usage
@@ -1,8 +1,9 @@
 import pytest
 from fastapi import status
-from models import ChatSession, User
+from models import ChatSession, SharedReading, User
 from routers.auth import create_access_token
 from database import get_db
+from tests.factories import SharedReadingFactory
 
 @pytest.fixture(scope="function")
 def admin_auth_headers(db_session):
@@ -161,6 +162,21 @@ def test_admin_update_user_full_name(client, admin_auth_headers, test_user, db_s
     assert data["full_name"] == "Admin Updated Name"
 
 
+def test_admin_username_change_updates_shared_readings(client, admin_auth_headers, test_user, db_session):
+    """Test renaming a user refreshes the username copied onto their shared readings"""
+    reading_id = SharedReadingFactory.create(db_session, user_id=test_user.id).id
+
+    response = client.put(
+        f"/admin/users/{test_user.id}",
+        headers=admin_auth_headers,
+        json={"username": "renamed_reader"}
+    )
+    assert response.status_code == status.HTTP_200_OK
+
+    db_session.expire_all()
+    assert db_session.get(SharedReading, reading_id).creator_username == "renamed_reader"
+
+
 def test_admin_update_user_full_name_empty_string(client, admin_auth_headers, test_user, db_session):
     """Test admin can clear user full name with empty string"""
     response = client.put(
@@ -0,0 +1,55 @@
+from unittest.mock import MagicMock, patch
+
+import redis
+
+from services import analytics_cache
+from utils import redis_client
+
+
+class TestAnalyticsCacheHelpers:
+    def test_round_trip_and_version_bump(self, fake_redis):
+        payload, key = analytics_cache.get_cached_analytics(1, "summary")
+        assert payload is None
+
+        analytics_cache.set_cached_analytics(key, b'{"total_entries":1}')
+        assert analytics_cache.get_cached_analytics(1, "summary")[0] == b'{"total_entries":1}'
+
+        analytics_cache.bump_journal_version(1)
+        assert analytics_cache.get_cached_analytics(1, "summary")[0] is None
+
+    def test_no_redis_is_a_no_op(self):
+        with patch.object(analytics_cache, "get_redis", return_value=None):
+            assert analytics_cache.get_cached_analytics(1, "summary") == (None, None)
+            analytics_cache.set_cached_analytics(None, b"{}")
+            analytics_cache.bump_journal_version(1)
+
+    def test_connection_error_marks_redis_down(self):
+        down = MagicMock()
+        down.get.side_effect = redis.ConnectionError("refused")
+
+        with patch.object(redis_client, "_redis", down), patch.object(redis_client, "_down_until", 0.0):
+            assert analytics_cache.get_cached_analytics(1, "summary") == (None, None)
+            assert analytics_cache.get_cached_analytics(1, "summary") == (None, None)
+            analytics_cache.bump_journal_version(1)
+
+        # Only the first lookup reached the server; later calls skip Redis until the backoff expires
+        assert down.get.call_count == 1
+        down.incr.assert_not_called()
+
+
+class TestCachedAnalyticsEndpoints:
+    def test_card_frequency_is_cached_until_journal_write(self, client, auth_headers, fake_redis):
+        entry = {"reading_snapshot": {"cards": [{"name": "The Fool"}]}, "tags": ["love"]}
+        assert client.post("/api/journal/entries", json=entry, headers=auth_headers).status_code == 201
+
+        first = client.get("/api/journal/analytics/card-frequency", headers=auth_headers).json()
+        assert first["card_frequency"][0]["count"] == 1
+
+        with patch("routers.journal.Counter", side_effect=AssertionError("should be served from cache")):
+            cached = client.get("/api/journal/analytics/card-frequency", headers=auth_headers)
+        assert cached.status_code == 200
+        assert cached.json() == first
+
+        assert client.post("/api/journal/entries", json=entry, headers=auth_headers).status_code == 201
+        refreshed = client.get("/api/journal/analytics/card-frequency", headers=auth_headers).json()
+        assert refreshed["card_frequency"][0]["count"] == 2
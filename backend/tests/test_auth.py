@@ -1,10 +1,12 @@
+import asyncio
 from datetime import datetime, timedelta
 from unittest.mock import patch
 
 from fastapi import status
+from starlette.requests import Request
 
 from models import PasswordResetToken, User
-from routers.auth import create_refresh_token
+from routers.auth import create_access_token, create_refresh_token, get_current_user, get_optional_current_user
 
 
 # Registration Tests
@@ -1114,3 +1116,20 @@ def test_update_user_profile_partial_preference_leaves_others(client, auth_heade
     data = response.json()
     assert data["card_animations"] == "off"  # unchanged by the second request
     assert data["reading_language"] == "French"
+
+
+def test_current_user_is_loaded_once_per_request(db_session, test_user, count_statements):
+    """Test a user already loaded for the request is reused without decoding or querying again."""
+    request = Request({"type": "http", "headers": [], "state": {}})
+    token = create_access_token(data={"sub": test_user.username})
+
+    with count_statements() as statements:
+        first = asyncio.run(get_current_user(request, token, db_session))
+        again = asyncio.run(get_current_user(request, None, db_session))
+        optional = asyncio.run(get_optional_current_user(request, None, db_session))
+
+    assert first.id == test_user.id
+    assert again is first
+    assert optional is first
+    assert request.state.user is first
+    assert len(statements) == 1
@@ -0,0 +1,33 @@
+from models import Card
+from services import card_catalog
+
+
+class TestCardExists:
+    def test_known_card_is_answered_from_cache(self, db_session, test_cards, count_statements):
+        card_id = test_cards[0].id
+        assert card_catalog.card_exists(db_session, card_id)
+
+        with count_statements() as statements:
+            assert card_catalog.card_exists(db_session, card_id)
+
+        assert statements == []
+
+    def test_unknown_card_returns_false(self, db_session, test_cards):
+        assert card_catalog.card_exists(db_session, 999999) is False
+
+    def test_card_added_after_load_is_found(self, db_session, test_cards):
+        assert card_catalog.card_exists(db_session, test_cards[0].id)
+
+        card = Card(name="The Sun", suit="Major Arcana", deck_id=test_cards[0].deck_id)
+        db_session.add(card)
+        db_session.commit()
+
+        assert card_catalog.card_exists(db_session, card.id)
+        assert card.id in card_catalog._card_ids
+
+    def test_invalidate_forces_reload(self, db_session, test_cards):
+        card_catalog.card_exists(db_session, test_cards[0].id)
+
+        card_catalog.invalidate_card_ids()
+
+        assert card_catalog._card_ids is None
@@ -0,0 +1,128 @@
+import json
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
+
+import pytest
+from fastapi import HTTPException
+
+from models import Message
+from routers import chat
+from routers.chat import _save_and_emit
+from tests.factories import ChatSessionFactory
+
+
+def _parse_frame(frame: str) -> dict:
+    assert frame.startswith("data: ") and frame.endswith("\n\n")
+    return json.loads(frame[len("data: "):])
+
+
+class TestSaveAndEmit:
+    def test_persists_message_and_builds_frame(self, db_session, test_user, test_chat_session):
+        frame = _save_and_emit(db_session, test_chat_session.id, test_user, "The cards suggest patience.")
+
+        payload = _parse_frame(frame)
+        assert payload["type"] == "assistant_message"
+        assert payload["message"]["role"] == "assistant"
+        assert payload["message"]["content"] == "The cards suggest patience."
+        assert payload["message"]["cards"] == []
+        assert payload["message"]["created_at"]
+
+        # The message is committed before its id is emitted
+        db_session.rollback()
+        saved = db_session.get(Message, payload["message"]["id"])
+        assert saved is not None
+        assert saved.chat_session_id == test_chat_session.id
+
+    def test_includes_drawn_cards(self, db_session, test_user, test_chat_session, test_cards):
+        tuples = [(test_cards[0], "upright"), (test_cards[1], "reversed")]
+
+        frame = _save_and_emit(
+            db_session, test_chat_session.id, test_user, "Reading", card_orientation_tuples=tuples
+        )
+
+        cards = _parse_frame(frame)["message"]["cards"]
+        assert [(c["id"], c["orientation"]) for c in cards] == [
+            (test_cards[0].id, "upright"),
+            (test_cards[1].id, "reversed"),
+        ]
+
+    def test_missing_session_raises_404(self, db_session, test_user):
+        with pytest.raises(HTTPException) as exc_info:
+            _save_and_emit(db_session, 999999, test_user, "orphan")
+
+        assert exc_info.value.status_code == 404
+        assert db_session.query(Message).count() == 0
+
+    def test_skips_session_validation_when_requested(self, db_session, test_user, test_chat_session):
+        frame = _save_and_emit(
+            db_session, test_chat_session.id, test_user, "No turns left", status="error", validate_session=False
+        )
+
+        assert _parse_frame(frame)["message"]["content"] == "No turns left"
+
+
+class TestSearchChatSessions:
+    def test_returns_matching_sessions_for_user(self, client, db_session, test_user, test_user_2, auth_headers):
+        ChatSessionFactory.create(db_session, user_id=test_user.id, title="Career Guidance")
+        ChatSessionFactory.create(db_session, user_id=test_user.id, title="Love Reading")
+        ChatSessionFactory.create(db_session, user_id=test_user_2.id, title="Career Change")
+
+        response = client.get("/chat/search", params={"q": "career"}, headers=auth_headers)
+
+        assert response.status_code == 200
+        data = response.json()
+        assert [session["title"] for session in data] == ["Career Guidance"]
+        assert set(data[0]) == {"id", "title", "created_at"}
+
+
+class TestCreateMessageStream:
+    @staticmethod
+    def _events(response) -> list[dict]:
+        return [json.loads(line[len("data: "):]) for line in response.text.splitlines() if line.startswith("data: ")]
+
+    def test_plain_reply_is_streamed_and_persisted(self, client, db_session, test_user, test_chat_session, auth_headers):
+        async def fake_astream(_messages):
+            for text in ("The stars ", "are aligned."):
+                yield SimpleNamespace(content=text)
+
+        llm = MagicMock()
+        llm.bind_tools.return_value.invoke.return_value = SimpleNamespace(
+            tool_calls=[], usage_metadata={}, response_metadata={}
+        )
+        llm.astream = fake_astream
+
+        with patch("routers.chat.ChatOpenAI", return_value=llm):
+            response = client.post(
+                f"/chat/sessions/{test_chat_session.id}/messages/",
+                json={"content": "What does today hold?"},
+                headers=auth_headers,
+            )
+
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("text/event-stream")
+        assert response.headers["cache-control"] == "no-cache"
+        events = self._events(response)
+        assert events[0]["type"] == "user_message"
+        assistant = events[-1]
+        assert assistant["type"] == "assistant_message"
+        assert assistant["message"]["content"] == "The stars are aligned."
+
+        db_session.expire_all()
+        saved = db_session.get(Message, assistant["message"]["id"])
+        assert saved is not None
+        assert saved.content == "The stars are aligned."
+
+
+class TestToolLlmCache:
+    def test_binds_tools_once_per_tool_set(self):
+        with patch("routers.chat.ChatOpenAI") as mock_chat_openai:
+            first = chat._get_tool_llm(True)
+            assert chat._get_tool_llm(True) is first
+            chat._get_tool_llm(False)
+
+        mock_chat_openai.assert_called_once()
+        bind_tools = mock_chat_openai.return_value.bind_tools
+        assert [call.args[0] for call in bind_tools.call_args_list] == [
+            [chat.DRAW_CARDS_TOOL, chat.RENAME_CHAT_TOOL],
+            [chat.DRAW_CARDS_TOOL],
+        ]
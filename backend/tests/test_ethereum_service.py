@@ -15,6 +15,31 @@ from models import EthereumTransaction, User
 from tests.factories import UserFactory
 
 
+class FakeBatch:
+    """Stands in for web3's request batcher: execute() returns what each queued call returned."""
+
+    def __init__(self):
+        self.requests = []
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        return False
+
+    def add(self, request):
+        self.requests.append(request)
+
+    def execute(self):
+        return list(self.requests)
+
+
+def batching_w3():
+    w3 = Mock()
+    w3.batch_requests.side_effect = FakeBatch
+    return w3
+
+
 class TestEthereumService:
     """Test suite for EthereumService class."""
 
@@ -140,7 +165,7 @@ class TestEthereumService:
         mock_is_connected.return_value = True
 
         service = EthereumService()
-        service.w3 = Mock()
+        service.w3 = batching_w3()
         service.w3.eth.get_transaction.return_value = None
 
         result = service.verify_transaction(
@@ -162,7 +187,7 @@ class TestEthereumService:
         mock_is_connected.return_value = True
 
         service = EthereumService()
-        service.w3 = Mock()
+        service.w3 = batching_w3()
 
         # Mock transaction
         mock_tx = {
@@ -192,7 +217,7 @@ class TestEthereumService:
         mock_is_connected.return_value = True
 
         service = EthereumService()
-        service.w3 = Mock()
+        service.w3 = batching_w3()
         service.payment_address = "0x0146311bdb312198b64c905fc249a35770dd9193"
 
         # Mock transaction to wrong address
@@ -208,7 +233,7 @@ class TestEthereumService:
         mock_receipt.status = 1
         mock_receipt.blockNumber = 1000
         service.w3.eth.get_transaction_receipt.return_value = mock_receipt
-        service.w3.eth.block_number = 1005
+        service.w3.eth.get_block_number.return_value = 1005
 
         result = service.verify_transaction(
             "0x1234567890abcdef",
@@ -225,7 +250,7 @@ class TestEthereumService:
         mock_is_connected.return_value = True
 
         service = EthereumService()
-        service.w3 = Mock()
+        service.w3 = batching_w3()
         service.payment_address = "0x0146311bdb312198b64c905fc249a35770dd9193"
 
         # Mock transaction from wrong sender
@@ -241,7 +266,7 @@ class TestEthereumService:
         mock_receipt.status = 1
         mock_receipt.blockNumber = 1000
         service.w3.eth.get_transaction_receipt.return_value = mock_receipt
-        service.w3.eth.block_number = 1005
+        service.w3.eth.get_block_number.return_value = 1005
 
         result = service.verify_transaction(
             "0x1234567890abcdef",
@@ -258,7 +283,7 @@ class TestEthereumService:
         mock_is_connected.return_value = True
 
         service = EthereumService()
-        service.w3 = Mock()
+        service.w3 = batching_w3()
         service.payment_address = "0x0146311bdb312198b64c905fc249a35770dd9193"
 
         # Mock transaction with wrong amount (0.002 ETH instead of 0.0016)
@@ -274,7 +299,7 @@ class TestEthereumService:
         mock_receipt.status = 1
         mock_receipt.blockNumber = 1000
         service.w3.eth.get_transaction_receipt.return_value = mock_receipt
-        service.w3.eth.block_number = 1005
+        service.w3.eth.get_block_number.return_value = 1005
 
         result = service.verify_transaction(
             "0x1234567890abcdef",
@@ -291,7 +316,7 @@ class TestEthereumService:
         mock_is_connected.return_value = True
 
         service = EthereumService()
-        service.w3 = Mock()
+        service.w3 = batching_w3()
         service.payment_address = "0x0146311bdb312198b64c905fc249a35770dd9193"
 
         # Mock transaction
@@ -307,7 +332,7 @@ class TestEthereumService:
         mock_receipt.status = 1
         mock_receipt.blockNumber = 1005
         service.w3.eth.get_transaction_receipt.return_value = mock_receipt
-        service.w3.eth.block_number = 1005
+        service.w3.eth.get_block_number.return_value = 1005
 
         result = service.verify_transaction(
             "0x1234567890abcdef",
@@ -324,7 +349,7 @@ class TestEthereumService:
         mock_is_connected.return_value = True
 
         service = EthereumService()
-        service.w3 = Mock()
+        service.w3 = batching_w3()
         service.payment_address = "0x0146311bdb312198b64c905fc249a35770dd9193"
 
         # Mock transaction
@@ -341,7 +366,7 @@ class TestEthereumService:
         mock_receipt.blockNumber = 1000
         mock_receipt.gasUsed = 21000
         service.w3.eth.get_transaction_receipt.return_value = mock_receipt
-        service.w3.eth.block_number = 1005
+        service.w3.eth.get_block_number.return_value = 1005
 
         result = service.verify_transaction(
             "0x1234567890abcdef",
@@ -362,7 +387,7 @@ class TestEthereumService:
         mock_is_connected.return_value = True
 
         service = EthereumService()
-        service.w3 = Mock()
+        service.w3 = batching_w3()
         service.w3.eth.get_transaction.side_effect = Exception("Network error")
 
         result = service.verify_transaction(
@@ -575,3 +600,19 @@ class TestEthereumService:
         assert result["transaction_verified"] is False
         assert result["turns_added"] == 0
         assert "Payment processing failed" in result["message"]
+
+    @patch('services.ethereum_service.EthereumService.is_connected')
+    def test_verify_transaction_uses_one_batched_request(self, mock_is_connected):
+        """Test the transaction, receipt and block number are fetched in a single batch."""
+        mock_is_connected.return_value = True
+
+        service = EthereumService()
+        service.w3 = batching_w3()
+        service.w3.eth.get_transaction.return_value = None
+
+        service.verify_transaction("0x1234567890abcdef", Decimal("0.0016"), "0xabcdef1234567890")
+
+        service.w3.batch_requests.assert_called_once()
+        service.w3.eth.get_transaction.assert_called_once_with("0x1234567890abcdef")
+        service.w3.eth.get_transaction_receipt.assert_called_once_with("0x1234567890abcdef")
+        service.w3.eth.get_block_number.assert_called_once_with()
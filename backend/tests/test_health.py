@@ -1,5 +1,12 @@
+import asyncio
+from unittest.mock import MagicMock, patch
+
+import orjson
+import pytest
 from fastapi import status
 
+from routers import health
+
 
 def test_health_check_success(client):
     """Test successful health check returns correct response"""
@@ -246,3 +253,60 @@ def test_health_check_encoding(client):
     # String values should be properly encoded
     assert isinstance(data["status"], str)
     assert isinstance(data["message"], str)
+
+
+@pytest.fixture
+def reset_db_health_cache():
+    health._last_db_ok_ts = 0.0
+    health._last_db_traceback_ts = None
+    yield
+    health._last_db_ok_ts = 0.0
+    health._last_db_traceback_ts = None
+
+
+def test_db_health_check_success(client, reset_db_health_cache):
+    """Test database health check reports a connected database"""
+    response = client.get("/health/db")
+    assert response.status_code == status.HTTP_200_OK
+    assert response.json() == {"status": "healthy", "database": "connected"}
+
+
+def test_db_health_check_caches_recent_success(reset_db_health_cache):
+    """Test a recent successful probe is reused without querying the database"""
+    db = MagicMock()
+
+    first = asyncio.run(health.check_db_health(db))
+    second = asyncio.run(health.check_db_health(db))
+
+    assert orjson.loads(first.body) == orjson.loads(second.body) == {"status": "healthy", "database": "connected"}
+
+    db.execute.assert_called_once()
+
+
+def test_db_health_check_failure_is_not_cached(reset_db_health_cache):
+    """Test failed probes are reported and retried on the next call"""
+    db = MagicMock()
+    db.execute.side_effect = RuntimeError("connection refused")
+
+    first = asyncio.run(health.check_db_health(db))
+    second = asyncio.run(health.check_db_health(db))
+
+    assert first == {"status": "unhealthy", "database": "disconnected", "error": "connection refused"}
+    assert second["status"] == "unhealthy"
+    assert db.execute.call_count == 2
+
+
+def test_db_health_check_rate_limits_tracebacks(reset_db_health_cache):
+    """Test repeated failures only capture a traceback once per interval"""
+    db = MagicMock()
+    db.execute.side_effect = RuntimeError("connection refused")
+
+    with patch.object(health.logger.logger, "error") as mock_error:
+        asyncio.run(health.check_db_health(db))
+        asyncio.run(health.check_db_health(db))
+
+    first_extra = mock_error.call_args_list[0].kwargs["extra"]
+    second_extra = mock_error.call_args_list[1].kwargs["extra"]
+    assert "traceback" in first_extra
+    assert "traceback" not in second_extra
+    assert second_extra["error"] == "connection refused"
@@ -1,14 +1,23 @@
 from fastapi import status
 from unittest.mock import patch, MagicMock
-from datetime import datetime, timedelta
+from datetime import UTC, datetime, timedelta
 import json
 import pytest
+from sqlalchemy import event
 from sqlalchemy.orm import Session
 
-from models import UserReadingJournal, UserCardMeaning, ReadingReminder
+from models import UserReadingJournal, UserCardMeaning, ReadingReminder, UserAnalyticsSnapshot
+from routers import journal
 from tests.factories import JournalEntryFactory, PersonalCardMeaningFactory
 
 
+@pytest.fixture(autouse=True)
+def analytics_snapshot_sessions(session_factory):
+    """Refresh analytics snapshots against the test database."""
+    with patch.object(journal, "SessionLocal", session_factory):
+        yield
+
+
 class TestJournalAPI:
     """Test suite for Journal API endpoints"""
 
@@ -66,7 +75,7 @@ class TestJournalAPI:
         assert data["tags"] == []
         assert data["is_favorite"] is False
 
-    def test_create_journal_entry_with_follow_up(self, client, auth_headers):
+    def test_create_journal_entry_with_follow_up(self, client, auth_headers, db_session):
         """Test creating journal entry with follow-up date"""
         follow_up_date = datetime.utcnow() + timedelta(days=30)
         entry_data = {
@@ -74,16 +83,47 @@ class TestJournalAPI:
             "personal_notes": "Important reading - check back in 30 days",
             "follow_up_date": follow_up_date.isoformat()
         }
+        commits = []
 
-        response = client.post(
-            "/api/journal/entries",
-            json=entry_data,
-            headers=auth_headers
-        )
+        def count_commit(session):
+            commits.append(session)
+
+        event.listen(db_session, "after_commit", count_commit)
+        try:
+            response = client.post(
+                "/api/journal/entries",
+                json=entry_data,
+                headers=auth_headers
+            )
+        finally:
+            event.remove(db_session, "after_commit", count_commit)
 
         assert response.status_code == status.HTTP_201_CREATED
         data = response.json()
         assert data["follow_up_date"] is not None
+        # Entry, streak and follow-up reminder are written in a single transaction
+        assert len(commits) == 1
+        reminder = db_session.query(ReadingReminder).filter(ReadingReminder.journal_entry_id == data["id"]).one()
+        assert reminder.reminder_type == "follow_up"
+
+    def test_create_and_update_journal_entry_skip_refresh(self, client, auth_headers, count_statements):
+        """Test that writes build their response without re-selecting the entry"""
+        with count_statements() as statements:
+            created = client.post("/api/journal/entries", json={"reading_snapshot": {"cards": []}},
+                                  headers=auth_headers)
+            updated = client.put(f"/api/journal/entries/{created.json()['id']}", json={"is_favorite": True},
+                                 headers=auth_headers)
+
+        assert created.status_code == status.HTTP_201_CREATED
+        assert created.json()["created_at"] is not None
+        assert updated.status_code == status.HTTP_200_OK
+        assert updated.json()["is_favorite"] is True
+        journal_selects = [
+            sql for sql in statements
+            if sql.lstrip().upper().startswith("SELECT") and "WHERE user_reading_journal.id = " in sql
+        ]
+        # Only the update's own lookup of the entry it modifies
+        assert len(journal_selects) == 1
 
     def test_create_journal_entry_invalid_mood(self, client, auth_headers):
         """Test creating journal entry with invalid mood values"""
@@ -129,6 +169,7 @@ class TestJournalAPI:
         assert response.status_code == status.HTTP_200_OK
         data = response.json()
         assert len(data) == 10
+        assert response.headers["X-Total-Count"] == "15"
 
         # Test second page
         response = client.get(
@@ -138,6 +179,23 @@ class TestJournalAPI:
         assert response.status_code == status.HTTP_200_OK
         data = response.json()
         assert len(data) == 5
+        assert response.headers["X-Total-Count"] == "15"
+
+        # Paging past the end still reports the total
+        response = client.get(
+            "/api/journal/entries?skip=20&limit=10",
+            headers=auth_headers
+        )
+        assert response.status_code == status.HTTP_200_OK
+        assert response.json() == []
+        assert response.headers["X-Total-Count"] == "15"
+
+        # Filters apply to the total
+        response = client.get(
+            "/api/journal/entries?tags=entry-3&limit=10",
+            headers=auth_headers
+        )
+        assert response.headers["X-Total-Count"] == "1"
 
     def test_get_journal_entries_with_filters(self, client, auth_headers, test_user, db_session):
         """Test retrieving journal entries with filters"""
@@ -171,6 +229,23 @@ class TestJournalAPI:
         assert len(data) == 1
         assert data[0]["is_favorite"] is True
 
+    def test_get_journal_entries_sort_by_whitelist(self, client, auth_headers, test_user, db_session):
+        """Test that sort_by accepts known columns and ignores anything else"""
+        now = datetime.utcnow()
+        for rating, age in ((2, 3), (5, 2), (3, 1)):
+            JournalEntryFactory.create(
+                db=db_session, user_id=test_user.id, outcome_rating=rating, created_at=now - timedelta(days=age)
+            )
+
+        by_rating = client.get("/api/journal/entries?sort_by=outcome_rating&sort_order=asc", headers=auth_headers)
+        assert [entry["outcome_rating"] for entry in by_rating.json()] == [2, 3, 5]
+
+        # Unknown fields (including relationships) fall back to newest first
+        for sort_by in ("user", "__class__", "nonexistent"):
+            response = client.get(f"/api/journal/entries?sort_by={sort_by}", headers=auth_headers)
+            assert response.status_code == status.HTTP_200_OK
+            assert [entry["outcome_rating"] for entry in response.json()] == [3, 5, 2]
+
     def test_get_journal_entry_by_id(self, client, auth_headers, test_user, db_session):
         """Test retrieving specific journal entry by ID"""
         entry = JournalEntryFactory.create(
@@ -349,6 +424,28 @@ class TestPersonalCardMeaningsAPI:
         data = response.json()
         assert data["personal_meaning"] == "New meaning"
 
+    def test_repeated_card_meaning_post_upserts_single_row(self, client, auth_headers, test_user, test_cards,
+                                                           db_session):
+        """Test posting the same card twice creates then updates one row"""
+        card_id, user_id = test_cards[0].id, test_user.id
+
+        first = client.post(
+            "/api/journal/card-meanings",
+            json={"card_id": card_id, "personal_meaning": "First thoughts"},
+            headers=auth_headers
+        )
+        second = client.post(
+            "/api/journal/card-meanings",
+            json={"card_id": card_id, "personal_meaning": "Second thoughts", "emotional_keywords": ["calm"]},
+            headers=auth_headers
+        )
+
+        assert first.status_code == status.HTTP_201_CREATED
+        assert second.status_code == status.HTTP_200_OK
+        assert second.json()["id"] == first.json()["id"]
+        assert second.json()["emotional_keywords"] == ["calm"]
+        assert db_session.query(UserCardMeaning).filter(UserCardMeaning.user_id == user_id).count() == 1
+
     def test_get_all_personal_card_meanings(self, client, auth_headers, test_user, test_cards, db_session):
         """Test retrieving all personal card meanings for user"""
         # Create multiple meanings
@@ -360,6 +457,7 @@ class TestPersonalCardMeaningsAPI:
                 personal_meaning=f"Personal meaning {i}",
                 usage_count=i * 2
             )
+        top_card_id, top_card_name = test_cards[2].id, test_cards[2].name
 
         response = client.get("/api/journal/card-meanings", headers=auth_headers)
 
@@ -368,6 +466,8 @@ class TestPersonalCardMeaningsAPI:
         assert len(data) == 3
         # Should be ordered by usage_count DESC
         assert data[0]["usage_count"] >= data[1]["usage_count"]
+        assert data[0]["card"]["id"] == top_card_id
+        assert data[0]["card"]["name"] == top_card_name
 
     def test_get_personal_card_meaning_by_card_id(self, client, auth_headers, test_user, test_cards, db_session):
         """Test retrieving personal card meaning for specific card"""
@@ -492,6 +592,118 @@ class TestJournalAnalyticsAPI:
         assert "favorite_cards" in data
         assert "reading_frequency" in data
 
+    def test_analytics_summary_aggregates(self, client, auth_headers, test_user, db_session):
+        """Test analytics summary values computed by SQL aggregation"""
+        this_month = datetime.utcnow().replace(day=1, hour=12, minute=0, second=0, microsecond=0)
+        last_month = (this_month - timedelta(days=1)).replace(day=1)
+
+        JournalEntryFactory.create(
+            db=db_session, user_id=test_user.id, created_at=last_month,
+            mood_before=4, mood_after=8, tags=["love"],
+            follow_up_date=this_month, follow_up_completed=True,
+        )
+        JournalEntryFactory.create(
+            db=db_session, user_id=test_user.id, created_at=this_month,
+            mood_before=5, mood_after=6, tags=["love", "career"], personal_notes="Notes",
+            follow_up_date=this_month,
+        )
+        JournalEntryFactory.create(
+            db=db_session, user_id=test_user.id, created_at=this_month,
+            reading_snapshot={"cards": [{"name": "The Star"}, {"name": "The Fool"}]},
+        )
+
+        response = client.get("/api/journal/analytics/summary", headers=auth_headers)
+
+        assert response.status_code == status.HTTP_200_OK
+        data = response.json()
+        this_key, last_key = this_month.strftime("%Y-%m"), last_month.strftime("%Y-%m")
+        assert data["total_entries"] == 3
+        assert data["entries_this_month"] == 2
+        assert data["reading_frequency"] == {last_key: 1, this_key: 2}
+        assert data["average_mood_improvement"] == pytest.approx(2.5)
+        assert data["mood_trends"]["monthly_averages"] == {
+            last_key: {"before": 4.0, "after": 8.0, "improvement": 4.0},
+            this_key: {"before": 5.0, "after": 6.0, "improvement": 1.0},
+        }
+        assert data["follow_up_completion_rate"] == pytest.approx(0.5)
+        assert data["favorite_cards"][0] == {"name": "The Fool", "count": 3}
+        assert data["most_used_tags"][0] == {"tag": "love", "count": 2}
+        assert data["growth_metrics"]["introspection_depth"] == 1
+        assert data["growth_metrics"]["mindfulness_practice"] == 2
+
+    def test_analytics_summary_without_entries(self, client, auth_headers):
+        """Test analytics summary for a user with an empty journal"""
+        response = client.get("/api/journal/analytics/summary", headers=auth_headers)
+
+        assert response.status_code == status.HTTP_200_OK
+        data = response.json()
+        assert data["total_entries"] == 0
+        assert data["mood_trends"] == {}
+        assert data["average_mood_improvement"] is None
+        assert data["follow_up_completion_rate"] is None
+
+    def test_analytics_summary_snapshot_is_refreshed_after_writes(self, client, auth_headers, test_user, db_session):
+        """Test that journal writes recompute the snapshot and the summary is served from it"""
+        user_id = test_user.id
+        entry = {"reading_snapshot": {"cards": [{"name": "The Fool"}]}}
+        assert client.post("/api/journal/entries", json=entry, headers=auth_headers).status_code == 201
+        snapshot = db_session.get(UserAnalyticsSnapshot, user_id)
+        assert json.loads(snapshot.payload)["total_entries"] == 1
+        assert snapshot.version == 1
+
+        with patch("routers.journal._compute_journal_analytics", side_effect=AssertionError("not from snapshot")):
+            response = client.get("/api/journal/analytics/summary", headers=auth_headers)
+        assert response.status_code == status.HTTP_200_OK
+        assert response.json()["total_entries"] == 1
+
+        entry_id = db_session.query(UserReadingJournal.id).filter_by(user_id=user_id).scalar()
+        assert client.delete(f"/api/journal/entries/{entry_id}", headers=auth_headers).status_code == 204
+        db_session.expire_all()
+        snapshot = db_session.get(UserAnalyticsSnapshot, user_id)
+        assert json.loads(snapshot.payload)["total_entries"] == 0
+        assert snapshot.version == 2
+
+    def test_analytics_refresh_is_discarded_after_a_newer_write(self, test_user, db_session):
+        """Test that a refresh racing a later journal write does not store its stale payload"""
+        user_id = test_user.id
+        journal._expire_analytics_snapshot(db_session, user_id)
+        db_session.commit()
+        compute = journal._compute_journal_analytics
+
+        def compute_then_write(db, uid):
+            analytics = compute(db, uid)
+            JournalEntryFactory.create(db=db_session, user_id=user_id)
+            journal._expire_analytics_snapshot(db_session, user_id)
+            db_session.commit()
+            return analytics
+
+        with patch.object(journal, "_compute_journal_analytics", side_effect=compute_then_write):
+            journal._refresh_analytics_snapshot(user_id)
+
+        db_session.expire_all()
+        snapshot = db_session.get(UserAnalyticsSnapshot, user_id)
+        assert snapshot.payload is None
+        assert snapshot.version == 2
+
+        journal._refresh_analytics_snapshot(user_id)
+        db_session.expire_all()
+        assert json.loads(db_session.get(UserAnalyticsSnapshot, user_id).payload)["total_entries"] == 1
+
+    def test_analytics_summary_rebuilds_snapshot_from_previous_month(self, client, auth_headers, test_user,
+                                                                     db_session):
+        """Test that a snapshot computed in an earlier month is computed inline and then refreshed"""
+        db_session.add(UserAnalyticsSnapshot(
+            user_id=test_user.id, payload='{"total_entries": 99}', updated_at=datetime.now(UTC) - timedelta(days=40)
+        ))
+        db_session.commit()
+
+        response = client.get("/api/journal/analytics/summary", headers=auth_headers)
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.json()["total_entries"] == 0
+        db_session.expire_all()
+        assert json.loads(db_session.get(UserAnalyticsSnapshot, test_user.id).payload)["total_entries"] == 0
+
     def test_get_mood_trends(self, client, auth_headers, test_user, db_session):
         """Test retrieving mood trends analytics"""
         # Create entries with mood data
@@ -510,7 +722,9 @@ class TestJournalAnalyticsAPI:
         data = response.json()
         assert "daily_moods" in data
         assert "average_improvement" in data
-        assert "mood_distribution" in data
+        assert data["mood_distribution"] == {"5": 7}
+        assert data["daily_moods"][-1]["date"] == datetime.utcnow().date().isoformat()
+        assert data["daily_moods"][-1]["improvement"] == 2
 
     def test_get_card_frequency_analytics(self, client, auth_headers, test_user, test_cards, db_session):
         """Test retrieving card frequency analytics"""
@@ -534,6 +748,23 @@ class TestJournalAnalyticsAPI:
         assert len(data["most_common_cards"]) > 0
         assert data["most_common_cards"][0]["count"] == 5
 
+    def test_card_frequency_decodes_legacy_string_snapshots(self, client, auth_headers, test_user, db_session):
+        """Test that snapshots stored as JSON strings are counted like dict snapshots"""
+        JournalEntryFactory.create(
+            db=db_session, user_id=test_user.id, reading_snapshot=json.dumps({"cards": [{"name": "The Moon"}]})
+        )
+        JournalEntryFactory.create(
+            db=db_session, user_id=test_user.id, reading_snapshot={"cards": [{"name": "The Moon"}, {}]}
+        )
+
+        response = client.get("/api/journal/analytics/card-frequency", headers=auth_headers)
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.json()["card_frequency"] == [
+            {"card_name": "The Moon", "count": 2, "frequency": 2},
+            {"card_name": "Unknown", "count": 1, "frequency": 1},
+        ]
+
     def test_get_growth_metrics(self, client, auth_headers, test_user, db_session):
         """Test retrieving personal growth metrics"""
         # Create journal entries spanning several weeks
@@ -570,9 +801,10 @@ class TestRemindersAPI:
             user_id=test_user.id,
             follow_up_date=datetime.utcnow() + timedelta(days=30)
         )
+        entry_id = entry.id
 
         reminder_data = {
-            "journal_entry_id": entry.id,
+            "journal_entry_id": entry_id,
             "reminder_type": "follow_up",
             "reminder_date": (datetime.utcnow() + timedelta(days=29)).isoformat(),
             "message": "Time to revisit your career reading"
@@ -586,7 +818,8 @@ class TestRemindersAPI:
 
         assert response.status_code == status.HTTP_201_CREATED
         data = response.json()
-        assert data["journal_entry_id"] == entry.id
+        assert data["journal_entry_id"] == entry_id
+        assert data["journal_entry"]["id"] == entry_id
         assert data["reminder_type"] == "follow_up"
         assert data["message"] == reminder_data["message"]
         assert data["is_sent"] is False
@@ -624,6 +857,8 @@ class TestRemindersAPI:
             is_completed=False,
             reminder_date=datetime.utcnow() + timedelta(days=1)
         )
+        # List endpoints read plain columns, so the ORM instances are not refreshed by the request
+        pending_reminder_id, entry_id = pending_reminder.id, entry.id
 
         # Create a completed reminder (should not appear)
         ReminderFactory.create(
@@ -638,8 +873,9 @@ class TestRemindersAPI:
         assert response.status_code == status.HTTP_200_OK
         data = response.json()
         assert len(data) == 1
-        assert data[0]["id"] == pending_reminder.id
+        assert data[0]["id"] == pending_reminder_id
         assert data[0]["is_completed"] is False
+        assert data[0]["journal_entry"]["id"] == entry_id
 
     def test_mark_reminder_completed(self, client, auth_headers, test_user, db_session):
         """Test marking reminder as completed"""
@@ -679,6 +915,25 @@ class TestRemindersAPI:
 
         assert response.status_code == status.HTTP_204_NO_CONTENT
 
+    def test_update_and_delete_other_users_reminder_404(self, client, auth_headers_2, test_user, db_session):
+        """Test that reminder writes are scoped to the owner in the same statement"""
+        entry = JournalEntryFactory.create(db=db_session, user_id=test_user.id)
+        from tests.factories import ReminderFactory
+        reminder = ReminderFactory.create(
+            db=db_session, user_id=test_user.id, journal_entry_id=entry.id, is_completed=False
+        )
+        reminder_id = reminder.id
+
+        update_response = client.put(
+            f"/api/journal/reminders/{reminder_id}", json={"is_completed": True}, headers=auth_headers_2
+        )
+        delete_response = client.delete(f"/api/journal/reminders/{reminder_id}", headers=auth_headers_2)
+
+        assert update_response.status_code == status.HTTP_404_NOT_FOUND
+        assert delete_response.status_code == status.HTTP_404_NOT_FOUND
+        db_session.expire_all()
+        assert db_session.get(ReadingReminder, reminder_id).is_completed is False
+
 
 class TestJournalSecurity:
     """Test suite for Journal security and privacy"""
@@ -699,20 +954,21 @@ class TestJournalSecurity:
             user_id=test_user_2.id,
             personal_notes="User 2's private entry"
         )
+        user1_entry_id, user2_entry_id = user1_entry.id, user2_entry.id
 
         # User 1 should only see their entries
         response = client.get("/api/journal/entries", headers=auth_headers)
         assert response.status_code == status.HTTP_200_OK
         data = response.json()
         assert len(data) == 1
-        assert data[0]["id"] == user1_entry.id
+        assert data[0]["id"] == user1_entry_id
 
         # User 2 should only see their entries
         response = client.get("/api/journal/entries", headers=auth_headers_2)
         assert response.status_code == status.HTTP_200_OK
         data = response.json()
         assert len(data) == 1
-        assert data[0]["id"] == user2_entry.id
+        assert data[0]["id"] == user2_entry_id
 
     def test_personal_card_meanings_user_isolation(self, client, auth_headers, auth_headers_2,
                                                    test_user, test_user_2, test_cards, db_session):
@@ -775,6 +1031,16 @@ class TestJournalSecurity:
         data = response.json()
         assert data["total_entries"] == 3
 
+    def test_sanitize_html_strips_tags_and_escapes(self):
+        """Test tag stripping, including tags spanning lines, and escaping"""
+        from routers.journal import sanitize_html
+
+        assert sanitize_html("plain & simple") == "plain &amp; simple"
+        assert sanitize_html("<b>bold</b> move") == "bold move"
+        assert sanitize_html('<img src="x"\nonerror="alert(1)">ok') == "ok"
+        assert sanitize_html("3 < 4") == "3 &lt; 4"
+        assert sanitize_html("") == ""
+
     @patch('routers.journal.sanitize_html')
     def test_input_sanitization(self, mock_sanitize, client, auth_headers):
         """Test that user input is properly sanitized"""
@@ -908,3 +1174,68 @@ class TestJournalBackgroundTasks:
         ).count()
         assert remaining == 0
         assert deleted_count == 1
+
+
+class TestJournalEagerLoading:
+    """Responses must not lazy-load relationships while being serialized"""
+
+    def test_create_card_meaning_loads_card(self, client, auth_headers, test_cards, no_lazy_loads):
+        card_id = test_cards[0].id
+
+        with no_lazy_loads():
+            response = client.post(
+                "/api/journal/card-meanings",
+                json={"card_id": card_id, "personal_meaning": "A fresh start for me"},
+                headers=auth_headers
+            )
+
+        assert response.status_code == status.HTTP_201_CREATED
+        assert response.json()["card"]["id"] == card_id
+
+    def test_update_card_meaning_loads_card(self, client, auth_headers, test_user, test_cards, db_session,
+                                            no_lazy_loads):
+        card_id = test_cards[0].id
+        PersonalCardMeaningFactory.create(db=db_session, user_id=test_user.id, card_id=card_id)
+
+        with no_lazy_loads():
+            response = client.put(
+                f"/api/journal/card-meanings/{card_id}",
+                json={"personal_meaning": "Updated meaning"},
+                headers=auth_headers
+            )
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.json()["card"]["id"] == card_id
+
+    def test_create_reminder_loads_journal_entry(self, client, auth_headers, test_user, db_session, no_lazy_loads):
+        entry_id = JournalEntryFactory.create(db=db_session, user_id=test_user.id).id
+
+        with no_lazy_loads():
+            response = client.post(
+                "/api/journal/reminders",
+                json={
+                    "journal_entry_id": entry_id,
+                    "reminder_type": "follow_up",
+                    "reminder_date": (datetime.utcnow() + timedelta(days=7)).isoformat(),
+                },
+                headers=auth_headers
+            )
+
+        assert response.status_code == status.HTTP_201_CREATED
+        assert response.json()["journal_entry"]["id"] == entry_id
+
+    def test_list_and_detail_endpoints(self, client, auth_headers, test_user, test_cards, db_session, no_lazy_loads):
+        card_id = test_cards[0].id
+        entry_id = JournalEntryFactory.create(db=db_session, user_id=test_user.id).id
+        PersonalCardMeaningFactory.create(db=db_session, user_id=test_user.id, card_id=card_id)
+
+        for path in (
+            "/api/journal/entries",
+            f"/api/journal/entries/{entry_id}",
+            "/api/journal/card-meanings",
+            f"/api/journal/card-meanings/{card_id}",
+            "/api/journal/reminders",
+        ):
+            with no_lazy_loads():
+                response = client.get(path, headers=auth_headers)
+            assert response.status_code == status.HTTP_200_OK, path
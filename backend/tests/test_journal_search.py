@@ -1,6 +1,8 @@
 """Tests for journal advanced search filters (card name, spread, tag mode) and helper endpoints."""
 from fastapi import status
+from sqlalchemy.dialects import postgresql
 
+from routers.journal import _NOTES_TSVECTOR, _prefix_tsquery
 from tests.factories import JournalEntryFactory
 
 
@@ -66,6 +68,12 @@ class TestJournalCardSpreadFilters:
         data = response.json()
         assert len(data) == 2
 
+    def test_search_notes_matches_substring(self, client, auth_headers, test_user, db_session):
+        self._seed(db_session, test_user.id)
+        response = client.get("/api/journal/entries?search_notes=career", headers=auth_headers)
+        assert response.status_code == status.HTTP_200_OK
+        assert {e["personal_notes"] for e in response.json()} == {"career one", "career two with fool"}
+
     def test_tags_match_all_is_default(self, client, auth_headers, test_user, db_session):
         self._seed(db_session, test_user.id)
         response = client.get("/api/journal/entries?tags=career,growth", headers=auth_headers)
@@ -85,6 +93,16 @@ class TestJournalCardSpreadFilters:
         # Matches "career one" (growth) and "love one" (love)
         assert len(data) == 2
 
+    def test_tags_match_whole_tags_only(self, client, auth_headers, test_user, db_session):
+        self._seed(db_session, test_user.id)
+        response = client.get("/api/journal/entries?tags=care", headers=auth_headers)
+        assert response.status_code == status.HTTP_200_OK
+        assert response.json() == []
+
+        # A repeated tag still only requires that one tag
+        response = client.get("/api/journal/entries?tags=growth,growth", headers=auth_headers)
+        assert [e["personal_notes"] for e in response.json()] == ["career one"]
+
     def test_card_name_unknown_returns_empty(self, client, auth_headers, test_user, db_session):
         self._seed(db_session, test_user.id)
         response = client.get("/api/journal/entries?card_name=Nonexistent", headers=auth_headers)
@@ -141,3 +159,18 @@ class TestJournalDiscoveryEndpoints:
     def test_get_tags_requires_auth(self, client):
         response = client.get("/api/journal/tags")
         assert response.status_code == status.HTTP_401_UNAUTHORIZED
+
+
+class TestNotesFullTextQuery:
+    def test_prefix_tsquery_ands_word_prefixes(self):
+        assert _prefix_tsquery("career  growth!") == "career:* & growth:*"
+
+    def test_prefix_tsquery_strips_tsquery_operators(self):
+        assert _prefix_tsquery("fool | (star) & !moon") == "fool:* & star:* & moon:*"
+        assert _prefix_tsquery("&|!") is None
+
+    def test_notes_tsvector_matches_index_expression(self):
+        compiled = str(_NOTES_TSVECTOR.compile(dialect=postgresql.dialect()))
+        assert compiled == (
+            "to_tsvector('simple'::regconfig, coalesce(user_reading_journal.personal_notes, ''::text))"
+        )
@@ -0,0 +1,29 @@
+"""
+Tests for Payment Tasks
+
+This module contains unit tests for the payment webhook background tasks.
+"""
+
+from unittest.mock import patch
+
+from tasks.payment_tasks import replay_pending_webhooks_task
+
+
+class TestReplayPendingWebhooksTask:
+    """Test suite for replay_pending_webhooks_task function."""
+
+    @patch('tasks.payment_tasks.replay_pending_webhooks', return_value=2)
+    @patch('tasks.payment_tasks.current_task')
+    def test_replay_pending_webhooks_success(self, mock_current_task, mock_replay):
+        """Test the task reports how many pending webhooks were replayed."""
+        mock_current_task.request.id = "task_123"
+
+        result = replay_pending_webhooks_task()
+
+        assert result == {
+            "status": "success",
+            "message": "Replayed 2 pending webhooks",
+            "task_id": "task_123",
+            "replayed": 2,
+        }
+        mock_replay.assert_called_once_with()
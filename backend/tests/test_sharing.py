@@ -0,0 +1,209 @@
+import json
+from datetime import UTC, datetime, timedelta
+from types import SimpleNamespace
+from unittest.mock import patch
+
+from fastapi import status
+from fastapi.encoders import jsonable_encoder
+
+from config import settings
+from models import SharedReading
+from routers import sharing
+from schemas import SharedReadingListResponse
+
+from tests.factories import SharedReadingFactory
+
+
+class TestCreateSharedReading:
+    def test_cards_round_trip_through_stored_json(self, client, auth_headers):
+        cards = [
+            {
+                "name": "The Tower",
+                "orientation": "reversed",
+                "meaning": "Averting disaster — barely",
+                "image_url": None,
+                "position": "Outcome",
+                "position_index": 2,
+            }
+        ]
+        payload = {"title": "Shared", "concern": "What next?", "cards": cards}
+
+        created = client.post("/sharing/create", json=payload, headers=auth_headers)
+        assert created.status_code == status.HTTP_200_OK
+
+        response = client.get(f"/sharing/{created.json()['uuid']}")
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.json()["cards"] == cards
+
+    def test_empty_cards_are_rejected_before_any_write(self, client, db_session, auth_headers):
+        payload = {"title": "Shared", "concern": "What next?", "cards": []}
+
+        with patch.object(db_session, "add", side_effect=AssertionError("nothing should be written")):
+            response = client.post("/sharing/create", json=payload, headers=auth_headers)
+
+        assert response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
+
+    def test_create_does_not_reselect_the_new_reading(self, client, db_session, auth_headers, count_statements):
+        card = {"name": "The Fool", "orientation": "upright", "meaning": "Beginnings"}
+        payload = {"title": "Shared", "concern": "What next?", "cards": [card], "expires_in_days": 3}
+        with count_statements() as statements:
+            created = client.post("/sharing/create", json=payload, headers=auth_headers)
+
+        assert created.status_code == status.HTTP_200_OK
+        data = created.json()
+        assert data["expires_at"] is not None
+        assert db_session.query(SharedReading).filter(SharedReading.uuid == data["uuid"]).count() == 1
+        assert not [sql for sql in statements if sql.lstrip().upper().startswith("SELECT") and "FROM shared_readings" in sql]
+
+    def test_sharing_url_uses_configured_base_url(self, client, auth_headers):
+        card = {"name": "The Fool", "orientation": "upright", "meaning": "Beginnings"}
+        payload = {"title": "Shared", "concern": "What next?", "cards": [card]}
+
+        with patch.object(settings, "SHARING_BASE_URL", "https://arcana.example"):
+            created = client.post("/sharing/create", json=payload, headers=auth_headers)
+
+        data = created.json()
+        assert data["sharing_url"] == f"https://arcana.example/shared/{data['uuid']}"
+
+
+class TestGetSharedReading:
+    def test_public_reading_is_returned(self, client, db_session, test_user, no_lazy_loads):
+        username = test_user.username
+        reading = SharedReadingFactory.create(db_session, user_id=test_user.id)
+        reading_uuid = reading.uuid
+        db_session.expunge_all()
+
+        with no_lazy_loads():
+            response = client.get(f"/sharing/{reading_uuid}")
+
+        assert response.status_code == status.HTTP_200_OK
+        data = response.json()
+        assert data["creator_username"] == username
+        assert data["cards"][0]["name"] == "The Fool"
+
+    def test_private_reading_is_not_found(self, client, db_session, test_user):
+        reading = SharedReadingFactory.create(db_session, user_id=test_user.id, is_public=False)
+
+        response = client.get(f"/sharing/{reading.uuid}")
+
+        assert response.status_code == status.HTTP_404_NOT_FOUND
+
+    def test_expired_reading_is_not_found(self, client, db_session, test_user):
+        expired = SharedReadingFactory.create(
+            db_session, user_id=test_user.id, expires_at=datetime.now(UTC) - timedelta(minutes=1)
+        )
+        live = SharedReadingFactory.create(
+            db_session, user_id=test_user.id, expires_at=datetime.now(UTC) + timedelta(days=1)
+        )
+        expired_uuid, live_uuid = expired.uuid, live.uuid
+
+        assert client.get(f"/sharing/{expired_uuid}").status_code == status.HTTP_404_NOT_FOUND
+        assert client.get(f"/sharing/{live_uuid}").status_code == status.HTTP_200_OK
+
+    def test_malformed_stored_cards_are_served_as_empty(self, client, db_session, test_user):
+        reading = SharedReadingFactory.create(db_session, user_id=test_user.id)
+        reading.cards_data = '[{"name": "The Fool"'
+        db_session.commit()
+
+        response = client.get(f"/sharing/{reading.uuid}")
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.json()["cards"] == []
+
+    def test_each_view_increments_view_count_in_the_database(self, client, db_session, test_user):
+        reading = SharedReadingFactory.create(db_session, user_id=test_user.id, view_count=None)
+        reading_id, reading_uuid = reading.id, reading.uuid
+
+        counts = [client.get(f"/sharing/{reading_uuid}").json()["view_count"] for _ in range(2)]
+
+        assert counts == [1, 2]
+        db_session.expire_all()
+        assert db_session.get(SharedReading, reading_id).view_count == 2
+
+    def test_matching_if_none_match_returns_not_modified(self, client, db_session, test_user, fake_redis):
+        reading = SharedReadingFactory.create(db_session, user_id=test_user.id)
+        reading_uuid = reading.uuid
+
+        first = client.get(f"/sharing/{reading_uuid}")
+        etag = first.headers["etag"]
+        assert etag.startswith(f'W/"{reading_uuid}:')
+        assert first.headers["cache-control"] == "public, max-age=30"
+
+        revalidated = client.get(f"/sharing/{reading_uuid}", headers={"If-None-Match": etag})
+
+        assert revalidated.status_code == status.HTTP_304_NOT_MODIFIED
+        assert revalidated.content == b""
+
+    def test_hot_reads_are_served_from_cache_and_still_counted(self, client, db_session, test_user, fake_redis):
+        reading = SharedReadingFactory.create(db_session, user_id=test_user.id)
+        reading_id, reading_uuid = reading.id, reading.uuid
+
+        first = client.get(f"/sharing/{reading_uuid}")
+        with patch("routers.sharing.SharedReadingResponse", side_effect=AssertionError("should be served from cache")):
+            cached = client.get(f"/sharing/{reading_uuid}")
+
+        assert cached.status_code == status.HTTP_200_OK
+        assert cached.content == first.content
+        assert cached.headers["etag"] == first.headers["etag"]
+        db_session.expire_all()
+        assert db_session.get(SharedReading, reading_id).view_count == 2
+
+    def test_deleting_a_reading_drops_its_cache_entry(self, client, db_session, test_user, auth_headers, fake_redis):
+        reading = SharedReadingFactory.create(db_session, user_id=test_user.id)
+        reading_uuid = reading.uuid
+        assert client.get(f"/sharing/{reading_uuid}").status_code == status.HTTP_200_OK
+
+        assert client.delete(f"/sharing/{reading_uuid}", headers=auth_headers).status_code == status.HTTP_200_OK
+
+        assert client.get(f"/sharing/{reading_uuid}").status_code == status.HTTP_404_NOT_FOUND
+
+
+class TestGetUserSharedReadings:
+    def test_lists_own_readings_newest_first(self, client, db_session, test_user, test_user_2, auth_headers):
+        now = datetime.utcnow()
+        SharedReadingFactory.create(db_session, user_id=test_user.id, title="Older", created_at=now - timedelta(days=1))
+        SharedReadingFactory.create(db_session, user_id=test_user.id, title="Newer", view_count=3, created_at=now)
+        SharedReadingFactory.create(db_session, user_id=test_user_2.id, title="Someone else's")
+
+        response = client.get("/sharing/user/readings", headers=auth_headers)
+
+        assert response.status_code == status.HTTP_200_OK
+        data = response.json()
+        assert [reading["title"] for reading in data] == ["Newer", "Older"]
+        assert set(data[0]) == {"uuid", "title", "created_at", "view_count", "is_public"}
+        assert data[0]["view_count"] == 3
+
+    def test_listed_timestamps_are_encoded_like_the_response_model(self):
+        row = {
+            "uuid": "abc",
+            "title": "Shared",
+            "created_at": datetime(2026, 10, 16, 12, 0, 0, 123456, tzinfo=UTC),
+            "view_count": 1,
+            "is_public": True,
+        }
+
+        encoded = json.loads(sharing._encode_shared_reading_list([SimpleNamespace(**row)]))
+
+        assert encoded == [jsonable_encoder(SharedReadingListResponse(**row))]
+
+
+class TestGetUserSharingStats:
+    def test_totals_and_most_viewed_come_from_one_query(self, client, db_session, test_user, test_user_2, auth_headers):
+        SharedReadingFactory.create(db_session, user_id=test_user.id, title="Quiet", view_count=2)
+        SharedReadingFactory.create(db_session, user_id=test_user.id, title="Popular", view_count=7)
+        SharedReadingFactory.create(db_session, user_id=test_user_2.id, title="Someone else's", view_count=50)
+
+        response = client.get("/sharing/user/stats", headers=auth_headers)
+
+        assert response.status_code == status.HTTP_200_OK
+        data = response.json()
+        assert data["total_shared"] == 2
+        assert data["total_views"] == 9
+        assert data["most_viewed"]["title"] == "Popular"
+
+    def test_user_without_shared_readings_gets_zeroes(self, client, auth_headers):
+        response = client.get("/sharing/user/stats", headers=auth_headers)
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.json() == {"total_shared": 0, "total_views": 0, "most_viewed": None}
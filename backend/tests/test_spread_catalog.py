@@ -0,0 +1,99 @@
+import json
+
+import pytest
+
+from models import Spread
+from services import spread_catalog
+
+POSITIONS = [
+    {"index": 0, "name": "Past", "description": "what was", "x": 20, "y": 50},
+    {"index": 1, "name": "Present", "description": "what is", "x": 50, "y": 50},
+    {"index": 2, "name": "Future", "description": "what may be", "x": 80, "y": 50},
+]
+
+
+@pytest.fixture
+def spreads(db_session):
+    rows = [
+        Spread(name="Three Card", description="Past, present, future", num_cards=3, positions=json.dumps(POSITIONS)),
+        Spread(name="Single Card", description="One card", num_cards=1, positions=json.dumps(POSITIONS[:1])),
+    ]
+    db_session.add_all(rows)
+    db_session.commit()
+    return rows
+
+
+class TestGetSpread:
+    def test_spread_is_served_from_cache(self, db_session, spreads, count_statements):
+        first = spread_catalog.get_spread(db_session, spreads[0].id)
+        assert first.name == "Three Card"
+        assert first.get_positions() == POSITIONS
+
+        with count_statements() as statements:
+            assert spread_catalog.get_spread(db_session, spreads[0].id) is first
+
+        assert statements == []
+
+    def test_spread_in_the_session_is_loaded_without_a_query(self, db_session, spreads, count_statements):
+        spread_id = spreads[0].id
+        db_session.get(Spread, spread_id)  # now in the identity map
+
+        with count_statements() as statements:
+            assert spread_catalog.get_spread(db_session, spread_id).num_cards == 3
+
+        assert statements == []
+
+    def test_unknown_spread_is_not_cached(self, db_session, spreads):
+        assert spread_catalog.get_spread(db_session, 999999) is None
+        assert 999999 not in spread_catalog._spreads
+
+    def test_invalidate_forces_reload(self, db_session, spreads):
+        spread_catalog.get_spread(db_session, spreads[0].id)
+        spread_catalog.get_spread_listing(db_session)
+
+        spread_catalog.invalidate_spreads()
+
+        assert spread_catalog._spreads == {}
+        assert spread_catalog._listing is None
+
+
+class TestSpreadEndpoints:
+    def test_listing_is_ordered_and_revalidated_with_etag(self, client, spreads):
+        response = client.get("/api/tarot/spreads")
+        assert response.status_code == 200
+        assert [spread["name"] for spread in response.json()] == ["Single Card", "Three Card"]
+        etag = response.headers["ETag"]
+
+        assert set(response.json()[0]) == {"id", "name", "description", "num_cards"}
+
+        not_modified = client.get("/api/tarot/spreads", headers={"If-None-Match": etag})
+        assert not_modified.status_code == 304
+        assert not_modified.headers["ETag"] == etag
+
+    def test_spread_detail_includes_positions(self, client, spreads):
+        spread_id = spreads[0].id
+        response = client.get(f"/api/tarot/spreads/{spread_id}")
+
+        assert response.status_code == 200
+        assert response.json()["positions"] == POSITIONS
+        assert client.get("/api/tarot/spreads/999999").status_code == 422
+
+    def test_reading_uses_the_cached_spread(self, client, auth_headers, test_cards, mock_tarot_reader, spreads):
+        spread_id = spreads[0].id
+        response = client.post(
+            "/api/tarot/reading",
+            json={"concern": "What lies ahead?", "spread_id": spread_id},
+            headers=auth_headers,
+        )
+
+        assert response.status_code == 200
+        assert [card["position"] for card in response.json()] == ["Past", "Present", "Future"]
+        assert spread_id in spread_catalog._spreads
+
+
+def test_listing_selects_only_the_listed_columns(db_session, spreads, count_statements):
+    with count_statements() as statements:
+        spread_catalog.get_spread_listing(db_session)
+
+    assert len(statements) == 1
+    assert "positions" not in statements[0]
@@ -1,3 +1,5 @@
+import hashlib
+import hmac
 import os
 os.environ["MAIL_FROM"] = "test@example.com"
 from config import settings
@@ -5,13 +7,46 @@ from services.subscription_service import SubscriptionService
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker
 from sqlalchemy import create_engine
-from datetime import datetime, UTC
+from datetime import datetime, timedelta, UTC
+from unittest.mock import patch
 from sqlalchemy import Column, Integer, String, DateTime
-from models import User
+from models import SubscriptionEvent, SubscriptionPlan, TurnUsageDaily, User, WebhookInbox
+from routers import subscription as subscription_router
+from routers.subscription import _usage_by_context_query
+from services import subscription_service as subscription_module
 import pytest
 
+from tests.factories import PaymentTransactionFactory, SubscriptionEventFactory, TurnUsageHistoryFactory
+
 Base = declarative_base()
 
+WEBHOOK_SECRET = "webhook_secret"
+
+
+@pytest.fixture
+def webhook_inbox_session(session_factory):
+    """Apply stored webhooks against the test database instead of the application's."""
+    with patch("services.subscription_service.SessionLocal", session_factory):
+        yield
+
+
+@pytest.fixture
+def webhook_processor():
+    """Verify webhooks against `WEBHOOK_SECRET` and stub out applying them; yields the stub."""
+    service = subscription_router.subscription_service
+    with (
+        patch.object(service, "webhook_secret", WEBHOOK_SECRET),
+        patch.object(service, "_webhook_hmac", None),
+        patch.object(service, "process_webhook_event") as process,
+    ):
+        yield process
+
+
+def signed_webhook(payload):
+    """Return the body and headers of a Lemon Squeezy delivery signed with `WEBHOOK_SECRET`."""
+    signature = hmac.new(WEBHOOK_SECRET.encode(), payload, hashlib.sha256).hexdigest()
+    return payload, {"X-Signature": signature}
+
 @pytest.mark.usefixtures("db_session")
 def test_specialized_premium_users(db_session):
     """Test specialized premium user functionality."""
@@ -61,4 +96,297 @@ def test_consume_user_turn_usage_context(db_session):
     db_session.commit()
     db_session.refresh(test_user)
 
-    turn_result = service.consume_user_turn(db_session, test_user, usage_context='subscription')
\ No newline at end of file
+    turn_result = service.consume_user_turn(db_session, test_user, usage_context='subscription')
+
+
+def test_subscription_history_lists_only_own_records(client, db_session, test_user, test_user_2, auth_headers):
+    """Test the history endpoints list only the caller's records, newest first."""
+    SubscriptionEventFactory.create(db_session, test_user.id, event_type="created")
+    PaymentTransactionFactory.create(db_session, test_user.id, amount="9.99")
+    PaymentTransactionFactory.create(db_session, test_user.id, amount="17.99", turns_purchased=20)
+    PaymentTransactionFactory.create(db_session, test_user_2.id, amount="99.00")
+    TurnUsageHistoryFactory.create(db_session, test_user.id, usage_context="reading")
+    TurnUsageHistoryFactory.create(db_session, test_user.id, usage_context="chat")
+
+    events = client.get("/api/user/subscription/events", headers=auth_headers)
+    transactions = client.get("/api/user/subscription/transactions", headers=auth_headers)
+    usage = client.get("/api/user/subscription/turn-usage", headers=auth_headers)
+    history = client.get("/api/user/subscription/history", headers=auth_headers)
+
+    assert events.status_code == 200 and len(events.json()) == 1
+    assert transactions.status_code == 200 and len(transactions.json()) == 2
+    assert usage.status_code == 200 and len(usage.json()) == 2
+    assert history.status_code == 200
+    summary = history.json()["summary"]
+    assert summary["total_transactions"] == 2
+    assert summary["total_spent_usd"] == "27.98"
+    assert summary["total_turns_purchased"] == 30
+    assert summary["total_turns_used_period"] == 2
+    assert summary["usage_by_context"] == {"reading": 1, "chat": 1}
+
+
+def test_subscription_history_summary_covers_all_records(client, db_session, test_user, auth_headers):
+    """Test summary totals are aggregated in SQL over every record, not just the listed page."""
+    PaymentTransactionFactory.create(db_session, test_user.id, amount="9.99", turns_purchased=10)
+    PaymentTransactionFactory.create(db_session, test_user.id, amount="17.99", turns_purchased=20)
+    PaymentTransactionFactory.create(db_session, test_user.id, amount="5.00", status="failed")
+    PaymentTransactionFactory.create(db_session, test_user.id, amount="0.01", currency="ETH", turns_purchased=10)
+    for context in ("reading", "reading", "chat"):
+        TurnUsageHistoryFactory.create(db_session, test_user.id, usage_context=context)
+
+    response = client.get(
+        "/api/user/subscription/history",
+        params={"transactions_limit": 1, "usage_limit": 1},
+        headers=auth_headers,
+    )
+
+    assert response.status_code == 200
+    data = response.json()
+    assert len(data["payment_transactions"]) == 1
+    summary = data["summary"]
+    assert summary["total_spent_usd"] == "27.98"
+    assert summary["total_turns_purchased"] == 40
+    assert summary["total_turns_used_period"] == 3
+    assert summary["usage_by_context"] == {"reading": 2, "chat": 1}
+
+
+def test_subscription_plans_are_served_from_the_plan_cache(client, db_session, count_statements):
+    """Test active plans are queried once and then served from the in-process cache."""
+    db_session.add_all([
+        SubscriptionPlan(plan_name="20 Turns", plan_code="20_turns", price_usd="5.99", price_eth="0.002",
+                         turns_included=20, sort_order=2),
+        SubscriptionPlan(plan_name="10 Turns", plan_code="10_turns", price_usd="3.99", price_eth="0.001",
+                         turns_included=10, sort_order=1),
+        SubscriptionPlan(plan_name="Retired", plan_code="retired", price_usd="1.99", price_eth="0.0005",
+                         turns_included=5, sort_order=0, is_active=False),
+    ])
+    db_session.commit()
+
+    first = client.get("/api/subscription/plans")
+    with count_statements() as statements:
+        second = client.get("/api/subscription/plans")
+
+    assert [plan["plan_code"] for plan in first.json()] == ["10_turns", "20_turns"]
+    assert second.json() == first.json()
+    assert not [sql for sql in statements if "subscription_plans" in sql]
+
+
+def test_subscription_events_keyset_pagination(client, db_session, test_user, auth_headers):
+    """Test following X-Next-Cursor pages through events newest first without repeats."""
+    base = datetime(2026, 1, 1, 12, 0, 0)
+    for minute in (0, 1, 1, 2, 3):
+        SubscriptionEventFactory.create(db_session, test_user.id, created_at=base.replace(minute=minute))
+    expected_ids = [
+        event.id
+        for event in db_session.query(SubscriptionEvent).order_by(
+            SubscriptionEvent.created_at.desc(), SubscriptionEvent.id.desc()
+        )
+    ]
+
+    seen = []
+    params = {"limit": 2}
+    while True:
+        response = client.get("/api/user/subscription/events", params=params, headers=auth_headers)
+        assert response.status_code == 200
+        seen.extend(event["id"] for event in response.json())
+        next_cursor = response.headers.get("X-Next-Cursor")
+        if next_cursor is None:
+            break
+        params = {"limit": 2, "cursor": next_cursor}
+
+    assert seen == expected_ids
+
+    offset_page = client.get("/api/user/subscription/events", params={"limit": 2, "offset": 2}, headers=auth_headers)
+    assert [event["id"] for event in offset_page.json()] == expected_ids[2:4]
+
+    invalid = client.get("/api/user/subscription/events", params={"cursor": "yesterday"}, headers=auth_headers)
+    assert invalid.status_code == 400
+
+
+def test_user_turns_response(client, test_user, auth_headers):
+    """Test the pre-encoded turns response keeps the TurnsResponse shape."""
+    response = client.get("/api/user/turns", headers=auth_headers)
+
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "application/json"
+    data = response.json()
+    assert data["subscription_status"] == (test_user.subscription_status or "none")
+    assert set(data) == {
+        "number_of_free_turns",
+        "number_of_paid_turns",
+        "total_turns",
+        "subscription_status",
+        "is_specialized_premium",
+        "last_free_turns_reset",
+    }
+
+
+def test_user_turns_does_not_reselect_the_user(client, db_session, test_user, auth_headers, count_statements):
+    """Test GET /api/user/turns loads the user once (for auth) when no free-turn reset is due."""
+    test_user.last_free_turns_reset = datetime.now(UTC)
+    db_session.commit()
+
+    with count_statements() as statements:
+        response = client.get("/api/user/turns", headers=auth_headers)
+
+    assert response.status_code == 200
+    user_selects = [s for s in statements if s.lstrip().upper().startswith("SELECT") and "FROM users" in s]
+    assert len(user_selects) == 1
+
+
+def test_lemon_squeezy_webhook_verifies_streamed_payload(client, db_session, webhook_inbox_session, webhook_processor):
+    """Test the webhook hashes the streamed body and rejects tampered or unsigned payloads."""
+    body, headers = signed_webhook(b'{"meta":{"event_name":"subscription_updated"},"data":{"attributes":{}}}')
+
+    ok = client.post("/api/webhooks/lemon-squeezy", content=body, headers=headers)
+    tampered = client.post("/api/webhooks/lemon-squeezy", content=body + b" ", headers=headers)
+    unsigned = client.post("/api/webhooks/lemon-squeezy", content=body)
+
+    assert ok.status_code == 202
+    assert ok.json() == {"status": "accepted"}
+    assert webhook_processor.call_count == 1
+    assert webhook_processor.call_args.args[1]["meta"]["event_name"] == "subscription_updated"
+    assert tampered.status_code == 401
+    assert unsigned.status_code == 400
+
+    stored = db_session.query(WebhookInbox).one()
+    assert stored.event_name == "subscription_updated"
+    assert stored.processed_at is not None
+    assert stored.error is None
+
+
+def test_lemon_squeezy_webhook_failure_keeps_the_event_pending(
+    client, db_session, webhook_inbox_session, webhook_processor
+):
+    """Test a webhook that fails in the background task stays in the inbox with its error."""
+    webhook_processor.side_effect = RuntimeError("database unavailable")
+    body, headers = signed_webhook(b'{"meta":{"event_name":"order_created"},"data":{"attributes":{}}}')
+
+    response = client.post("/api/webhooks/lemon-squeezy", content=body, headers=headers)
+
+    assert response.status_code == 202
+    stored = db_session.query(WebhookInbox).one()
+    assert stored.processed_at is None
+    assert stored.error == "database unavailable"
+
+
+def test_lemon_squeezy_webhook_short_circuits_replays(
+    client, db_session, webhook_inbox_session, webhook_processor, fake_redis
+):
+    """Test a redelivered payload is acknowledged as a duplicate without being stored again."""
+    body, headers = signed_webhook(b'{"meta":{"event_name":"order_created"},"data":{"id":"1","attributes":{}}}')
+
+    first = client.post("/api/webhooks/lemon-squeezy", content=body, headers=headers)
+    replay = client.post("/api/webhooks/lemon-squeezy", content=body, headers=headers)
+
+    assert first.json() == {"status": "accepted"}
+    assert replay.status_code == 202
+    assert replay.json() == {"status": "duplicate"}
+    assert webhook_processor.call_count == 1
+    assert db_session.query(WebhookInbox).count() == 1
+    assert f"ls:evt:{headers['X-Signature']}" in fake_redis.store
+
+
+def test_lemon_squeezy_webhook_releases_the_replay_key_only_if_not_stored(
+    client, db_session, webhook_processor, fake_redis
+):
+    """Test a failed commit lets the redelivery through, while a failure after the commit does not."""
+    body, headers = signed_webhook(b'{"meta":{"event_name":"order_created"},"data":{"id":"2","attributes":{}}}')
+    replay_key = f"ls:evt:{headers['X-Signature']}"
+
+    with patch.object(db_session, "commit", side_effect=RuntimeError("database unavailable")):
+        unstored = client.post("/api/webhooks/lemon-squeezy", content=body, headers=headers)
+    assert unstored.status_code == 500
+    assert replay_key not in fake_redis.store
+
+    with patch("fastapi.BackgroundTasks.add_task", side_effect=RuntimeError("scheduling failed")):
+        stored = client.post("/api/webhooks/lemon-squeezy", content=body, headers=headers)
+    assert stored.status_code == 500
+    assert replay_key in fake_redis.store
+    assert db_session.query(WebhookInbox).count() == 1
+
+
+def test_pending_webhooks_are_replayed_once(db_session, webhook_inbox_session):
+    """Test a stored webhook left pending is applied by the replay and then skipped."""
+    payload = {"meta": {"event_name": "order_created"}, "data": {"attributes": {"total": 399}}}
+    db_session.add(WebhookInbox(provider="lemon_squeezy", event_name="order_created", payload=payload, error="boom"))
+    db_session.add(
+        WebhookInbox(
+            provider="lemon_squeezy", event_name="order_created", payload=payload, processed_at=datetime.now(UTC)
+        )
+    )
+    db_session.commit()
+
+    service = subscription_module.get_subscription_service()
+    with patch.object(service, "process_webhook_event") as process:
+        first = subscription_module.replay_pending_webhooks(older_than=timedelta(0))
+        second = subscription_module.replay_pending_webhooks(older_than=timedelta(0))
+
+    assert (first, second) == (1, 0)
+    assert process.call_count == 1
+    db_session.expire_all()
+    pending = db_session.query(WebhookInbox).filter(WebhookInbox.processed_at.is_(None)).count()
+    assert pending == 0
+    assert {row.error for row in db_session.query(WebhookInbox)} == {None}
+
+
+def test_lemon_squeezy_webhook_rejects_invalid_json(client, webhook_processor):
+    """Test a correctly signed but malformed payload is answered with 400."""
+    body, headers = signed_webhook(b'{"meta": ')
+
+    response = client.post("/api/webhooks/lemon-squeezy", content=body, headers=headers)
+
+    assert response.status_code == 400
+    assert response.json()["detail"] == "Invalid JSON payload"
+    webhook_processor.assert_not_called()
+
+
+def test_subscription_history_endpoints_do_not_lazy_load(client, db_session, test_user, auth_headers, no_lazy_loads):
+    """Test the history endpoints serialize their rows without per-row relationship loads."""
+    for _ in range(3):
+        SubscriptionEventFactory.create(db_session, test_user.id)
+        PaymentTransactionFactory.create(db_session, test_user.id)
+        TurnUsageHistoryFactory.create(db_session, test_user.id)
+
+    with no_lazy_loads():
+        responses = [
+            client.get(path, headers=auth_headers)
+            for path in (
+                "/api/user/subscription/events",
+                "/api/user/subscription/transactions",
+                "/api/user/subscription/turn-usage",
+                "/api/user/subscription/history",
+            )
+        ]
+
+    assert [response.status_code for response in responses] == [200, 200, 200, 200]
+    assert len(responses[0].json()) == 3
+
+
+def test_logging_turn_usage_maintains_the_daily_rollup(db_session, test_user):
+    """Test each logged turn is counted in turn_usage_daily and feeds usage_by_context."""
+    service = SubscriptionService()
+    for context in ("reading", "chat", "reading"):
+        service.log_turn_usage(db_session, test_user, "free", context, turns_before=3, turns_after=2)
+    db_session.commit()
+
+    rows = {row.usage_context: row.uses for row in db_session.query(TurnUsageDaily).filter_by(user_id=test_user.id)}
+    assert rows == {"reading": 2, "chat": 1}
+
+    since = datetime.now(UTC).replace(tzinfo=None)
+    assert dict(db_session.execute(_usage_by_context_query(test_user.id, since)).all()) == {"reading": 2, "chat": 1}
+
+
+def test_turn_usage_window_is_measured_from_the_request_time(client, db_session, test_user, auth_headers):
+    """Test the usage window is computed from the request's aware UTC start time."""
+    now = datetime.now(UTC)
+    TurnUsageHistoryFactory.create(db_session, test_user.id, consumed_at=now - timedelta(days=2))
+    TurnUsageHistoryFactory.create(db_session, test_user.id, consumed_at=now - timedelta(days=10))
+
+    response = client.get("/api/user/subscription/turn-usage?days=5", headers=auth_headers)
+    assert response.status_code == 200
+    assert len(response.json()) == 1
+
+    history = client.get("/api/user/subscription/history?usage_days=5", headers=auth_headers).json()
+    assert len(history["turn_usage_history"]) == 1
+    assert history["summary"]["total_turns_used_period"] == 1
@@ -5,6 +5,8 @@ This module contains comprehensive unit tests for the SubscriptionService class,
 covering checkout URL creation, webhook processing, turn consumption, and payment handling.
 """
 
+import hashlib
+import hmac
 from datetime import UTC, datetime, timedelta
 from unittest.mock import AsyncMock, Mock, patch
 
@@ -88,6 +90,21 @@ class TestSubscriptionService:
             result = service.verify_webhook_signature(payload, invalid_signature)
             assert result is False
 
+    @patch('services.subscription_service.settings')
+    def test_verify_webhook_signature_real_digest(self, mock_settings):
+        """Test webhook signature verification against a real HMAC digest."""
+        mock_settings.LEMON_SQUEEZY_WEBHOOK_SECRET = "test_secret"
+
+        service = SubscriptionService()
+        payload = b'{"meta":{"event_name":"order_created"}}'
+        signature = hmac.new(b"test_secret", payload, hashlib.sha256).hexdigest()
+
+        assert service.verify_webhook_signature(payload, signature) is True
+        assert service.verify_webhook_signature(payload, signature.upper()) is True
+        assert service.verify_webhook_signature(payload + b" ", signature) is False
+        assert service.verify_webhook_signature(payload, "not-hex") is False
+        assert service.verify_webhook_signature(payload, signature[:-2]) is False
+
     @patch('services.subscription_service.settings')
     def test_verify_webhook_signature_no_secret(self, mock_settings):
         """Test webhook signature verification when no secret is configured."""
@@ -818,3 +835,14 @@ class TestSubscriptionService:
 
         # Verify usage was added to session
         assert usage in db_session
+
+
+def test_get_subscription_service_returns_one_shared_instance():
+    """Test the dependency hands every caller the same service instead of building one per request."""
+    from routers import subscription as subscription_router
+    from services.subscription_service import get_subscription_service
+
+    service = get_subscription_service()
+    assert isinstance(service, SubscriptionService)
+    assert get_subscription_service() is service
+    assert subscription_router.subscription_service is service
@@ -0,0 +1,308 @@
+import asyncio
+import io
+import json
+from unittest.mock import patch
+
+import httpx
+import pytest
+from fastapi import UploadFile
+from starlette.datastructures import Headers
+
+from config import settings
+from routers import support
+
+
+class FakeSlack:
+    """Answer the Slack file upload API and webhook from an in-memory transport."""
+
+    def __init__(self):
+        self.requests = []
+        self.uploads = {}
+        self.in_flight = 0
+        self.max_in_flight = 0
+        # Responses to send instead of the real answer, keyed by the end of the URL path
+        self.failures = {}
+
+    async def __call__(self, request: httpx.Request) -> httpx.Response:
+        self.requests.append(request)
+        path = request.url.path
+        for suffix, responses in self.failures.items():
+            if path.endswith(suffix) and responses:
+                failure = responses.pop(0)
+                if isinstance(failure, Exception):
+                    raise failure
+                return failure
+        if path.endswith("files.getUploadURLExternal"):
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+            await asyncio.sleep(0.01)
+            self.in_flight -= 1
+            name = request.url.params["filename"]
+            return httpx.Response(200, json={"ok": True, "upload_url": f"https://files.slack.test/{name}", "file_id": name})
+        if request.url.host == "files.slack.test":
+            self.uploads[request.url.path.lstrip("/")] = request.content
+            return httpx.Response(200, text="OK")
+        if path.endswith("files.completeUploadExternal"):
+            uploaded = json.loads(request.content)["files"][0]
+            return httpx.Response(200, json={"ok": True, "files": [{"id": uploaded["id"], "name": uploaded["id"]}]})
+        return httpx.Response(200, text="ok")
+
+
+@pytest.fixture
+def fake_slack():
+    fake = FakeSlack()
+    client = httpx.AsyncClient(transport=httpx.MockTransport(fake))
+    with (
+        patch.object(support, "_slack_client", client),
+        patch.object(support, "SLACK_BOT_TOKEN", "xoxb-test"),
+        patch.object(settings, "SLACK_WEBHOOK_URL", "https://hooks.slack.test/services/T/B/X"),
+    ):
+        yield fake
+
+
+def test_support_ticket_uploads_files_and_notifies_slack(client, auth_headers, fake_slack):
+    """Test a ticket uploads each attachment and posts the ticket through the shared Slack client."""
+    files = [
+        ("files", ("one.png", b"\x89PNG one", "image/png")),
+        ("files", ("two.txt", b"two", "text/plain")),
+    ]
+    response = client.post(
+        "/api/support/",
+        data={"title": "Broken deck", "description": "The deck will not load"},
+        files=files,
+        headers=auth_headers,
+    )
+
+    assert response.status_code == 200
+    # Slack delivery runs after the response, which no longer reports its outcome
+    assert response.json()["slack_message_id"] is None
+    assert len(response.json()["ticket_id"]) == 32 and "-" not in response.json()["ticket_id"]
+    # Three upload API calls per file, then the ticket notification
+    assert len(fake_slack.requests) == 7
+    assert fake_slack.requests[-1].url.host == "hooks.slack.test"
+    assert fake_slack.requests[-1].headers["Content-Type"] == "application/json; charset=utf-8"
+    assert json.loads(fake_slack.requests[-1].content)["text"].endswith(response.json()["ticket_id"])
+    assert support.get_slack_client() is support._slack_client
+
+
+def test_support_ticket_rejects_disallowed_file_types(client, auth_headers, fake_slack):
+    """Test an attachment with an unsupported extension fails validation before any Slack call."""
+    response = client.post(
+        "/api/support/",
+        data={"title": "Broken deck", "description": "The deck will not load"},
+        files=[("files", ("payload.exe", b"MZ", "application/octet-stream"))],
+        headers=auth_headers,
+    )
+
+    assert response.status_code == 400
+    assert "Invalid file type '.exe'" in response.json()["detail"]
+    assert response.json()["detail"].endswith("Allowed types: " + ", ".join(sorted(support.ALLOWED_EXTENSIONS)))
+    assert fake_slack.requests == []
+
+
+def test_support_ticket_uploads_attachments_concurrently(client, auth_headers, fake_slack):
+    """Test attachments are uploaded side by side rather than one after another."""
+    files = [("files", (f"shot{i}.png", b"\x89PNG", "image/png")) for i in range(3)]
+    response = client.post(
+        "/api/support/",
+        data={"title": "Broken deck", "description": "The deck will not load"},
+        files=files,
+        headers=auth_headers,
+    )
+
+    assert response.status_code == 200
+    assert fake_slack.max_in_flight == 3
+
+
+def test_support_ticket_streams_the_raw_file_body(client, auth_headers, fake_slack):
+    """Test an attachment is sent to the upload URL as its raw bytes, read in chunks."""
+    body = bytes(range(256)) * 40
+    with patch.object(support, "UPLOAD_CHUNK_SIZE", 1000):
+        response = client.post(
+            "/api/support/",
+            data={"title": "Broken deck", "description": "The deck will not load"},
+            files=[("files", ("log.txt", body, "text/plain"))],
+            headers=auth_headers,
+        )
+
+    assert response.status_code == 200
+    assert fake_slack.uploads == {"log.txt": body}
+    get_url = fake_slack.requests[0]
+    assert get_url.url.params["length"] == str(len(body))
+
+
+def test_upload_measures_files_without_a_known_size(fake_slack):
+    """Test an upload whose size the client did not send is measured off the event loop and rewound."""
+    upload = UploadFile(io.BytesIO(b"no size header"), filename="note.txt", headers=Headers({"content-type": "text/plain"}))
+    assert upload.size is None
+
+    with patch.object(support, "run_in_threadpool", wraps=support.run_in_threadpool) as threadpool:
+        result = asyncio.run(support.upload_file_to_slack(upload, "ticket-1", "C123"))
+
+    assert result["id"] == "note.txt"
+    threadpool.assert_called_once()
+    assert fake_slack.requests[0].url.params["length"] == "14"
+    assert fake_slack.uploads == {"note.txt": b"no size header"}
+    assert upload.file.tell() == 0
+
+
+def test_support_ticket_rejects_oversized_attachments_with_413(client, auth_headers, fake_slack):
+    """Test an attachment over the size limit is rejected before anything is sent to Slack."""
+    with patch.object(support, "MAX_FILE_SIZE", 10):
+        response = client.post(
+            "/api/support/",
+            data={"title": "Broken deck", "description": "The deck will not load"},
+            files=[("files", ("big.txt", b"x" * 11, "text/plain"))],
+            headers=auth_headers,
+        )
+
+    assert response.status_code == 413
+    assert "too large" in response.json()["detail"]
+    assert fake_slack.requests == []
+
+
+def test_support_ticket_rejects_oversized_requests_before_reading_the_body(client, auth_headers, fake_slack):
+    """Test a request whose declared length is over the limit is refused without parsing the form."""
+    with (
+        patch.object(support, "MAX_REQUEST_SIZE", 100),
+        patch.object(support, "validate_file", side_effect=AssertionError("form should not be parsed")),
+    ):
+        response = client.post(
+            "/api/support/",
+            data={"title": "Broken deck", "description": "The deck will not load"},
+            files=[("files", ("big.txt", b"x" * 200, "text/plain"))],
+            headers=auth_headers,
+        )
+
+    assert response.status_code == 413
+    assert fake_slack.requests == []
+
+
+def test_slack_calls_are_retried_on_rate_limits_and_transport_errors(client, auth_headers, fake_slack):
+    """Test 429s, 5xx responses and connection errors are retried instead of dropping the upload."""
+    fake_slack.failures = {
+        "files.getUploadURLExternal": [httpx.Response(429, headers={"Retry-After": "0"})],
+        "note.txt": [httpx.ConnectError("connection reset"), httpx.Response(503)],
+        "services/T/B/X": [httpx.ConnectError("connection refused")],
+    }
+    with patch.object(support, "compute_backoff", return_value=0) as backoff:
+        response = client.post(
+            "/api/support/",
+            data={"title": "Broken deck", "description": "The deck will not load"},
+            files=[("files", ("note.txt", b"streamed twice", "text/plain"))],
+            headers=auth_headers,
+        )
+
+    assert response.status_code == 200
+    assert fake_slack.requests[-1].url.host == "hooks.slack.test"
+    assert fake_slack.uploads == {"note.txt": b"streamed twice"}
+    # One Retry-After wait, three backoff waits
+    assert backoff.call_count == 3
+    assert len(fake_slack.requests) == 8
+
+
+def test_non_idempotent_slack_posts_are_not_resent(client, auth_headers, fake_slack):
+    """Test the upload completion and ticket post are not retried once Slack may have acted on them."""
+    fake_slack.failures = {
+        "files.completeUploadExternal": [httpx.Response(502)],
+        "services/T/B/X": [httpx.ReadTimeout("timed out")],
+    }
+    with patch.object(support, "compute_backoff", return_value=0) as backoff:
+        response = client.post(
+            "/api/support/",
+            data={"title": "Broken deck", "description": "The deck will not load"},
+            files=[("files", ("note.txt", b"sent once", "text/plain"))],
+            headers=auth_headers,
+        )
+
+    assert response.status_code == 200
+    backoff.assert_not_called()
+    # Upload URL, upload body, completion and ticket post, each sent once
+    assert len(fake_slack.requests) == 4
+
+
+def test_slack_retries_give_up_after_the_last_attempt(fake_slack):
+    """Test a request that keeps failing returns its last response once retries run out."""
+    fake_slack.failures = {"files.getUploadURLExternal": [httpx.Response(500) for _ in range(10)]}
+
+    async def get_upload_url():
+        return await support.get_slack_client().get("https://slack.com/api/files.getUploadURLExternal")
+
+    with patch.object(support, "compute_backoff", return_value=0):
+        response = asyncio.run(support._with_retry(get_upload_url))
+
+    assert response.status_code == 500
+    assert len(fake_slack.requests) == support._MAX_SLACK_RETRIES + 1
+
+
+def test_ticket_message_lists_attachments_with_the_best_link(test_user):
+    """Test the ticket payload links each attachment by its preferred URL and falls back to the file ID."""
+    uploaded = [
+        {"name": "shot.png", "size": 10, "mimetype": "image/png", "url_private": "https://slack.test/a", "permalink": "x"},
+        {"id": "F123", "title": "log.txt", "filetype": "text"},
+    ]
+
+    message = support._ticket_message("abc123", test_user, "Broken deck", "It will not load", uploaded)
+
+    assert message["text"] == "🎴 New Support Ticket #abc123"
+    assert message["blocks"][2]["text"]["text"] == "*Subject:* Broken deck"
+    assert message["blocks"][-1]["text"]["text"].splitlines()[-2:] == [
+        "• <https://slack.test/a|shot.png> (image/png, 10 bytes)",
+        "• log.txt (ID: F123, text, 0 bytes)",
+    ]
+    assert len(support._ticket_message("abc123", test_user, "Broken deck", "It will not load", None)["blocks"]) == 4
+
+
+def test_support_ticket_failure_logs_the_exception(client, auth_headers, fake_slack):
+    """Test an unexpected error is logged with its exception attached and answered with a 500."""
+    with (
+        patch.object(support, "validate_file", side_effect=RuntimeError("validation exploded")),
+        patch.object(support.logger, "logger") as log,
+    ):
+        response = client.post(
+            "/api/support/",
+            data={"title": "Broken deck", "description": "The deck will not load"},
+            files=[("files", ("note.txt", b"hello", "text/plain"))],
+            headers=auth_headers,
+        )
+
+    assert response.status_code == 500
+    log.exception.assert_called_once()
+    assert log.exception.call_args.kwargs["extra"]["error"] == "validation exploded"
+
+
+def test_support_ticket_is_answered_before_slack_delivery(client, auth_headers, fake_slack):
+    """Test a Slack failure after the response is logged and does not fail the ticket."""
+    with (
+        patch.object(support, "send_to_slack", side_effect=RuntimeError("slack exploded")),
+        patch.object(support.logger, "logger") as log,
+    ):
+        response = client.post(
+            "/api/support/",
+            data={"title": "Broken deck", "description": "The deck will not load"},
+            files=[("files", ("note.txt", b"hello", "text/plain"))],
+            headers=auth_headers,
+        )
+
+    assert response.status_code == 200
+    assert fake_slack.uploads == {"note.txt": b"hello"}
+    log.exception.assert_called_once()
+    assert log.exception.call_args.kwargs["extra"]["error"] == "slack exploded"
+
+
+def test_support_ticket_skips_uploads_when_slack_uploads_are_disabled(client, auth_headers, fake_slack):
+    """Test attachments are still validated but no upload is attempted without a bot token."""
+    with (
+        patch.object(support, "SLACK_BOT_TOKEN", None),
+        patch.object(support, "_upload_with_slot", side_effect=AssertionError("uploads are disabled")),
+    ):
+        response = client.post(
+            "/api/support/",
+            data={"title": "Broken deck", "description": "The deck will not load"},
+            files=[("files", ("note.txt", b"hello", "text/plain"))],
+            headers=auth_headers,
+        )
+
+    assert response.status_code == 200
+    # Only the ticket notification reaches Slack
+    assert [request.url.host for request in fake_slack.requests] == ["hooks.slack.test"]
@@ -3,6 +3,12 @@ from unittest.mock import patch
 import pytest
 from fastapi import status
 
+import tarot_reader
+from config import settings
+from routers import tarot
+from tarot_reader import TarotReader
+from utils.metrics import base_labels, tarot_readings_in_progress
+
 # Remove old tests for endpoints that don't exist
 # The current tarot API only has /tarot/reading endpoint
 
@@ -595,3 +601,61 @@ def test_card_of_the_day_is_stable_within_day(client, test_cards):
     second = client.get("/tarot/card-of-the-day").json()
     assert first["name"] == second["name"]
     assert first["deck_id"] == second["deck_id"]
+
+
+def test_tarot_reading_consumes_turn_off_the_event_loop(client, auth_headers, test_cards, mock_tarot_reader):
+    """Test the turn is consumed in the threadpool rather than on the event loop"""
+    with patch.object(tarot, "run_in_threadpool", wraps=tarot.run_in_threadpool) as threadpool:
+        response = client.post("/tarot/reading", json={"concern": "What does my future hold?"}, headers=auth_headers)
+
+    assert response.status_code == status.HTTP_200_OK
+    func, *args = threadpool.call_args.args
+    assert func.__name__ == "consume_user_turn"
+    assert args[-1] == "reading"
+
+
+def test_tarot_readers_share_the_deck_cards(db_session, test_cards, count_statements):
+    """Test a second reader for the same deck reuses the loaded cards and model without querying"""
+    first = TarotReader(db=db_session, deck_id=1)
+    assert {card["name"] for card in first.cards} >= {"The Fool", "The Magician"}
+
+    with count_statements() as statements:
+        second = TarotReader(db=db_session, deck_id=1)
+
+    assert statements == []
+    assert second.cards is first.cards
+    assert second.llm is first.llm
+    # Drawing copies the cards, so one reading never changes another's deck
+    second.shuffle_and_draw(1)
+    assert all("orientation" not in card for card in first.cards)
+
+    tarot_reader.invalidate_deck_cards()
+    assert tarot_reader._deck_cards == {}
+
+
+def test_shuffle_and_draw_returns_distinct_cards(db_session, test_cards):
+    """Test a draw never repeats a card and stops at the size of the deck"""
+    reader = TarotReader(db=db_session, deck_id=1)
+    deck_size = len(reader.cards)
+
+    drawn = reader.shuffle_and_draw(deck_size + 5)
+
+    assert len(drawn) == deck_size
+    assert len({card["name"] for card in drawn}) == deck_size
+    assert {card["orientation"] for card in drawn} <= {"Upright", "Reversed"}
+    assert [card["position_index"] for card in drawn] == list(range(deck_size))
+
+
+def test_tarot_reading_in_progress_gauge_is_released(client, auth_headers, test_cards, mock_tarot_reader):
+    """Test the in-progress gauge is back to its starting value after both successful and failed readings"""
+    gauge = tarot_readings_in_progress.labels(**base_labels(settings.FASTAPI_ENV))
+    before = gauge._value.get()
+
+    ok = client.post("/tarot/reading", json={"concern": "What does my future hold?"}, headers=auth_headers)
+    failed = client.post(
+        "/tarot/reading", json={"concern": "What does my future hold?", "spread_id": 999999}, headers=auth_headers
+    )
+
+    assert ok.status_code == status.HTTP_200_OK
+    assert failed.status_code == 422
+    assert gauge._value.get() == before
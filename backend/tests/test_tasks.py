@@ -0,0 +1,176 @@
+from unittest.mock import MagicMock, patch
+
+import pytest
+from celery.canvas import group
+from fastapi.testclient import TestClient
+from starlette.websockets import WebSocketDisconnect
+
+from models import User
+from routers import tasks
+from routers.auth import create_access_token
+from utils import celery_utils
+from utils.celery_utils import TaskManager
+
+
+@pytest.fixture(autouse=True)
+def status_socket_sessions(session_factory):
+    """Authenticate status sockets against the test database."""
+    with patch.object(tasks, "SessionLocal", session_factory):
+        yield
+
+
+@pytest.fixture
+def admin_token(db_session):
+    admin = User(username="taskadmin", email="taskadmin@example.com", is_active=True, is_admin=True)
+    admin.password = "adminpassword"
+    db_session.add(admin)
+    db_session.commit()
+    return create_access_token(data={"sub": admin.username})
+
+
+def test_status_socket_pushes_each_change_until_the_task_finishes(client: TestClient, admin_token, fake_redis):
+    """Test the socket sends the current status, each new status, and closes on a terminal state."""
+    statuses = [
+        {"task_id": "abc", "status": "PENDING", "message": "Task is pending or does not exist"},
+        {"task_id": "abc", "status": "PENDING", "message": "Task is pending or does not exist"},
+        {"task_id": "abc", "status": "SUCCESS", "result": {"sent": 3}},
+    ]
+    with (
+        patch.object(tasks, "_get_task_status_redis", return_value=fake_redis),
+        patch.object(tasks.task_manager, "get_group_task_ids", return_value=[]),
+        patch.object(tasks.task_manager, "get_task_status", side_effect=statuses) as get_status,
+        client.websocket_connect(f"/api/tasks/ws/status/abc?token={admin_token}") as websocket,
+    ):
+        first = websocket.receive_json()
+        second = websocket.receive_json()
+        with pytest.raises(WebSocketDisconnect):
+            websocket.receive_json()
+
+    assert first["status"] == "PENDING"
+    # The repeated PENDING is not sent again
+    assert second == {"task_id": "abc", "status": "SUCCESS", "message": None, "result": {"sent": 3}, "error": None}
+    assert get_status.call_count == 3
+    pubsub = fake_redis.pubsubs[0]
+    assert pubsub.channels == ["celery-task-meta-abc"]
+    assert pubsub.closed
+
+
+def test_status_socket_follows_the_members_of_a_group(client: TestClient, admin_token, fake_redis):
+    """Test a group id is pushed on its member tasks' channels, since the group itself never publishes."""
+    statuses = [
+        {"task_id": "grp", "status": "PROGRESS", "current": 0, "total": 2, "message": "0 of 2 tasks completed"},
+        {"task_id": "grp", "status": "PROGRESS", "current": 1, "total": 2, "message": "1 of 2 tasks completed"},
+        {"task_id": "grp", "status": "SUCCESS", "result": {"results": [{}, {}]}},
+    ]
+    with (
+        patch.object(tasks, "_get_task_status_redis", return_value=fake_redis),
+        patch.object(tasks.task_manager, "get_group_task_ids", return_value=["a1", "a2"]) as get_members,
+        patch.object(tasks.task_manager, "get_task_status", side_effect=statuses),
+        client.websocket_connect(f"/api/tasks/ws/status/grp?token={admin_token}") as websocket,
+    ):
+        assert [websocket.receive_json()["status"] for _ in statuses] == ["PROGRESS", "PROGRESS", "SUCCESS"]
+
+    get_members.assert_called_once_with("grp")
+    assert fake_redis.pubsubs[0].channels == ["celery-task-meta-grp", "celery-task-meta-a1", "celery-task-meta-a2"]
+
+
+def test_status_socket_rereads_without_a_redis_result_backend(client: TestClient, admin_token):
+    """Test the socket falls back to re-reading the status when pub/sub is unavailable."""
+    statuses = [
+        {"task_id": "abc", "status": "STARTED"},
+        {"task_id": "abc", "status": "FAILURE", "error": "boom"},
+    ]
+    with (
+        patch.object(tasks, "_get_task_status_redis", return_value=None),
+        patch.object(tasks, "TASK_STATUS_RECHECK_SECONDS", 0),
+        patch.object(tasks.task_manager, "get_task_status", side_effect=statuses),
+        client.websocket_connect(f"/api/tasks/ws/status/abc?token={admin_token}") as websocket,
+    ):
+        assert websocket.receive_json()["status"] == "STARTED"
+        assert websocket.receive_json()["error"] == "boom"
+
+
+def test_status_socket_requires_an_admin(client: TestClient, auth_headers):
+    """Test a non-admin or anonymous caller is refused with a policy violation."""
+    user_token = auth_headers["Authorization"].removeprefix("Bearer ")
+    for url in ("/api/tasks/ws/status/abc", f"/api/tasks/ws/status/abc?token={user_token}"):
+        with pytest.raises(WebSocketDisconnect) as refused, client.websocket_connect(url):
+            pass
+        assert refused.value.code == 1008
+
+
+def test_bulk_email_is_split_into_a_group_of_chunks():
+    """Test a long recipient list is sent as a saved group of email-queue tasks of bounded size."""
+    emails = [f"user{i}@example.com" for i in range(celery_utils.BULK_EMAIL_CHUNK_SIZE * 2 + 20)]
+    with patch.object(celery_utils, "dispatch_task_with_correlation") as dispatch:
+        dispatch.return_value.id = "group-1"
+        task_id = celery_utils.EmailTaskManager.send_bulk_email_async(emails, "News", "<p>Hi</p>", "Hi")
+
+    assert task_id == "group-1"
+    job = dispatch.call_args.args[0]
+    assert isinstance(job, group)
+    assert [len(signature.args[0]) for signature in job.tasks] == [50, 50, 20]
+    assert [address for signature in job.tasks for address in signature.args[0]] == emails
+    assert {signature.task for signature in job.tasks} == {"send_bulk_notification_email"}
+    dispatch.return_value.save.assert_called_once()
+
+
+def test_short_bulk_email_is_a_single_task():
+    """Test a list that fits in one chunk is still dispatched as one task."""
+    with patch.object(celery_utils, "dispatch_task_with_correlation") as dispatch:
+        dispatch.return_value.id = "task-1"
+        assert celery_utils.EmailTaskManager.send_bulk_email_async(["a@example.com"], "News", "<p>Hi</p>", "Hi") == "task-1"
+
+    signature = dispatch.call_args.args[0]
+    assert signature.args[0] == ["a@example.com"]
+    dispatch.return_value.save.assert_not_called()
+
+
+def test_group_task_ids_lists_the_members_of_a_saved_group():
+    """Test a saved group resolves to its member task ids and any other id to none."""
+    group_result = MagicMock(results=[MagicMock(id="a1"), MagicMock(id="a2")])
+    with patch.object(celery_utils.GroupResult, "restore", side_effect=[group_result, None]):
+        assert TaskManager.get_group_task_ids("grp") == ["a1", "a2"]
+        assert TaskManager.get_group_task_ids("abc") == []
+
+
+def test_group_status_reports_progress_and_outcome():
+    """Test a saved group is reported with the same fields as a single task."""
+    done, running = MagicMock(), MagicMock()
+    done.successful.return_value = True
+    done.result = {"status": "completed"}
+    group_result = MagicMock(results=[done, running])
+    group_result.ready.return_value = False
+    group_result.completed_count.return_value = 1
+
+    progress = TaskManager._get_group_status("group-1", group_result)
+    assert progress["status"] == "PROGRESS"
+    assert progress["message"] == "1 of 2 tasks completed"
+
+    group_result.ready.return_value = True
+    running.successful.return_value = True
+    running.result = {"status": "completed"}
+    finished = TaskManager._get_group_status("group-1", group_result)
+    assert finished["status"] == "SUCCESS"
+    assert finished["result"] == {"results": [{"status": "completed"}, {"status": "completed"}]}
+
+
+def test_every_task_is_routed_to_its_workload_queue():
+    """Test the routes match the registered task names, so no task falls through to the default queue."""
+    import tasks.dead_letter  # noqa: F401
+    import tasks.email_tasks  # noqa: F401
+    import tasks.notification_tasks  # noqa: F401
+    import tasks.payment_tasks  # noqa: F401
+    import tasks.web_push_tasks  # noqa: F401
+    from celery_app import celery_app
+
+    def queue(name):
+        return celery_app.amqp.router.route({}, name)["queue"].name
+
+    registered = {name for name in celery_app.tasks if not name.startswith("celery.")}
+    assert registered <= set(celery_app.conf.task_routes)
+    assert queue("send_welcome_email") == "email"
+    assert queue("send_bulk_notification_email") == "email"
+    assert queue("process_daily_reminders") == "notifications"
+    assert queue("reset_monthly_free_turns") == "maintenance"
+    assert queue("log_failed_task") == "dead_letter"
@@ -4,13 +4,17 @@ Utility functions for Celery task management and integration with FastAPI.
 
 from typing import Any
 
-from celery.result import AsyncResult
+from celery import Signature, group
+from celery.result import AsyncResult, GroupResult
 from fastapi import HTTPException
 
 from celery_app import celery_app
 from utils.correlation import dispatch_task_with_correlation
 from utils.logging import logger
 
+# Recipients per bulk email task; larger lists are split into a group of tasks
+BULK_EMAIL_CHUNK_SIZE = 50
+
 
 class TaskManager:
     """Manager class for handling Celery tasks."""
@@ -33,7 +37,10 @@ class TaskManager:
             result = AsyncResult(task_id, app=celery_app)
 
             if result.state == "PENDING":
-                # Task is waiting or doesn't exist
+                # Task is waiting or doesn't exist, or the ID belongs to a group of tasks
+                group_result = GroupResult.restore(task_id, app=celery_app)
+                if group_result is not None:
+                    return TaskManager._get_group_status(task_id, group_result)
                 return {"task_id": task_id, "status": "PENDING", "message": "Task is pending or does not exist"}
             elif result.state == "PROGRESS":
                 return {
@@ -58,6 +65,38 @@ class TaskManager:
             logger.error(f"Error getting task status for {task_id}: {str(e)}")
             raise HTTPException(status_code=500, detail=f"Error retrieving task status: {str(e)}")
 
+    @staticmethod
+    def get_group_task_ids(task_id: str) -> list[str]:
+        """Return the IDs of the tasks in the saved group ``task_id``, or an empty list if it is not a group."""
+        group_result = GroupResult.restore(task_id, app=celery_app)
+        return [result.id for result in group_result.results] if group_result is not None else []
+
+    @staticmethod
+    def _get_group_status(task_id: str, group_result: GroupResult) -> dict[str, Any]:
+        """Summarize a saved group of tasks in the same shape as a single task's status."""
+        total = len(group_result.results)
+        if not group_result.ready():
+            completed = group_result.completed_count()
+            return {
+                "task_id": task_id,
+                "status": "PROGRESS",
+                "current": completed,
+                "total": total,
+                "message": f"{completed} of {total} tasks completed",
+            }
+        failed = [result for result in group_result.results if not result.successful()]
+        if failed:
+            return {
+                "task_id": task_id,
+                "status": "FAILURE",
+                "error": f"{len(failed)} of {total} tasks failed: {failed[0].info}",
+            }
+        return {
+            "task_id": task_id,
+            "status": "SUCCESS",
+            "result": {"results": [result.result for result in group_result.results]},
+        }
+
     @staticmethod
     def cancel_task(task_id: str) -> dict[str, Any]:
         """
@@ -186,25 +225,55 @@ class EmailTaskManager:
         return result.id
 
     @staticmethod
-    def send_bulk_email_async(emails: list[str], subject: str, html_body: str, text_body: str) -> str:
+    def send_bulk_email_signature(emails: list[str], subject: str, html_body: str, text_body: str) -> Signature:
         """
-        Enqueue bulk email task.
+        Build the signature of one bulk email task.
 
         Args:
-            emails: List of email addresses
+            emails: Email addresses for this task
             subject: Email subject
             html_body: HTML email body
             text_body: Plain text email body
 
         Returns:
-            str: Task ID
+            Signature: The task signature
         """
         from tasks.email_tasks import send_bulk_notification_email_task
 
-        result = dispatch_task_with_correlation(
-            send_bulk_notification_email_task, args=[emails, subject, html_body, text_body]
+        return send_bulk_notification_email_task.s(emails, subject, html_body, text_body)
+
+    @staticmethod
+    def send_bulk_email_async(emails: list[str], subject: str, html_body: str, text_body: str) -> str:
+        """
+        Enqueue bulk email tasks of at most `BULK_EMAIL_CHUNK_SIZE` recipients each.
+
+        A longer list is sent as a Celery group, so the chunks are spread across
+        email workers and no broker message carries the whole list. The group is
+        saved in the result backend, so its ID works with `TaskManager.get_task_status`.
+
+        Args:
+            emails: List of email addresses
+            subject: Email subject
+            html_body: HTML email body
+            text_body: Plain text email body
+
+        Returns:
+            str: Task ID, or the group ID when the list was split
+        """
+        chunks = [emails[i : i + BULK_EMAIL_CHUNK_SIZE] for i in range(0, len(emails), BULK_EMAIL_CHUNK_SIZE)]
+        if len(chunks) <= 1:
+            result = dispatch_task_with_correlation(
+                EmailTaskManager.send_bulk_email_signature(emails, subject, html_body, text_body)
+            )
+            logger.info(f"Bulk email task queued: {result.id}")
+            return result.id
+
+        job = group(
+            EmailTaskManager.send_bulk_email_signature(chunk, subject, html_body, text_body) for chunk in chunks
         )
-        logger.info(f"Bulk email task queued: {result.id}")
+        result = dispatch_task_with_correlation(job)
+        result.save()
+        logger.info(f"Bulk email group queued: {result.id} ({len(chunks)} tasks)")
         return result.id
 
 
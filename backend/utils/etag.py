@@ -0,0 +1,14 @@
+"""Conditional GET helpers.
+
+Endpoints that send an ``ETag`` use `etag_matches` to decide whether the
+client's cached copy is still current and a ``304 Not Modified`` will do.
+"""
+
+
+def etag_matches(if_none_match: str | None, etag: str) -> bool:
+    """Return whether an ``If-None-Match`` header value matches ``etag``."""
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    return etag in (candidate.strip() for candidate in if_none_match.split(","))
@@ -6,26 +6,7 @@ is skipped, preventing duplicate side-effects from worker crashes or
 re-deliveries triggered by ``acks_late``.
 """
 
-import redis
-
-from config import settings
-
-_idempotency_redis: redis.Redis | None = None
-
-
-def _get_redis() -> redis.Redis:
-    """Return the shared Redis client for idempotency checks.
-
-    Connects lazily so the module doesn't fail to import when Redis is
-    unavailable at startup (e.g. during testing).
-    """
-    global _idempotency_redis
-    if _idempotency_redis is None:
-        try:
-            _idempotency_redis = redis.from_url(settings.REDIS_URL, socket_connect_timeout=2)
-        except Exception:
-            return None
-    return _idempotency_redis
+from utils.redis_client import get_redis, note_redis_failure
 
 
 def check_and_set_idempotency_key(key: str, ttl: int = 86400) -> bool:
@@ -42,10 +23,22 @@ def check_and_set_idempotency_key(key: str, ttl: int = 86400) -> bool:
         Also returns ``False`` when Redis is unreachable — tasks proceed
         without idempotency protection in that case.
     """
-    r = _get_redis()
+    r = get_redis()
     if r is None:
         return True  # No Redis → no idempotency, let tasks run
     try:
         return bool(r.set(key, "1", nx=True, ex=ttl))
-    except Exception:
+    except Exception as e:
+        note_redis_failure(e)
         return True  # Transient Redis error → let the task run
+
+
+def release_idempotency_key(key: str) -> None:
+    """Delete an idempotency key so a failed attempt can be retried."""
+    r = get_redis()
+    if r is None:
+        return
+    try:
+        r.delete(key)
+    except Exception as e:  # The key still expires on its own TTL
+        note_redis_failure(e)
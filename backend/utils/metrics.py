@@ -48,6 +48,12 @@ tarot_reading_duration_seconds = Histogram(
     COMMON_LABELS + ["reading_type"],
     buckets=(0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60),
 )
+tarot_readings_in_progress = Gauge(
+    "arcana_tarot_readings_in_progress",
+    "Tarot readings currently being generated.",
+    COMMON_LABELS,
+    multiprocess_mode="livesum",
+)
 
 auth_attempts_total = Counter(
     "arcana_auth_attempts_total",
@@ -318,6 +324,15 @@ def record_tarot_reading(
     ).observe(duration)
 
 
+def track_tarot_reading_in_progress(env: str):
+    """Return a context manager that counts a tarot reading as in progress until it exits.
+
+    The gauge is incremented on entry and decremented on exit, including when the
+    reading raises, so an early failure can never leave it skewed.
+    """
+    return tarot_readings_in_progress.labels(**base_labels(env)).track_inprogress()
+
+
 def record_auth_attempt(env: str, action: str, status: str) -> None:
     """Record an authentication or account-management attempt."""
     auth_attempts_total.labels(
@@ -7,6 +7,7 @@ and monitoring capabilities.
 
 Middleware Components:
     - RequestLoggingMiddleware: Logs all HTTP requests with timing and status information
+    - get_request_now: Dependency returning the request's timezone-aware start time
 
 The middleware is designed to provide:
     - Comprehensive request/response logging
@@ -34,6 +35,7 @@ Version: 1.0.0
 """
 
 import time
+from datetime import UTC, datetime
 
 from fastapi import Request, Response
 from starlette.middleware.base import BaseHTTPMiddleware
@@ -94,6 +96,9 @@ class RequestLoggingMiddleware(BaseHTTPMiddleware):
         correlation_id = set_correlation_id(incoming_cid)
         request.state.correlation_id = correlation_id
 
+        # One aware UTC "now" for the whole request, shared through get_request_now
+        request.state.now = datetime.now(UTC)
+
         # Process request through the middleware/handler chain
         try:
             response = await call_next(request)
@@ -139,3 +144,13 @@ class RequestLoggingMiddleware(BaseHTTPMiddleware):
 
             # Re-raise the exception to maintain normal error handling flow
             raise
+
+
+def get_request_now(request: Request) -> datetime:
+    """Return the timezone-aware UTC time the request started.
+
+    Set once by `RequestLoggingMiddleware`; falls back to the current time when
+    the middleware is not installed.
+    """
+    now = getattr(request.state, "now", None)
+    return now if now is not None else datetime.now(UTC)
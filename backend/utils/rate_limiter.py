@@ -3,7 +3,7 @@ Rate limiting utilities for the ArcanaAI API.
 
 This module provides rate limiting functionality to protect the API from abuse
 and ensure fair usage across all users. It uses SlowAPI (a FastAPI-compatible
-wrapper for python-limits) to implement token bucket rate limiting.
+wrapper for python-limits) to implement fixed-window rate limiting.
 
 Key Features:
     - IP-based rate limiting using remote address
@@ -18,6 +18,14 @@ Rate Limit Categories:
     - tarot: Tarot reading endpoints (10/minute) - resource intensive
     - chat: Chat endpoints (20/minute) - moderate usage
 
+Storage:
+    Counters live in process memory (``memory://``) using the fixed-window
+    strategy, which costs one counter increment per hit. The limits library
+    guards each key with its own lock, so requests for different clients
+    never wait on each other, and within an async worker the lock is
+    uncontended. Each worker process keeps its own counters; point
+    ``storage_uri`` at Redis only if limits must be shared across processes.
+
 Dependencies:
     - SlowAPI for rate limiting implementation
     - FastAPI for request/response handling
@@ -53,7 +61,7 @@ from utils.error_handlers import maybe_send_vip_error_alert
 
 # Create a limiter instance with IP-based rate limiting
 # Uses the remote address of the client as the key for rate limiting
-limiter = Limiter(key_func=get_remote_address)
+limiter = Limiter(key_func=get_remote_address, storage_uri="memory://", strategy="fixed-window")
 
 # Rate limit configuration dictionary
 # Define different rate limits for different types of endpoints
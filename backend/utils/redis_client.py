@@ -0,0 +1,47 @@
+"""Shared Redis client for optional caches and guards.
+
+Caches, idempotency keys and the dead-letter list all treat Redis as optional.
+They share one lazily created client (one connection pool per process) from
+`get_redis`. Creating the client does not connect, so an unreachable server
+only shows up as a ``ConnectionError`` on the first command; callers report
+it with `note_redis_failure`, which marks Redis down for
+``REDIS_RETRY_AFTER`` seconds. While it is down `get_redis` returns ``None``
+and callers skip Redis instead of each waiting out the connect timeout.
+
+The client is synchronous: call it from a thread (``run_in_threadpool``)
+rather than directly inside ``async def`` endpoints.
+"""
+
+from __future__ import annotations
+
+import time
+
+import redis
+
+from config import settings
+
+REDIS_RETRY_AFTER = 30.0
+
+_redis: redis.Redis | None = None
+_down_until = 0.0
+
+
+def get_redis() -> redis.Redis | None:
+    """Return the shared Redis client, or ``None`` while Redis is marked down."""
+    global _redis
+    if time.monotonic() < _down_until:
+        return None
+    if _redis is None:
+        try:
+            _redis = redis.from_url(settings.REDIS_URL, socket_connect_timeout=2, socket_timeout=2)
+        except Exception as e:
+            note_redis_failure(e)
+            return None
+    return _redis
+
+
+def note_redis_failure(error: Exception) -> None:
+    """Mark Redis down for ``REDIS_RETRY_AFTER`` seconds if ``error`` means it is unreachable."""
+    global _down_until
+    if isinstance(error, (redis.ConnectionError, redis.TimeoutError, ValueError)):
+        _down_until = time.monotonic() + REDIS_RETRY_AFTER